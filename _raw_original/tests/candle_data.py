@@ -0,0 +1,31 @@
+"""
+테스트용 캔들 생성기
+===================
+
+STB가 발생하도록 변동성을 섞은 랜덤 워크 캔들 (10% 확률로 4배 변동)
+"""
+
+import random
+from typing import Optional
+
+
+def random_walk_candles(n: int = 3000, seed: int = 7, price: float = 21500.0,
+                        rng: Optional[random.Random] = None) -> list:
+    """
+    캔들 dict 리스트 ({"time", "open", "high", "low", "close"})
+
+    rng: 여러 종목이 하나의 난수열을 이어 쓰는 경우 전달 (seed 무시)
+    """
+    rng = rng or random.Random(seed)
+    candles = []
+
+    for i in range(n):
+        scale = 12.0 if rng.random() < 0.1 else 3.0
+        o = price
+        c = price + rng.gauss(0, scale)
+        h = max(o, c) + abs(rng.gauss(0, scale / 2))
+        l = min(o, c) - abs(rng.gauss(0, scale / 2))
+        candles.append({"time": f"t{i}", "open": o, "high": h, "low": l, "close": c})
+        price = c
+
+    return candles
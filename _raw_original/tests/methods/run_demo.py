@@ -1,11 +1,10 @@
-from validation.run_validation import run_backtest, compare
+from validation.run_validation import run_core_vs_g3
 from validation.generate_loss_trigger_candles import generate_loss_trigger_candles
 
 candles = generate_loss_trigger_candles()
 
-core = run_backtest(candles, use_g3=False)
-g3   = run_backtest(candles, use_g3=True)
+core, g3, diff = run_core_vs_g3(candles)
 
 print("CORE:", core)
 print("G3:", g3)
-print("DIFF:", compare(core, g3))
+print("DIFF:", diff)
@@ -1,51 +1,22 @@
 # validation/run_validation.py
 
-from core.v7_energy_engine import V7EnergyEngine, check_stb_entry
+from core.backtest import StreamingBacktest, make_engine
 import numpy as np
 
 
 def run_backtest(candles, use_g3: bool):
-    engine = V7EnergyEngine()
-
     # 🔒 G3 OFF = baseline
-    if not use_g3:
-        engine.LWS_BARS = 9999
-        engine.LWS_MFE_THRESHOLD = float("inf")
-
-    trade_id = 0
-    open_trades = {}
-    results = []
-
-    for i in range(len(candles)):
-        candle = candles[i]
-        history = candles[:i]
-
-        # STB 진입
-        direction = check_stb_entry(candle, history)
-        if direction:
-            tid = f"T{trade_id}"
-            engine.open_position(
-                trade_id=tid,
-                direction=direction,
-                entry_price=candle["close"],
-                entry_time=candle["time"],
-            )
-            open_trades[tid] = True
-            trade_id += 1
+    name = "G3" if use_g3 else "CORE"
+    backtest = StreamingBacktest({name: make_engine(use_g3)})
+    return summarize(backtest.run(candles)[name])
 
-        # 포지션 업데이트
-        for tid in list(open_trades.keys()):
-            exit_type, pnl = engine.update_position(
-                tid,
-                high=candle["high"],
-                low=candle["low"],
-                close=candle["close"],
-            )
-            if exit_type:
-                results.append(pnl)
-                del open_trades[tid]
 
-    return summarize(results)
+def run_core_vs_g3(candles):
+    # CORE / G3 단일 패스 비교
+    pnls = StreamingBacktest().run(candles)
+    core = summarize(pnls["CORE"])
+    g3 = summarize(pnls["G3"])
+    return core, g3, compare(core, g3)
 
 
 def summarize(pnls):
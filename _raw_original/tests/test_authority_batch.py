@@ -0,0 +1,108 @@
+"""
+Authority 일괄 평가 테스트
+=========================
+
+확인 항목:
+1. AuthorityEngine.evaluate_many == evaluate 반복 (판정 / 배율 / 통계)
+2. authority_rules.evaluate_many == check_layer0~3 순차 적용
+3. 미등록 이름은 UNKNOWN_CODE로 평가, 전역 레지스트리 크기 불변
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from opa import policy_v74
+from opa import authority_rules
+from opa.authority_engine import AuthorityEngine, AuthorityRequest, Authority
+from opa.signal_registry import SIGNAL_REGISTRY
+
+NAMES = sorted(policy_v74.BLACKLIST_SIGNALS) + ["STB숏", "SCALP_A", "숏-정체", "random"]
+
+
+def columns(n: int = 5000, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    return {
+        "names": [NAMES[i] for i in rng.integers(0, len(NAMES), n)],
+        "theta": rng.integers(-1, 12, n),
+        "consecutive_loss": rng.integers(0, 4, n),
+        "is_retry": rng.random(n) < 0.5,
+        "impulse_count": rng.integers(0, 6, n),
+        "recovery_time": rng.uniform(0, 8, n),
+        "slippage": rng.uniform(0, 4, n),
+        "spread": rng.uniform(0, 3, n),
+        "state_certified": rng.random(n) < 0.8,
+    }
+
+
+def expected_multiplier(allowed: bool, theta: int) -> float:
+    if not allowed:
+        return 0.0
+    return policy_v74.get_size_multiplier(policy_v74.get_size(theta))
+
+
+def test_engine_batch_matches_scalar():
+    cols = columns()
+    scalar, batch_engine = AuthorityEngine(), AuthorityEngine()
+
+    batch = batch_engine.evaluate_many(
+        SIGNAL_REGISTRY.lookup_many(cols["names"]), cols["theta"], cols["consecutive_loss"],
+        is_retry=cols["is_retry"], impulse_count=cols["impulse_count"],
+        recovery_time=cols["recovery_time"],
+    )
+
+    for i, name in enumerate(cols["names"]):
+        response = scalar.evaluate(AuthorityRequest(
+            signal_name=name,
+            theta=int(cols["theta"][i]),
+            is_retry=bool(cols["is_retry"][i]),
+            impulse_count=int(cols["impulse_count"][i]),
+            recovery_time=float(cols["recovery_time"][i]),
+            consecutive_loss=int(cols["consecutive_loss"][i]),
+        ))
+        allowed = response.authority == Authority.ALLOW
+        assert batch.decision[i] == allowed
+        assert batch.layer_failed[i] == response.layer_failed
+        assert batch.size_multiplier[i] == expected_multiplier(allowed, response.theta)
+
+    assert batch_engine.get_stats() == scalar.get_stats()
+    assert batch.deny_by_layer == scalar.stats["deny_by_layer"]
+
+
+def test_rules_batch_matches_layer_checks():
+    cols = columns(seed=11)
+    batch = authority_rules.evaluate_many(
+        SIGNAL_REGISTRY.lookup_many(cols["names"]), cols["theta"], cols["consecutive_loss"],
+        cols["slippage"], cols["spread"], state_certified=cols["state_certified"],
+    )
+
+    for i, name in enumerate(cols["names"]):
+        theta = int(cols["theta"][i])
+        checks = (
+            authority_rules.check_layer0_identity(name),
+            authority_rules.check_layer1_state_authority(bool(cols["state_certified"][i]), theta),
+            authority_rules.check_layer2_temporal_authority(int(cols["consecutive_loss"][i])),
+            authority_rules.check_layer3_execution(cols["slippage"][i], cols["spread"][i]),
+        )
+        layer = next((c.layer_failed for c in checks if c.layer_failed >= 0), -1)
+        assert batch.layer_failed[i] == layer
+        assert batch.size_multiplier[i] == expected_multiplier(layer < 0, theta)
+
+    assert sum(batch.deny_by_layer.values()) == len(batch) - batch.decision.sum()
+
+
+def test_batch_does_not_register_names():
+    size = len(SIGNAL_REGISTRY)
+    cols = columns(n=200, seed=5)
+    AuthorityEngine().evaluate_many(SIGNAL_REGISTRY.lookup_many(cols["names"]), cols["theta"], cols["consecutive_loss"])
+    assert len(SIGNAL_REGISTRY) == size and SIGNAL_REGISTRY.lookup("random") == 0
+
+
+if __name__ == "__main__":
+    test_engine_batch_matches_scalar()
+    test_rules_batch_matches_layer_checks()
+    test_batch_does_not_register_names()
+    print("✅ authority batch tests passed")
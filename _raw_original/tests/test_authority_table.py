@@ -0,0 +1,105 @@
+"""
+Authority 결정 테이블 테스트
+===========================
+
+확인 항목:
+1. 테이블 판정 == 계층 순차 판정 (policy_v74 함수 직접 호출)
+2. 같은 결정 키 → 같은 응답 객체 (공유, 불변), 범위 밖 θ는 캐시 없이 같은 값
+3. 통계는 요청 단위로 정확히 누적
+"""
+
+import dataclasses
+import itertools
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from opa import policy_v74
+from opa.authority_engine import AuthorityEngine, AuthorityRequest, Authority
+from opa.policy_snapshot import POLICY_SNAPSHOTS
+
+SIGNALS = sorted(policy_v74.BLACKLIST_SIGNALS) + ["STB숏", "SCALP_A", "random"]
+
+
+def reference(request: AuthorityRequest):
+    """기존 순차 판정 → (authority, layer_failed, size, can_retry, can_trail)"""
+    theta = request.theta
+    deny = lambda layer: (Authority.DENY, layer, "NONE", False, False)
+    if request.signal_name in policy_v74.BLACKLIST_SIGNALS:
+        return deny(0)
+    if not policy_v74.is_allowed(theta):
+        return deny(1)
+    if request.consecutive_loss >= 2:
+        return deny(2)
+    retry = policy_v74.can_retry(theta, request.impulse_count, request.recovery_time)
+    if request.is_retry and not retry:
+        return deny(3)
+    return (Authority.ALLOW, -1, policy_v74.get_size(theta), retry, policy_v74.can_trail(theta))
+
+
+def requests():
+    for signal, theta, retry, impulse, recovery, loss in itertools.product(
+            SIGNALS, range(-1, 10), (False, True), (0, 3, 5), (1.0, 4.0, 9.0), (0, 1, 2, 3)):
+        yield AuthorityRequest(signal_name=signal, theta=theta, is_retry=retry,
+                               impulse_count=impulse, recovery_time=recovery,
+                               consecutive_loss=loss)
+
+
+def test_table_matches_reference():
+    engine = AuthorityEngine()
+    for request in requests():
+        response = engine.evaluate(request)
+        assert (response.authority, response.layer_failed, response.size,
+                response.can_retry, response.can_trail) == reference(request)
+        assert response.theta == request.theta
+
+
+def test_responses_shared_and_frozen():
+    engine = AuthorityEngine()
+    first = engine.evaluate(AuthorityRequest(signal_name="STB숏", theta=3))
+    second = engine.evaluate(AuthorityRequest(signal_name="SCALP_A", theta=3))
+    assert first is second
+    blacklisted = sorted(policy_v74.BLACKLIST_SIGNALS)[0]
+    assert engine.evaluate(AuthorityRequest(signal_name=blacklisted, theta=2)) is \
+        engine.evaluate(AuthorityRequest(signal_name=blacklisted, theta=2))
+
+    # 범위 밖 θ: 최상위 키 정책, θ는 요청 값 그대로, 캐시 없음
+    assert engine.THETA_TABLE_SIZE == len(POLICY_SNAPSHOTS)
+    cached = len(engine._blacklisted)
+    for theta in range(engine.THETA_TABLE_SIZE, 2000):
+        for signal in (blacklisted, "STB숏"):
+            response = engine.evaluate(AuthorityRequest(signal_name=signal, theta=theta))
+            assert response.theta == theta
+    assert len(engine._blacklisted) == cached
+    assert engine.evaluate(AuthorityRequest(signal_name="STB숏", theta=42)) == \
+        dataclasses.replace(first, theta=42)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.size = "NONE"
+
+
+def test_stats_exact():
+    engine = AuthorityEngine()
+    expected = {"allow": 0, "deny": 0, "deny_by_layer": {0: 0, 1: 0, 2: 0, 3: 0}}
+    for request in requests():
+        layer = reference(request)[1]
+        engine.evaluate(request)
+        if layer < 0:
+            expected["allow"] += 1
+        else:
+            expected["deny"] += 1
+            expected["deny_by_layer"][layer] += 1
+
+    stats = engine.get_stats()
+    assert {k: stats[k] for k in expected} == expected
+    assert stats["total"] == expected["allow"] + expected["deny"]
+
+
+if __name__ == "__main__":
+    test_table_matches_reference()
+    test_responses_shared_and_frozen()
+    test_stats_exact()
+    print("✅ authority table tests passed")
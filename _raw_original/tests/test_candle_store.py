@@ -0,0 +1,121 @@
+"""
+Candle Store 테스트
+===================
+
+확인 항목:
+1. 저장 → 읽기 왕복 (컬럼 / to_candles)
+2. append: 이어 쓰기 + refresh, 시간 역행 append는 ValueError
+3. range: [start, end) binary search 구간 == 마스크 결과, zero-copy view
+4. 쓰기 도중 중단 (time.bin 미기록) → 확정 건수만 보이고 다음 append로 복구
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.candle_store import (
+    CandleStore, CANDLE_COLUMNS, candles_to_columns, write_candles, _column_path,
+)
+from _raw_original.tests.candle_data import random_walk_candles
+
+
+T0 = 1735689600  # 2025-01-01T00:00:00Z
+
+
+def make_columns(n: int = 500, seed: int = 4, start: int = T0) -> dict:
+    return candles_to_columns([
+        {**c, "time": start + 60 * i, "volume": float(i)}
+        for i, c in enumerate(random_walk_candles(n, seed))
+    ])
+
+
+def write(path, columns: dict) -> int:
+    return write_candles(path, columns["time"], columns["open"], columns["high"],
+                         columns["low"], columns["close"], columns["volume"])
+
+
+def assert_columns(store: CandleStore, columns: dict):
+    for name in CANDLE_COLUMNS:
+        np.testing.assert_array_equal(store.columns[name], columns[name])
+
+
+def test_round_trip(tmp_path):
+    columns = make_columns()
+    assert write(tmp_path, columns) == 500
+
+    store = CandleStore(str(tmp_path))
+    assert len(store) == 500 and store.meta["count"] == 500
+    assert_columns(store, columns)
+
+    candles = store.slice(0, 2).to_candles()
+    assert candles[0]["time"] == "2025-01-01T00:00:00"
+    assert candles[1]["close"] == columns["close"][1] and candles[1]["volume"] == 1.0
+
+
+def test_append(tmp_path):
+    columns = make_columns()
+    head = {k: v[:300] for k, v in columns.items()}
+    tail = {k: v[300:] for k, v in columns.items()}
+
+    write(tmp_path, head)
+    store = CandleStore(str(tmp_path))
+    assert write(tmp_path, tail) == 500
+    assert len(store) == 300
+    store.refresh()
+    assert_columns(store, columns)
+
+    with pytest.raises(ValueError, match="out of order"):
+        write(tmp_path, {k: v[:10] for k, v in columns.items()})
+    with pytest.raises(ValueError, match="non-decreasing"):
+        write(tmp_path, {k: v[::-1] for k, v in tail.items()})
+    store.refresh()
+    assert len(store) == 500
+
+
+def test_range_slice(tmp_path):
+    columns = make_columns()
+    write(tmp_path, columns)
+    store = CandleStore(str(tmp_path))
+
+    start, end = "2025-01-01T01:00:00", np.datetime64("2025-01-01T03:30:00")
+    window = store.range(start, end)
+    mask = (columns["time"] >= T0 + 3600) & (columns["time"] < T0 + 3 * 3600 + 1800)
+    np.testing.assert_array_equal(window.close, columns["close"][mask])
+    assert len(window) == 150 and window.time[0] == T0 + 3600
+    assert np.shares_memory(window.close, store.columns["close"])
+
+    assert len(store.range()) == 500
+    assert len(store.range(end=T0)) == 0
+    assert len(store.range(T0 + 60 * 500)) == 0
+    np.testing.assert_array_equal(store.slice(10, 20).ohlc[3], columns["close"][10:20])
+
+
+def test_interrupted_write(tmp_path):
+    columns = make_columns()
+    write(tmp_path, {k: v[:300] for k, v in columns.items()})
+
+    # 중단 재현: time 이외 컬럼만 일부 기록
+    for name in ("open", "high", "low"):
+        with open(_column_path(str(tmp_path), name), "ab") as f:
+            f.write(columns[name][300:350].tobytes())
+
+    store = CandleStore(str(tmp_path))
+    assert len(store) == 300
+    assert_columns(store, {k: v[:300] for k, v in columns.items()})
+
+    assert write(tmp_path, {k: v[300:] for k, v in columns.items()}) == 500
+    store.refresh()
+    assert_columns(store, columns)
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    for test in (test_round_trip, test_append, test_range_slice, test_interrupted_write):
+        with tempfile.TemporaryDirectory() as tmp:
+            test(tmp)
+    print("✅ candle store tests passed")
@@ -0,0 +1,128 @@
+"""
+V7EnergyEngine 테스트
+=====================
+
+확인 항목:
+1. archive_size 초과 → 가장 오래된 청산부터 제거
+2. get_recent_closes: 오래된 순, 재사용 trade_id는 가장 최근으로 이동
+3. 청산 후 get_position_status / close_position은 아카이브 기준
+4. V7Position 레코드 (__slots__, 방향/상태 코드), 잘못된 방향은 ValueError
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.v7_energy_engine import (
+    V7EnergyEngine, V7Position,
+    STATE_ACTIVE, STATE_TRAILING, SIGNAL_LONG, SIGNAL_SHORT,
+)
+from core.position_book import PositionBook
+
+
+def stop_out(engine: V7EnergyEngine, trade_id: str, entry: float = 100.0):
+    """LONG 진입 → 바로 SL 청산"""
+    engine.open_position(trade_id, "LONG", entry, "t0")
+    return engine.update_position(trade_id, entry + 0.5, entry - 40, entry - 35)
+
+
+def test_archive_eviction():
+    engine = V7EnergyEngine(archive_size=3)
+    for i in range(5):
+        assert stop_out(engine, f"T{i}") == ("LOSS", -30.0)
+
+    assert not engine.positions
+    assert list(engine.closed_positions) == ["T2", "T3", "T4"]
+    assert engine.get_position_status("T0") is None
+
+    disabled = V7EnergyEngine(archive_size=0)
+    stop_out(disabled, "T0")
+    assert not disabled.closed_positions
+
+
+def test_recent_closes_order():
+    engine = V7EnergyEngine(archive_size=3)
+    for trade_id in ["A", "B", "C"]:
+        stop_out(engine, trade_id)
+
+    assert [c.trade_id for c in engine.get_recent_closes()] == ["A", "B", "C"]
+    assert [c.trade_id for c in engine.get_recent_closes(2)] == ["B", "C"]
+
+    # A 재사용 → 가장 최근, 다음 청산에서 B가 먼저 밀려남
+    stop_out(engine, "A", entry=200.0)
+    assert [c.trade_id for c in engine.get_recent_closes()] == ["B", "C", "A"]
+    assert engine.closed_positions["A"].entry_price == 200.0
+
+    stop_out(engine, "D")
+    assert [c.trade_id for c in engine.get_recent_closes()] == ["C", "A", "D"]
+
+
+def test_status_after_close():
+    engine = V7EnergyEngine()
+    engine.open_position("T1", "SHORT", 100.0, "t0")
+    engine.update_position("T1", 100.5, 97.0, 98.0)
+
+    live = engine.get_position_status("T1")
+    assert live["state"] == "active" and live["direction"] == "SHORT"
+
+    assert engine.close_position("T1") == 2.0
+    closed = engine.get_position_status("T1")
+    assert closed["state"] == "closed" and not closed["trailing_active"]
+    assert closed["mfe"] == live["mfe"] and closed["current_pnl"] == 2.0
+    assert engine.closed_positions["T1"].exit_type == "MANUAL"
+
+    # 이미 청산된 포지션: 기존 PnL 그대로, 아카이브에 없으면 None
+    assert engine.close_position("T1") == 2.0
+    assert engine.update_position("T1", 100.0, 90.0, 95.0) == (None, 0)
+    assert engine.close_position("unknown") is None
+
+
+def test_position_record():
+    engine = V7EnergyEngine()
+    pos = engine.open_position("T1", "LONG", 100.0, "t0")
+
+    assert isinstance(pos, V7Position) and not hasattr(pos, "__dict__")
+    with pytest.raises(AttributeError):
+        pos.exit_price = 110.0
+    assert (pos.direction, pos.state, pos.sl, pos.bars) == (SIGNAL_LONG, STATE_ACTIVE, 30.0, 0)
+    assert pos.trailing_stop is None and pos.entry_time == "t0"
+
+    engine.update_position("T1", 108.0, 107.0, 107.5)
+    assert pos.state == STATE_TRAILING and pos.trailing_stop == 106.5
+    assert engine.get_position_status("T1") == {
+        'direction': 'LONG',
+        'entry_price': 100.0,
+        'mfe': 8.0,
+        'current_pnl': 7.5,
+        'state': 'trailing',
+        'trailing_stop': 106.5,
+        'trailing_active': True,
+    }
+
+    short = engine.open_position("T2", "SHORT", 100.0, "t1")
+    assert short.direction == SIGNAL_SHORT
+    assert engine.get_position_status("T2")["direction"] == "SHORT"
+
+
+def test_invalid_direction():
+    engine = V7EnergyEngine()
+    book = PositionBook(engine)
+    for bad in ("long", "BUY", None):
+        with pytest.raises(ValueError, match="Unknown direction"):
+            engine.open_position("T1", bad, 100.0, "t0")
+        with pytest.raises(ValueError, match="Unknown direction"):
+            book.open_position("T1", bad, 100.0)
+
+    assert not engine.positions and len(book) == 0
+
+
+if __name__ == "__main__":
+    test_archive_eviction()
+    test_recent_closes_order()
+    test_status_after_close()
+    test_position_record()
+    test_invalid_direction()
+    print("✅ energy engine tests passed")
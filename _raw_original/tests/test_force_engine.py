@@ -0,0 +1,83 @@
+"""
+Force Engine 테스트
+===================
+
+확인 항목:
+1. ForceEngine.push 반복 == compute_force (5채널 + 붕괴 플래그)
+2. view: state와 메모리 공유 + 읽기 전용
+3. 채널 정의 (손계산 값)
+"""
+
+import os
+import random
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.force_engine import (
+    ForceEngine, compute_force, LONG_BARS,
+    PERSISTENCE, INTERFERENCE, RESISTANCE, RELEASE, COMPRESSION,
+)
+
+
+def make_bars(n: int = 3000, seed: int = 8):
+    rng = random.Random(seed)
+    bars, price = [], 21500.0
+    for i in range(n):
+        o = price
+        c = round(price + rng.gauss(0.3 if (i // 200) % 2 else -0.3, 3), 2)
+        bars.append((o, max(o, c) + abs(rng.gauss(0, 2)), min(o, c) - abs(rng.gauss(0, 2)), c))
+        price = c
+    return bars
+
+
+def test_stream_matches_batch():
+    bars = make_bars()
+    series = compute_force(*(np.array(col) for col in zip(*bars)))
+    
+    engine = ForceEngine()
+    engine.RESYNC_INTERVAL = 700
+    values, flags = [], []
+    for bar in bars:
+        flags.append(engine.push(*bar))
+        values.append(engine.state.copy())
+    
+    assert np.allclose(np.array(values), series.values, equal_nan=True)
+    assert flags == series.collapse.tolist()
+    assert np.isnan(series.values[:LONG_BARS - 1]).all()
+    assert series.collapse.any()
+
+
+def test_view_is_shared_and_read_only():
+    engine = ForceEngine()
+    view = engine.view
+    for bar in make_bars(LONG_BARS + 5):
+        engine.push(*bar)
+    
+    assert engine.view is view
+    assert np.array_equal(view, engine.state)
+    assert not view.flags.writeable
+
+
+def test_channel_definitions():
+    # 고정 range 2, body 1, close +1씩 상승 → 간섭 0, 꼬리 0.5, 지속성 1
+    bars = [(float(i), i + 1.5, i - 0.5, float(i + 1)) for i in range(LONG_BARS)]
+    engine = ForceEngine()
+    for bar in bars:
+        engine.push(*bar)
+    
+    s = engine.state
+    assert s[PERSISTENCE] == 1.0
+    assert s[INTERFERENCE] == 0.0
+    assert s[RESISTANCE] == 0.5
+    assert s[RELEASE] == 1.0
+    assert np.isclose(s[COMPRESSION], 2.0 / (LONG_BARS + 1))
+
+
+if __name__ == "__main__":
+    test_stream_matches_batch()
+    test_view_is_shared_and_read_only()
+    test_channel_definitions()
+    print("✅ force engine tests passed")
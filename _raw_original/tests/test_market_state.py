@@ -0,0 +1,88 @@
+"""
+시장 상태 분류 테스트
+=====================
+
+확인 항목:
+1. classify_market_states == MarketStateClassifier == grammar_demo 규칙
+2. RLE 구간: 연속 상태 1개 = 구간 1개, 전체 길이 보존
+3. RollingChannel == 최근 N봉 max / min (STB / 시장 상태 / force 공용)
+"""
+
+import os
+import random
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from grammar_demo import CandleData, calculate_ratio, classify_market_state
+from core.market_state import (
+    MarketStateClassifier, classify_market_states, state_segments,
+    MARKET_STATE_NAMES, STATE_UNKNOWN,
+)
+from core.rolling_channel import RollingChannel
+
+
+def make_bars(n: int = 3000, seed: int = 21):
+    rng = random.Random(seed)
+    bars, price = [], 21500.0
+    for _ in range(n):
+        o = price
+        c = price + rng.gauss(0, rng.choice([1, 6]))
+        bars.append((o, max(o, c) + abs(rng.gauss(0, 2)), min(o, c) - abs(rng.gauss(0, 2)), c))
+        price = c
+    return bars
+
+
+def test_batch_stream_and_reference_agree():
+    bars = make_bars()
+    o, h, l, c = (np.array(col) for col in zip(*bars))
+    
+    batch = classify_market_states(h, l, c)
+    clf = MarketStateClassifier()
+    stream = [clf.push(*bar) for bar in bars]
+    assert batch.tolist() == stream
+    
+    for i in range(20, len(bars)):
+        ch_range = h[i - 20:i].max() - l[i - 20:i].min()
+        ratio = calculate_ratio(CandleData(*bars[i]))
+        expected = classify_market_state(ratio, ch_range).name
+        assert MARKET_STATE_NAMES[stream[i]] == expected
+    assert stream[:20] == [STATE_UNKNOWN] * 20
+
+
+def test_segments():
+    segments = state_segments([-1, -1, 0, 0, 0, 3, 1, 1])
+    assert segments.start.tolist() == [0, 2, 5, 6]
+    assert segments.length.tolist() == [2, 3, 1, 2]
+    assert segments.names() == ["UNKNOWN", "SIDEWAYS", "TRENDING", "OVERBOUGHT"]
+    assert len(state_segments([])) == 0
+
+
+def test_rolling_channel():
+    bars = make_bars(500, seed=8)
+    h = np.array([b[1] for b in bars])
+    l = np.array([b[2] for b in bars])
+    
+    for size in (1, 5, 20):
+        channel = RollingChannel(size)
+        for i in range(len(bars)):
+            channel.push(h[i], l[i])
+            lo = max(0, i + 1 - size)
+            assert channel.high == h[lo:i + 1].max()
+            assert channel.low == l[lo:i + 1].min()
+            assert channel.range == channel.high - channel.low
+        channel.reset()
+        assert channel.count == 0
+    
+    with pytest.raises(ValueError):
+        RollingChannel(0)
+
+
+if __name__ == "__main__":
+    test_batch_stream_and_reference_agree()
+    test_segments()
+    test_rolling_channel()
+    print("✅ market state tests passed")
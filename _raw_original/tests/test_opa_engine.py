@@ -0,0 +1,123 @@
+"""
+OPA Engine 테스트
+=================
+
+확인 항목:
+1. 기본 순서 판정 == authority_rules.evaluate_many (4계층 단일 구현), 전역 레지스트리 불변
+2. short-circuit 순서: 판정은 동일, layer_failed는 먼저 검사한 계층
+3. CONSERVATIVE 모드: Tier1 only + θ≥3
+4. 지연 히스토그램: 검사한 계층 수만큼 누적, reset_stats로 비움
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from opa import authority_rules
+from opa.opa_engine import OPAEngine, OPARequest, LATENCY_BUCKETS_NS
+from opa.authority_rules import Authority, DenyReason
+from opa.mode_switch import OperationMode
+from opa.signal_registry import SIGNAL_REGISTRY
+
+NAMES = ["숏-정체", "STB숏", "SCALP_A", "매수스팟", "random"]
+
+
+def make_requests(n: int = 2000, seed: int = 3):
+    rng = np.random.default_rng(seed)
+    return [
+        OPARequest(
+            signal_name=NAMES[rng.integers(len(NAMES))],
+            state_certified=bool(rng.random() < 0.8),
+            theta=int(rng.integers(0, 5)),
+            consecutive_loss_same_zone=int(rng.integers(0, 3)),
+            slippage=float(rng.uniform(0, 4)),
+            spread=float(rng.uniform(0, 3)),
+        )
+        for _ in range(n)
+    ]
+
+
+def test_default_order_matches_rules():
+    requests = make_requests()
+    engine = OPAEngine()
+    size = len(SIGNAL_REGISTRY)
+    layers = [engine.check_authority(r).layer_failed for r in requests]
+    assert len(SIGNAL_REGISTRY) == size      # 미등록 이름은 등록하지 않음
+
+    batch = authority_rules.evaluate_many(
+        SIGNAL_REGISTRY.lookup_many(r.signal_name for r in requests),
+        [r.theta for r in requests],
+        [r.consecutive_loss_same_zone for r in requests],
+        [r.slippage for r in requests],
+        [r.spread for r in requests],
+        state_certified=[r.state_certified for r in requests],
+    )
+    assert layers == batch.layer_failed.tolist()
+    assert engine.get_stats()["deny_by_layer"] == batch.deny_by_layer
+
+
+def test_layer_order_short_circuit():
+    requests = make_requests()
+    default, reordered = OPAEngine(), OPAEngine(layer_order=(3, 2, 1, 0))
+
+    for request in requests:
+        a = default.check_authority(request)
+        b = reordered.check_authority(request)
+        assert a.authority == b.authority
+        if b.authority == Authority.DENY:
+            assert b.layer_failed >= a.layer_failed
+
+    # 모든 계층 실패 → 첫 검사 계층
+    failing = OPARequest(signal_name="random", state_certified=False, theta=0,
+                         consecutive_loss_same_zone=2, slippage=5.0)
+    assert reordered.check_authority(failing).reason == DenyReason.EXECUTION_ENVIRONMENT
+    assert default.get_stats()["allowed"] == reordered.get_stats()["allowed"]
+
+    with pytest.raises(ValueError):
+        OPAEngine(layer_order=(0, 1, 1, 3))
+
+
+def test_conservative_mode():
+    engine = OPAEngine(mode=OperationMode.CONSERVATIVE)
+    assert engine.check_authority(OPARequest("SCALP_A", True, 5)).layer_failed == 0
+    assert engine.check_authority(OPARequest("숏-정체", True, 2)).layer_failed == 1
+
+    response = engine.check_authority(OPARequest("숏-정체", True, 3))
+    assert response.authority == Authority.ALLOW
+    assert response.is_tier1 and response.theta_threshold_used == 3
+
+
+def test_latency_histograms():
+    engine = OPAEngine()
+    expected = {0: 0, 1: 0, 2: 0, 3: 0}
+    for request in make_requests(500):
+        layer = engine.check_authority(request).layer_failed
+        for checked in range(4 if layer < 0 else layer + 1):
+            expected[checked] += 1
+
+    latency = engine.get_stats()["latency_ns"]
+    for layer, count in expected.items():
+        assert latency[layer]["count"] == count
+        assert len(latency[layer]["buckets"]) == len(LATENCY_BUCKETS_NS) + 1
+        assert latency[layer]["p50"] <= latency[layer]["p99"]
+
+    histogram = engine._latency[0]
+    engine.reset_stats()
+    assert engine._latency[0] is histogram
+    assert engine.get_stats()["latency_ns"][0]["count"] == 0
+
+    untimed = OPAEngine(record_latency=False)
+    untimed.check_authority(OPARequest("STB숏", True, 1))
+    assert untimed.get_stats()["latency_ns"][0]["count"] == 0
+
+
+if __name__ == "__main__":
+    test_default_order_matches_rules()
+    test_layer_order_short_circuit()
+    test_conservative_mode()
+    test_latency_histograms()
+    print("✅ opa engine tests passed")
@@ -0,0 +1,67 @@
+"""
+파라미터 sweep 테스트
+====================
+
+확인 항목:
+1. 병렬 sweep (shared memory) == 순차 sweep (max_workers=0)
+2. use_g3 차원: False == make_engine(use_g3=False) 백테스트
+3. 빈 입력 (캔들 0개 / grid 0개)
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from analysis.param_sweep import build_grid, candles_to_arrays, run_sweep, summarize_pnls
+from core.backtest import StreamingBacktest
+from _raw_original.tests.candle_data import random_walk_candles
+
+
+def ohlc(n: int = 2000, seed: int = 5):
+    arrays = candles_to_arrays(random_walk_candles(n, seed))
+    return arrays["open"], arrays["high"], arrays["low"], arrays["close"]
+
+
+def test_parallel_matches_sequential():
+    columns = ohlc()
+    grid = build_grid(MFE_THRESHOLD=[5, 7], TRAIL_OFFSET=[1.0, 1.5], use_g3=[False, True])
+
+    sequential = run_sweep(*columns, grid, max_workers=0)
+    parallel = run_sweep(*columns, grid, max_workers=2)
+
+    assert parallel == sequential
+    assert [{k: r[k] for k in grid[0]} for r in parallel] == grid
+    assert any(r["trades"] > 0 for r in parallel)
+
+
+def test_use_g3_dimension():
+    columns = ohlc(seed=9)
+    rows = run_sweep(*columns, build_grid(use_g3=[False, True]), max_workers=0)
+    pnls = StreamingBacktest().run_arrays(*columns)
+
+    assert rows[0] == {"use_g3": False, **summarize_pnls(pnls["CORE"])}
+    assert rows[1] == {"use_g3": True, **summarize_pnls(pnls["G3"])}
+
+    with pytest.raises(ValueError):
+        build_grid(use_g4=[True])
+
+
+def test_empty_inputs():
+    empty = np.array([], dtype=np.float64)
+    grid = build_grid(TRAIL_OFFSET=[1.0, 1.5])
+
+    for workers in (0, 2):
+        rows = run_sweep(empty, empty, empty, empty, grid, max_workers=workers)
+        assert [r["trades"] for r in rows] == [0, 0]
+        assert run_sweep(*ohlc(200), [], max_workers=workers) == []
+
+
+if __name__ == "__main__":
+    test_parallel_matches_sequential()
+    test_use_g3_dimension()
+    test_empty_inputs()
+    print("✅ param sweep tests passed")
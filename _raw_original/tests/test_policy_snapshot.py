@@ -0,0 +1,86 @@
+"""
+Policy Snapshot 테스트
+=====================
+
+확인 항목:
+1. snapshot 속성 == policy_v74 함수 (get_policy / is_allowed / get_size / can_retry / can_trail)
+2. policy_hash: 헌법 dict 변경 시 verify 실패 + AuthorityEngine 컴파일 거부
+3. EntryGate / ExitRules: snapshot 기준 size / TP / SL / trailing
+"""
+
+import dataclasses
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from opa import policy_v74
+from opa.authority_engine import AuthorityEngine
+from opa.policy_snapshot import (
+    POLICY_HASH, policy_hash, policy_snapshot, verify_policy,
+)
+from opa.size_manager import AccountConfig, get_position_size
+from execution.entry_gate import EntryGate
+from execution.exit_rules import ExitRules
+
+
+def test_snapshot_matches_constitution():
+    for theta in range(-2, 12):
+        snap = policy_snapshot(theta)
+        policy = policy_v74.get_policy(theta)
+
+        assert snap.allow == policy_v74.is_allowed(theta)
+        assert snap.size == policy_v74.get_size(theta)
+        assert snap.size_multiplier == policy_v74.get_size_multiplier(snap.size)
+        assert snap.trail == policy_v74.can_trail(theta)
+        assert (snap.tp, snap.sl) == (policy.get("tp", 20), policy.get("sl", 12))
+        assert snap.policy_hash == POLICY_HASH
+
+        for impulse in range(0, 5):
+            for recovery in (0, 2, 3.9, 4, 6):
+                assert snap.can_retry(impulse, recovery) == \
+                    policy_v74.can_retry(theta, impulse, recovery)
+
+    assert policy_snapshot(10) is policy_snapshot(3)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        policy_snapshot(1).tp = 30
+
+
+def test_hash_detects_constitution_change(monkeypatch):
+    assert verify_policy()
+
+    changed = {**policy_v74.THETA_POLICY, 1: {**policy_v74.THETA_POLICY[1], "tp": 25}}
+    assert policy_hash(changed) != POLICY_HASH
+
+    monkeypatch.setitem(policy_v74.THETA_POLICY, 1, changed[1])
+    assert not verify_policy()
+    with pytest.raises(RuntimeError):
+        AuthorityEngine()
+
+
+def test_entry_and_exit_use_snapshot():
+    gate = EntryGate(AccountConfig(base_size=1.0, max_size=4.0))
+    order = gate.evaluate_entry("STB숏", theta=3, direction="SHORT")
+    assert order.policy is policy_snapshot(3)
+    assert (order.size, order.tp, order.sl) == (4.0, 20, 12)
+    assert gate.evaluate_entry("STB숏", theta=0, direction="SHORT") is None
+
+    account = AccountConfig(theta_size_override={2: "MEDIUM"})
+    assert get_position_size(2, account) == 2.0
+    assert get_position_size(2, account, policy_snapshot(2)) == 2.0
+    assert get_position_size(1) == 1.0
+
+    rules = ExitRules()
+    trail = rules.evaluate(3, current_pnl=6, bars=10, trailing_enabled=True,
+                           peak_pnl=15, policy=order.policy)
+    assert trail.action == "EXIT_TRAIL"
+    assert rules.evaluate(2, current_pnl=6, bars=10, trailing_enabled=True,
+                          peak_pnl=15).action == "HOLD"
+
+
+if __name__ == "__main__":
+    test_snapshot_matches_constitution()
+    test_entry_and_exit_use_snapshot()
+    print("✅ policy snapshot tests passed")
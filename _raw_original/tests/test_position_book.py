@@ -0,0 +1,93 @@
+"""
+PositionBook 테스트
+===================
+
+확인 항목:
+1. PositionBook.update == V7EnergyEngine.update_position (청산 유형/PnL/순서)
+2. G3 OFF (인스턴스 override)도 동일하게 반영
+3. 중복 trade_id 거부, capacity=0에서도 확장
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pytest
+
+from core.v7_energy_engine import V7EnergyEngine
+from core.position_book import PositionBook
+from _raw_original.tests.candle_data import random_walk_candles
+
+
+def replay_both(engine: V7EnergyEngine, n: int = 4000, seed: int = 11):
+    """같은 캔들/진입으로 dict 엔진과 PositionBook을 동시에 진행"""
+    rng = random.Random(seed + 1)   # 진입 여부 / 방향 (캔들과 별도 난수열)
+    book = PositionBook(engine, capacity=4)
+    open_trades = []
+    expected, actual = [], []
+    
+    for i, candle in enumerate(random_walk_candles(n, seed)):
+        h, l, c = candle["high"], candle["low"], candle["close"]
+        
+        if rng.random() < 0.3:
+            tid = f"T{i}"
+            direction = rng.choice(["LONG", "SHORT"])
+            engine.open_position(tid, direction, c, f"t{i}")
+            book.open_position(tid, direction, c, f"t{i}")
+            open_trades.append(tid)
+            continue
+        
+        for tid in list(open_trades):
+            exit_type, pnl = engine.update_position(tid, h, l, c)
+            if exit_type:
+                expected.append((tid, exit_type, pnl))
+                open_trades.remove(tid)
+        actual.extend(book.update(h, l, c))
+        
+        for tid in open_trades[:3]:
+            assert book.get_position_status(tid) == engine.get_position_status(tid)
+    
+    return expected, actual, book
+
+
+def test_book_matches_engine():
+    """테스트 1: G3 ON"""
+    expected, actual, book = replay_both(V7EnergyEngine())
+    
+    assert expected == actual
+    assert {e[1] for e in expected} == {"TRAIL_WIN", "LOSS"}
+    assert book.capacity < 4000, "closed slots must be reused"
+
+
+def test_book_matches_engine_without_g3():
+    """테스트 2: G3 OFF"""
+    engine = V7EnergyEngine()
+    engine.LWS_BARS = 9999
+    engine.LWS_MFE_THRESHOLD = float("inf")
+    
+    expected, actual, _ = replay_both(engine, seed=5)
+    
+    assert expected == actual
+    assert all(pnl != -12.0 for _, _, pnl in actual)
+
+
+def test_duplicate_and_zero_capacity():
+    """테스트 3: 중복 오픈 거부 / capacity 0"""
+    book = PositionBook(capacity=0)
+    book.open_position("A", "LONG", 100.0)
+    book.open_position("B", "SHORT", 100.0)
+    assert book.capacity >= 2
+    
+    with pytest.raises(ValueError):
+        book.open_position("A", "SHORT", 101.0)
+    assert book.get_position_status("A")["direction"] == "LONG"
+    assert len(book) == 2
+
+
+if __name__ == "__main__":
+    test_book_matches_engine()
+    test_book_matches_engine_without_g3()
+    test_duplicate_and_zero_capacity()
+    print("✅ position book tests passed")
@@ -0,0 +1,111 @@
+"""
+Sharded Engine 테스트
+=====================
+
+확인 항목:
+1. 워커 2개 샤딩 결과 == 종목별 단일 StreamingBacktest (G3)
+2. 병합 스트림이 (step, 종목 등록 순서) 순서
+3. exit_price: TRAIL_WIN은 trailing stop (1pt 보정된 PnL과 무관)
+4. 워커가 죽으면 poll(block=True)가 멈추지 않고 RuntimeError
+5. 미등록 종목 submit은 ValueError, step이 비지 않아 이후 flush 정상
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pytest
+
+from core.backtest import StreamingBacktest, make_engine
+from live.sharded_engine import ShardedEngineRuntime
+from _raw_original.tests.candle_data import random_walk_candles
+
+
+SYMBOLS = ["NQ", "ES", "YM", "RTY"]
+
+
+def generate_basket(n: int = 1500, seed: int = 9) -> dict:
+    """종목별 캔들 (종목 순서대로 하나의 난수열을 이어 씀)"""
+    rng = random.Random(seed)
+    return {symbol: random_walk_candles(n, price=20000.0, rng=rng) for symbol in SYMBOLS}
+
+
+def bars_at(basket: dict, i: int) -> dict:
+    return {s: (basket[s][i]["open"], basket[s][i]["high"],
+                basket[s][i]["low"], basket[s][i]["close"]) for s in basket}
+
+
+def test_sharded_matches_single_symbol_backtest():
+    basket = generate_basket()
+    recorded = []
+
+    with ShardedEngineRuntime(SYMBOLS, n_workers=2, on_close=recorded.append) as runtime:
+        for i in range(len(basket["NQ"])):
+            runtime.submit(bars_at(basket, i), time=f"t{i}")
+            runtime.poll()
+        runtime.flush()
+    assert runtime._workers == []
+
+    for symbol in SYMBOLS:
+        expected = StreamingBacktest({"G3": make_engine(use_g3=True)}).run(basket[symbol])["G3"]
+        assert [e.pnl for e in recorded if e.symbol == symbol] == expected
+
+    keys = [(e.step, SYMBOLS.index(e.symbol)) for e in recorded]
+    assert keys == sorted(keys)
+
+
+def test_exit_price():
+    # MFE 2pt 트레일링 → trailing stop이 진입가 +0.5pt일 수 있음 (PnL은 1pt로 보정)
+    basket = generate_basket(n=3000)
+    runtime = ShardedEngineRuntime(SYMBOLS, n_workers=0, engine_params={"MFE_THRESHOLD": 2.0})
+    events = []
+    for i in range(len(basket["NQ"])):
+        events.extend(runtime.step(bars_at(basket, i)))
+
+    clamped = 0
+    for e in events:
+        sign = 1 if e.direction == "LONG" else -1
+        if e.exit_type == "LOSS":
+            assert e.exit_price == e.entry_price + sign * e.pnl
+        else:
+            move = sign * (e.exit_price - e.entry_price)
+            assert e.pnl == max(move, 1)
+            clamped += move < 1
+    assert clamped > 0
+
+
+def test_dead_worker_raises():
+    basket = generate_basket(n=5)
+    with ShardedEngineRuntime(SYMBOLS, n_workers=2) as runtime:
+        runtime._workers[0].terminate()
+        runtime._workers[0].join()
+
+        runtime.submit(bars_at(basket, 0))
+        with pytest.raises(RuntimeError, match="worker 0"):
+            runtime.flush()
+
+
+@pytest.mark.parametrize("n_workers", [0, 2])
+def test_unknown_symbol_rejected(n_workers):
+    basket = generate_basket(n=60)
+    with ShardedEngineRuntime(SYMBOLS, n_workers=n_workers) as runtime:
+        runtime.submit(bars_at(basket, 0))
+        with pytest.raises(ValueError, match="Unregistered symbols"):
+            runtime.submit({**bars_at(basket, 1), "CL": (70.0, 71.0, 69.0, 70.5)})
+
+        assert runtime.submit(bars_at(basket, 1)) == 1
+        runtime.flush()
+        for i in range(2, 60):
+            runtime.step(bars_at(basket, i))
+        assert runtime._release_step == runtime._next_step == 60
+
+
+if __name__ == "__main__":
+    test_sharded_matches_single_symbol_backtest()
+    test_exit_price()
+    test_dead_worker_raises()
+    test_unknown_symbol_rejected(0)
+    test_unknown_symbol_rejected(2)
+    print("✅ sharded engine tests passed")
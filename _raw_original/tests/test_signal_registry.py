@@ -0,0 +1,107 @@
+"""
+Signal Registry 테스트
+======================
+
+확인 항목:
+1. bitmask == 기존 문자열 멤버십 (정의/Tier1/블랙리스트/STB/방향)
+   + STB 방향 표 / 방향 코드는 core.signal_constants 단일 출처 (core / opa 같은 객체)
+2. 코드는 intern 후 고정, 한도 초과 시 UNKNOWN_CODE, lookup / lookup_many / signal_code는 등록하지 않음
+3. Layer 0 / 블랙리스트 판정: 이름 입력 == 코드 입력 (전역 registry 변경 없음)
+4. parse_stb_signal 캐시 (공유 인스턴스) + 코드 배열 → 방향 코드
+
+전역 SIGNAL_REGISTRY에 새 이름을 등록하지 않는다 (테스트별 SignalRegistry 사용).
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core import signal_constants, stb_sensor, v7_energy_engine
+from core.stb_sensor import STB_SIGNALS, is_stb_signal, parse_stb_signal
+from core.v7_energy_engine import DIRECTION_CODES
+from opa import policy_v74
+from opa.authority_rules import check_layer0_identity, DEFINED_SIGNALS, TIER1_SIGNALS
+from opa.authority_engine import AuthorityEngine, AuthorityRequest
+from opa.signal_registry import (
+    SignalRegistry, SIGNAL_REGISTRY, UNKNOWN_CODE, signal_code,
+    STB_SIGNAL_DIRECTIONS, DIRECTION_LONG, DIRECTION_SHORT,
+    FLAG_DEFINED, FLAG_TIER1, FLAG_POLICY_TIER1, FLAG_BLACKLIST,
+    FLAG_STB, FLAG_LONG, FLAG_SHORT,
+)
+
+NAMES = list(SIGNAL_REGISTRY.names[1:]) + ["STB_NEW", "random", "숏 교집합 스팟"]
+
+
+def test_flags_match_string_membership():
+    registry = SignalRegistry()
+    for name in NAMES:
+        flags = registry.flags[registry.intern(name)]
+        parsed = parse_stb_signal(name)
+        direction = parsed.direction if parsed else None
+        
+        assert bool(flags & FLAG_DEFINED) == (name in DEFINED_SIGNALS)
+        assert bool(flags & FLAG_TIER1) == (name in TIER1_SIGNALS)
+        assert bool(flags & FLAG_POLICY_TIER1) == (name in policy_v74.TIER1_SIGNALS)
+        assert bool(flags & FLAG_BLACKLIST) == (name in policy_v74.BLACKLIST_SIGNALS)
+        assert bool(flags & FLAG_STB) == is_stb_signal(name)
+        assert bool(flags & FLAG_LONG) == (direction == "LONG")
+        assert bool(flags & FLAG_SHORT) == (direction == "SHORT")
+    
+    assert STB_SIGNALS is signal_constants.STB_SIGNALS is stb_sensor.STB_SIGNALS
+    assert DIRECTION_CODES is signal_constants.DIRECTION_CODES is v7_energy_engine.DIRECTION_CODES
+    assert STB_SIGNAL_DIRECTIONS == {k: v["direction"] for k, v in STB_SIGNALS.items()}
+    assert (DIRECTION_LONG, DIRECTION_SHORT) == (DIRECTION_CODES["LONG"], DIRECTION_CODES["SHORT"])
+
+
+def test_codes_stable_and_bounded():
+    registry = SignalRegistry(["A", "B"])
+    registry.MAX_SIGNALS = 4
+    
+    assert registry.intern("A") == 1
+    assert registry.encode(["B", "C", "A"]).tolist() == [2, 3, 1]
+    assert registry.intern("D") == UNKNOWN_CODE
+    assert registry.flag_table().tolist() == registry.flags
+    
+    fresh = SignalRegistry(["A"])
+    assert fresh.lookup("A") == 1
+    assert fresh.lookup("B") == UNKNOWN_CODE and len(fresh) == 2
+    assert fresh.lookup_many(["B", "A", "C"]).tolist() == [UNKNOWN_CODE, 1, UNKNOWN_CODE]
+    assert fresh.lookup_many(["A"]).dtype == registry.encode(["A"]).dtype and len(fresh) == 2
+    
+    size = len(SIGNAL_REGISTRY)
+    assert signal_code("STB숏") == SIGNAL_REGISTRY.lookup("STB숏") != UNKNOWN_CODE
+    assert signal_code("not-a-signal") == UNKNOWN_CODE and len(SIGNAL_REGISTRY) == size
+
+
+def test_gates_accept_codes():
+    engine = AuthorityEngine()
+    size = len(SIGNAL_REGISTRY)
+    for name in NAMES:
+        code = SIGNAL_REGISTRY.lookup(name)
+        assert (check_layer0_identity(name).layer_failed
+                == check_layer0_identity(name, code).layer_failed)
+        by_name = engine.evaluate(AuthorityRequest(signal_name=name, theta=1))
+        by_code = engine.evaluate(AuthorityRequest(signal_name=name, theta=1, signal_code=code))
+        assert by_name == by_code
+        assert (by_code.layer_failed == 0) == (name in policy_v74.BLACKLIST_SIGNALS)
+    assert len(SIGNAL_REGISTRY) == size
+
+
+def test_parse_cached_and_bulk_directions():
+    first = parse_stb_signal("STB숏")
+    assert first is parse_stb_signal("STB숏")
+    assert first.is_short
+    assert parse_stb_signal("random") is None
+    
+    registry = SignalRegistry()
+    codes = registry.encode(["STB숏", "STB롱", "SCALP_A", "random", "STB숏"])
+    assert registry.direction_codes(codes).tolist() == [-1, 1, 0, 0, -1]
+
+
+if __name__ == "__main__":
+    test_flags_match_string_membership()
+    test_codes_stable_and_bounded()
+    test_gates_accept_codes()
+    test_parse_cached_and_bulk_directions()
+    print("✅ signal registry tests passed")
@@ -0,0 +1,90 @@
+"""
+상태 전이 누적기 테스트
+=======================
+
+확인 항목:
+1. update_many == update 반복 (UNKNOWN 끊김, 청크 경계 포함)
+2. 윈도우 합계 == 최근 N bucket만 새로 누적한 결과
+3. 샤드 merge == 단일 누적기 (샤드 경계 flush)
+4. 정상분포: π P = π
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.state_transitions import TransitionAccumulator, WindowedTransitionAccumulator
+
+
+def make_states(n: int = 5000, seed: int = 4) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    runs = rng.integers(-1, 4, n // 4)
+    return np.repeat(runs, rng.integers(1, 8, len(runs)))[:n]
+
+
+def test_batch_matches_scalar():
+    states = make_states()
+    scalar = TransitionAccumulator(max_dwell=6)
+    for s in states:
+        scalar.update(int(s))
+    
+    batch = TransitionAccumulator(max_dwell=6)
+    for chunk in np.array_split(states, 7):
+        batch.update_many(chunk)
+    
+    assert (scalar.counts == batch.counts).all()
+    assert (scalar.dwell == batch.dwell).all()
+    assert (scalar.prev, scalar.run) == (batch.prev, batch.run)
+
+
+def test_window_matches_recompute():
+    states = make_states(3000)
+    times = np.sort(np.random.default_rng(1).uniform(0, 20 * 86400, len(states)))
+    
+    windowed = WindowedTransitionAccumulator(window=5)
+    windowed.update_many(states[:1000], times[:1000])
+    for s, t in zip(states[1000:], times[1000:]):
+        windowed.update(int(s), t)
+    
+    # 윈도우 시작 직전 상태부터 다시 누적 (시작 bucket 첫 전이 포함)
+    first = int(np.searchsorted(times, (int(times[-1] // 86400) - 4) * 86400))
+    fresh = TransitionAccumulator()
+    fresh.update(int(states[first - 1]))
+    fresh.counts[:] = 0
+    fresh.update_many(states[first:])
+    
+    assert (windowed.counts == fresh.counts).all()
+
+
+def test_merge_and_stationary():
+    states = make_states()
+    whole = TransitionAccumulator()
+    shards = []
+    for chunk in np.array_split(states, 4):
+        whole.update_many(chunk)
+        whole.flush()
+        shard = TransitionAccumulator()
+        shard.update_many(chunk)
+        shard.flush()
+        shards.append(shard)
+    
+    merged = TransitionAccumulator()
+    for shard in shards:
+        merged.merge(shard)
+    assert (merged.counts == whole.counts).all()
+    assert (merged.dwell == whole.dwell).all()
+    
+    p = merged.transition_matrix()
+    pi = merged.stationary_distribution()
+    assert np.allclose(pi @ p, pi)
+    assert np.isclose(pi.sum(), 1.0)
+
+
+if __name__ == "__main__":
+    test_batch_matches_scalar()
+    test_window_matches_recompute()
+    test_merge_and_stationary()
+    print("✅ state transition tests passed")
@@ -0,0 +1,96 @@
+"""
+STB 스트리밍 검출기 테스트
+==========================
+
+확인 항목:
+1. StreamingSTBDetector == check_stb_entry (봉 단위 일치)
+2. 50봉 미만 history → None
+3. scan_stb_signals == check_stb_entry (배치 스캔, 봉 단위 일치)
+4. body 일정 구간 (std = 0, flat 봉 포함): rolling 분산 잔차로 신호를 내지 않음
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+
+from core.v7_energy_engine import (
+    StreamingSTBDetector, check_stb_entry, scan_stb_signals,
+    SIGNAL_LONG, SIGNAL_SHORT, SIGNAL_NONE,
+)
+from _raw_original.tests.candle_data import random_walk_candles
+
+
+def test_streaming_matches_check_stb_entry():
+    """테스트 1: 스트리밍 결과가 history 슬라이싱 결과와 동일"""
+    candles = random_walk_candles()
+    detector = StreamingSTBDetector()
+    
+    signals = 0
+    for i, candle in enumerate(candles):
+        expected = check_stb_entry(candle, candles[:i])
+        assert detector.update(candle) == expected, f"bar {i} mismatch"
+        signals += expected is not None
+    
+    assert signals > 0, "test data must trigger STB"
+
+
+def test_streaming_warmup():
+    """테스트 2: 50봉 미만에서는 신호 없음"""
+    candles = random_walk_candles(n=50)
+    detector = StreamingSTBDetector()
+    
+    assert all(detector.update(c) is None for c in candles)
+    assert detector.ready
+
+
+def test_batch_scan_matches_check_stb_entry():
+    """테스트 3: 배치 스캔 결과가 스칼라 함수와 동일"""
+    candles = random_walk_candles()
+    columns = {k: np.array([c[k] for c in candles]) for k in ("open", "high", "low", "close")}
+    
+    result = scan_stb_signals(columns["open"], columns["high"], columns["low"],
+                              columns["close"], chunk_size=500)
+    
+    codes = {"LONG": SIGNAL_LONG, "SHORT": SIGNAL_SHORT, None: SIGNAL_NONE}
+    expected = np.array([codes[check_stb_entry(c, candles[:i])] for i, c in enumerate(candles)])
+    
+    assert result.signal.dtype == np.int8
+    assert np.array_equal(result.signal, expected)
+    assert np.isnan(result.body_z[:50]).all() and not np.isnan(result.body_z[50:]).any()
+
+
+def constant_body_candles(seed: int, body: float) -> list:
+    """변동 200봉 → body 일정 60봉 (0.25 격자, 넓은 채널) → 채널 상단 후보 봉"""
+    candles = random_walk_candles(n=200, seed=seed)
+    price = round(candles[-1]["close"] * 4) / 4
+    for i in range(60):
+        o, c = price, price + (body if i % 2 else -body)
+        candles.append({"open": o, "high": max(o, c) + 20.0, "low": min(o, c) - 20.0, "close": c})
+        price = c
+    top = max(x["high"] for x in candles[-20:])
+    candles.append({"open": top - 10, "high": top + 1, "low": top - 11, "close": top})
+    return candles
+
+
+def test_constant_body_window():
+    """테스트 4: body std = 0 윈도우 → check_stb_entry와 같이 None"""
+    for body in (2.0, 0.0):
+        for seed in range(40):
+            candles = constant_body_candles(seed, body)
+            detector = StreamingSTBDetector()
+            for candle in candles[:-1]:
+                detector.update(candle)
+            expected = check_stb_entry(candles[-1], candles[:-1])
+            assert expected is None
+            assert detector.update(candles[-1]) == expected, f"seed {seed} body {body}"
+
+
+if __name__ == "__main__":
+    test_streaming_matches_check_stb_entry()
+    test_streaming_warmup()
+    test_batch_scan_matches_check_stb_entry()
+    test_constant_body_window()
+    print("✅ STB streaming tests passed")
@@ -0,0 +1,90 @@
+"""
+스트리밍 백테스트 테스트
+========================
+
+확인 항목:
+1. StreamingBacktest (CORE + G3 단일 패스) == 기존 O(n²) run_backtest 루프
+2. run_arrays (배치 STB 스캔) == run (캔들 dict)
+3. run_arrays 후 run 이어서 == 전체 run, 사용 중인 러너의 run_arrays는 RuntimeError
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+import pytest
+
+from core.v7_energy_engine import check_stb_entry
+from core.backtest import StreamingBacktest, make_engine
+from _raw_original.tests.candle_data import random_walk_candles
+
+
+def reference_backtest(candles, use_g3: bool) -> list:
+    """기존 run_backtest 루프 (history = candles[:i])"""
+    engine = make_engine(use_g3)
+    open_trades = {}
+    pnls = []
+    
+    for i, candle in enumerate(candles):
+        direction = check_stb_entry(candle, candles[:i])
+        if direction:
+            tid = f"T{i}"
+            engine.open_position(tid, direction, candle["close"], candle["time"])
+            open_trades[tid] = True
+        
+        for tid in list(open_trades.keys()):
+            exit_type, pnl = engine.update_position(
+                tid, high=candle["high"], low=candle["low"], close=candle["close"])
+            if exit_type:
+                pnls.append(pnl)
+                del open_trades[tid]
+    
+    return pnls
+
+
+def test_single_pass_matches_reference():
+    """테스트 1: CORE/G3 단일 패스 == 두 번의 기존 백테스트"""
+    candles = random_walk_candles(seed=21)
+    
+    pnls = StreamingBacktest().run(iter(candles))
+    
+    assert pnls["CORE"] == reference_backtest(candles, use_g3=False)
+    assert pnls["G3"] == reference_backtest(candles, use_g3=True)
+    assert len(pnls["G3"]) > 0
+
+
+def test_run_arrays_matches_run():
+    """테스트 2: 배열 입력 경로 == dict 입력 경로"""
+    candles = random_walk_candles(seed=3)
+    columns = {k: np.array([c[k] for c in candles]) for k in ("open", "high", "low", "close")}
+    
+    expected = StreamingBacktest().run(candles)
+    actual = StreamingBacktest().run_arrays(
+        columns["open"], columns["high"], columns["low"], columns["close"])
+    
+    assert actual == expected
+
+
+def test_run_arrays_then_stream():
+    """테스트 3: 배열 경로 후 스트리밍 경로로 이어 처리"""
+    candles = random_walk_candles(seed=5)
+    head = {k: np.array([c[k] for c in candles[:1800]]) for k in ("open", "high", "low", "close")}
+    
+    runner = StreamingBacktest()
+    runner.run_arrays(head["open"], head["high"], head["low"], head["close"])
+    actual = runner.run(candles[1800:])
+    
+    assert actual == StreamingBacktest().run(candles)
+    assert runner.bars == len(candles)
+    
+    with pytest.raises(RuntimeError, match="fresh"):
+        runner.run_arrays(head["open"], head["high"], head["low"], head["close"])
+
+
+if __name__ == "__main__":
+    test_single_pass_matches_reference()
+    test_run_arrays_matches_run()
+    test_run_arrays_then_stream()
+    print("✅ streaming backtest tests passed")
@@ -0,0 +1,130 @@
+"""
+θ 엔진 테스트
+=============
+
+확인 항목:
+1. ThetaEngine.compute_batch == ThetaEngine.compute (bar 단위 θ)
+2. 전이 인덱스는 같은 lifecycle 내부 변화만 포함
+3. RLE 히스토리: run별 마지막 상태 + cap 초과 시 오래된 run 삭제, slice → list
+4. ThetaBook.update == trade별 ThetaEngine.compute (슬롯 재사용 포함)
+5. ThetaBook capacity=0에서도 open 시 확장
+"""
+
+import os
+import random
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.theta_state import ThetaEngine
+from core.theta_book import ThetaBook
+
+
+def test_compute_batch_matches_scalar():
+    rng = random.Random(5)
+    n = 5000
+    mfe = [rng.choice([0.0, -1.0, 5.0, 10.0, 14.99, 15.0, rng.uniform(-5, 25)]) for _ in range(n)]
+    bars = [rng.randint(0, 6) for _ in range(n)]
+    impulse = [rng.randint(0, 5) for _ in range(n)]
+    recovery = [rng.uniform(0, 8) for _ in range(n)]
+    
+    theta, _ = ThetaEngine.compute_batch(mfe, bars, impulse, recovery)
+    
+    engine = ThetaEngine()
+    expected = [engine.compute(*args).value for args in zip(mfe, bars, impulse, recovery)]
+    
+    assert theta.dtype == np.int8
+    assert theta.tolist() == expected
+
+
+def test_transitions_respect_lifecycle_groups():
+    mfe = [0, 5, 12, 20, 0, 5]
+    bars = [0, 1, 2, 3, 0, 1]
+    groups = [0, 0, 0, 0, 1, 1]
+    
+    theta, transitions = ThetaEngine.compute_batch(mfe, bars, groups=groups)
+    
+    assert theta.tolist() == [0, 1, 1, 3, 0, 1]
+    assert transitions.tolist() == [1, 3, 5]
+
+
+def test_history_run_length_encoded_and_capped():
+    engine = ThetaEngine(history_cap=3)
+    for bar, mfe in enumerate([0, 5, 6, 12, 20, 25, 3]):
+        engine.compute(mfe, bar)
+    
+    history = engine.get_history()
+    assert [(s.value, s.bars_in_state, s.mfe) for s in history] == [
+        (1, 3, 12), (3, 5, 25), (1, 6, 3),
+    ]
+    assert history.dropped == 1
+    
+    theta, entry_bar, duration = history.to_arrays()
+    assert theta.tolist() == [1, 3, 1]
+    assert entry_bar.tolist() == [1, 4, 6]
+    assert duration.tolist() == [2, 1, 0]
+    
+    # slice → list (기존 list 반환과 같은 의미)
+    assert [s.value for s in history[-2:]] == [3, 1]
+    assert [s.value for s in history[::-1]] == [1, 3, 1]
+    assert history[5:] == [] and isinstance(history[:], list)
+    with pytest.raises(TypeError):
+        history[0] = history[1]
+    
+    engine.reset()
+    assert len(engine.get_history()) == 1
+    assert engine.get_history()[-1].value == 0
+
+
+def test_theta_book_matches_engines():
+    rng = random.Random(9)
+    book = ThetaBook(capacity=2)
+    engines = {}
+    count = 0
+    
+    for _ in range(600):
+        if rng.random() < 0.2:
+            trade_id = f"T{count}"
+            count += 1
+            book.open(trade_id)
+            engines[trade_id] = ThetaEngine()
+        if engines and rng.random() < 0.1:
+            trade_id = rng.choice(sorted(engines))
+            assert book.close(trade_id).value == engines.pop(trade_id).current_state.value
+        
+        mfe = np.array([rng.uniform(-3, 20) for _ in range(book.capacity)])
+        impulse = np.array([rng.randint(0, 5) for _ in range(book.capacity)])
+        recovery = np.array([rng.uniform(0, 8) for _ in range(book.capacity)])
+        
+        expected = []
+        for trade_id, engine in engines.items():
+            slot = book.slot_of(trade_id)
+            before = engine.current_state.value
+            bars = int(book.bars[slot]) + 1
+            after = engine.compute(mfe[slot], bars, impulse[slot], recovery[slot]).value
+            if after != before:
+                expected.append((trade_id, before, after))
+        
+        assert book.update(mfe, impulse_count=impulse, recovery_time=recovery) == expected
+        for trade_id, engine in engines.items():
+            assert book.get_state(trade_id) == engine.current_state
+
+
+def test_theta_book_zero_capacity():
+    book = ThetaBook(capacity=0)
+    assert book.capacity == 1
+    for i in range(5):
+        assert book.open(f"T{i}") == i
+    assert len(book) == 5 and book.capacity >= 5
+
+
+if __name__ == "__main__":
+    test_compute_batch_matches_scalar()
+    test_transitions_respect_lifecycle_groups()
+    test_history_run_length_encoded_and_capped()
+    test_theta_book_matches_engines()
+    test_theta_book_zero_capacity()
+    print("✅ theta state tests passed")
@@ -0,0 +1,135 @@
+"""
+Tick Bar Aggregator 테스트
+==========================
+
+확인 항목:
+1. 틱 모드 == 집계 봉 update_position (청산 유형 / PnL, 빈 버킷 포함)
+   - 봉 안 틱 순서: 유리한 극값 → 불리한 극값 → 종가 (방향별로 비교)
+2. 봉 경계: 버킷 시작 시각 틱은 새 봉, LWS는 새 봉 시작에서 발동
+3. 빈 버킷도 경과 봉으로 계산 (flat 봉)
+4. 이전 틱보다 이른 틱은 ValueError
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.v7_energy_engine import V7EnergyEngine, StreamingSTBDetector
+from live.tick_aggregator import TickBarAggregator
+from _raw_original.tests.candle_data import random_walk_candles
+
+
+TF = 60.0
+
+
+def build_ticks(candles: list, favorable: str, seed: int = 3):
+    """캔들 → (틱, 기대 집계 봉), 5% 버킷은 틱 없음 (직전 종가 flat 봉)"""
+    rng = random.Random(seed)
+    ticks, bars = [], []
+    for i, candle in enumerate(candles):
+        h, l, c = candle["high"], candle["low"], candle["close"]
+        if bars and rng.random() < 0.05:
+            prev = bars[-1][3]
+            bars.append((prev, prev, prev, prev))
+            continue
+        first, second = (h, l) if favorable == "LONG" else (l, h)
+        ticks += [(i * TF + 5, first, 1.0), (i * TF + 20, second, 1.0), (i * TF + 40, c, 1.0)]
+        bars.append((first, h, l, c))
+    return ticks, bars
+
+
+def reference_exits(bars: list) -> dict:
+    """봉 모드: 기존 포지션 update_position → 마감가 진입 (진입 봉 = 경과 봉 1)"""
+    engine = V7EnergyEngine(archive_size=0)
+    detector = StreamingSTBDetector()
+    exits, directions = {}, {}
+    for o, h, l, c in bars:
+        for trade_id in list(engine.positions):
+            exit_type, pnl = engine.update_position(trade_id, h, l, c)
+            if exit_type:
+                exits[trade_id] = (exit_type, pnl)
+
+        direction = detector.push(o, h, l, c)
+        if direction:
+            trade_id = f"T{len(directions)}"
+            directions[trade_id] = direction
+            engine.open_position(trade_id, direction, c, "")
+            engine.update_position(trade_id, c, c, c)
+    return exits, directions
+
+
+@pytest.mark.parametrize("favorable", ["LONG", "SHORT"])
+def test_tick_mode_matches_bar_mode(favorable):
+    ticks, bars = build_ticks(random_walk_candles(4000, seed=17), favorable)
+    emitted = []
+    aggregator = TickBarAggregator(V7EnergyEngine(archive_size=0), timeframe=TF,
+                                   on_bar=emitted.append)
+    actual = {tid: (t, pnl) for tid, t, pnl in aggregator.run(ticks)}
+    expected, directions = reference_exits(bars)
+
+    assert [(b.open, b.high, b.low, b.close) for b in emitted] == bars
+    assert [b.start for b in emitted] == [i * TF for i in range(len(bars))]
+
+    same_side = {tid for tid, d in directions.items() if d == favorable}
+    assert same_side
+    assert {t: actual[t] for t in actual if t in same_side} == \
+        {t: expected[t] for t in expected if t in same_side}
+
+
+def test_bar_boundary_and_lws():
+    engine = V7EnergyEngine()
+    aggregator = TickBarAggregator(engine, timeframe=TF, auto_entry=False)
+    aggregator.on_tick(0.0, 100.0)
+    engine.open_position("T1", "LONG", 100.0, "0")
+    engine.start_bar("T1")                               # 진입 봉 = 1
+
+    aggregator.on_tick(59.999, 100.5)                    # 같은 봉
+    assert engine.positions["T1"].bars == 1
+    aggregator.on_tick(60.0, 100.5)                      # 버킷 시작 → 새 봉
+    assert aggregator.last_bar.close == 100.5 and engine.positions["T1"].bars == 2
+
+    assert aggregator.on_tick(179.0, 87.0) == []         # 3봉째: SL 30 유지
+    assert engine.positions["T1"].sl == 30.0
+    assert aggregator.on_tick(180.0, 87.0) == [("T1", "LOSS", -12.0)]   # 4봉 시작 → SL 12
+
+
+def test_empty_buckets_count_as_bars():
+    engine = V7EnergyEngine()
+    emitted = []
+    aggregator = TickBarAggregator(engine, timeframe=TF, auto_entry=False, on_bar=emitted.append)
+    aggregator.on_tick(0.0, 100.0)
+    engine.open_position("T1", "SHORT", 100.0, "0")
+    engine.start_bar("T1")
+
+    # 60 ~ 239 틱 없음 → flat 봉 3개, 240 틱이 5번째 봉
+    aggregator.on_tick(240.0, 100.2)
+    assert [b.start for b in emitted] == [0.0, 60.0, 120.0, 180.0]
+    assert all(b.ticks == 0 and b.close == 100.0 for b in emitted[1:])
+    assert engine.positions["T1"].bars == 5 and engine.positions["T1"].sl == 12.0
+
+    # flush 후 첫 틱은 새 세션 (빈 버킷 채우지 않음)
+    aggregator.flush()
+    aggregator.on_tick(3600.0, 100.1)
+    assert len(emitted) == 5 and engine.positions["T1"].bars == 6
+
+
+def test_out_of_order_tick_rejected():
+    aggregator = TickBarAggregator(timeframe=TF)
+    aggregator.on_tick(120.0, 100.0)
+    aggregator.on_tick(120.0, 100.5)                     # 같은 시각 허용
+    with pytest.raises(ValueError, match="out of order"):
+        aggregator.on_tick(119.9, 101.0)
+    assert aggregator.bar.close == 100.5 and aggregator.bar.ticks == 2
+
+
+if __name__ == "__main__":
+    test_tick_mode_matches_bar_mode("LONG")
+    test_tick_mode_matches_bar_mode("SHORT")
+    test_bar_boundary_and_lws()
+    test_empty_buckets_count_as_bars()
+    test_out_of_order_tick_rejected()
+    print("✅ tick aggregator tests passed")
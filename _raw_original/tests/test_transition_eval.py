@@ -0,0 +1,69 @@
+"""
+전이 센서 배치 평가 테스트
+==========================
+
+확인 항목:
+1. evaluate_sensor_batch == final_validation.evaluate_sensor (impulse>2 + recovery<4)
+2. roc_surface == threshold 쌍별 evaluate_sensor_batch
+3. lead time: TP 이벤트만 집계
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from analysis.transition_eval import evaluate_sensor_batch, roc_surface
+from _raw_original.experiments.final_validation import generate_events, evaluate_sensor
+
+
+def test_batch_matches_event_loop():
+    events = generate_events(2000, seed=7)
+    impulse = [e.impulse_count for e in events]
+    recovery = [e.recovery_time for e in events]
+    labels = [e.reaches_lockin for e in events]
+    
+    expected = evaluate_sensor(events, True, True)
+    result = evaluate_sensor_batch(impulse, recovery, labels)
+    
+    for key in ("precision", "recall", "f1", "tp", "fp"):
+        assert abs(result[key] - expected[key]) < 1e-12
+
+
+def test_roc_surface_matches_pointwise():
+    rng = np.random.default_rng(3)
+    n = 3000
+    labels = rng.random(n) < 0.4
+    impulse = rng.integers(0, 6, n)
+    recovery = np.round(rng.uniform(0, 8, n), 1)
+    a_grid, b_grid = [0, 1, 2, 2.5, 3, 5], [1, 2, 3.5, 4, 7]
+    
+    surface = roc_surface(impulse, recovery, labels, a_grid, b_grid)
+    
+    for i, a in enumerate(a_grid):
+        for j, b in enumerate(b_grid):
+            r = evaluate_sensor_batch(impulse, recovery, labels,
+                                      impulse_threshold=a, recovery_threshold=b)
+            assert (r["tp"], r["fp"], r["fn"], r["tn"]) == (
+                surface.tp[i, j], surface.fp[i, j], surface.fn[i, j], surface.tn[i, j])
+
+
+def test_lead_time_counts_true_positives_only():
+    result = evaluate_sensor_batch(
+        impulse_count=[3, 3, 1, 3],
+        recovery_time=[2.0, 2.0, 2.0, 5.0],
+        labels=[True, False, True, True],
+        event_time=[0, 0, 0, 0],
+        lockin_time=[10, np.nan, 20, 30],
+    )
+    assert result["lead_time"]["count"] == 1
+    assert result["lead_time"]["mean"] == 10.0
+
+
+if __name__ == "__main__":
+    test_batch_matches_event_loop()
+    test_roc_surface_matches_pointwise()
+    test_lead_time_counts_true_positives_only()
+    print("✅ transition eval tests passed")
@@ -0,0 +1,68 @@
+"""
+전이 센서 feature 추출 테스트
+=============================
+
+확인 항목:
+1. impulse: MFE를 2pt 이상 갱신한 봉 수
+2. recovery: pullback 이후 고점 재갱신까지 봉 수 (회복 중이면 경과 봉 수)
+3. check_transition 연결 (θ=2 조건)
+4. 잘못된 방향은 ValueError (SHORT로 취급하지 않음)
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.transition_features import TransitionFeatureExtractor
+
+
+def test_long_impulse_and_recovery():
+    ext = TransitionFeatureExtractor()
+    ext.open("T1", "LONG", 100.0)
+    
+    bars = [
+        (103.0, 100.0),   # impulse 1 (MFE 3)
+        (106.0, 103.0),   # impulse 2 (MFE 6)
+        (105.0, 104.0),   # pullback (6 - 4 = 2pt)
+        (105.5, 104.5),   # 회복 중
+        (109.0, 105.0),   # impulse 3, 회복 3봉
+    ]
+    results = [ext.update("T1", h, l) for h, l in bars]
+    
+    assert ext.get_features("T1") == (3, 3.0)
+    assert results[-1].triggered
+    assert not results[1].triggered
+
+
+def test_short_recovery_in_progress_and_on_bar():
+    ext = TransitionFeatureExtractor()
+    ext.open("S1", "SHORT", 100.0)
+    ext.open("L1", "LONG", 100.0)
+    
+    ext.on_bar(100.5, 96.0)     # S1 impulse (MFE 4)
+    for _ in range(5):
+        ext.on_bar(99.0, 97.5)  # S1 pullback 지속
+    
+    assert ext.get_features("S1") == (1, 5.0)
+    assert ext.get_features("L1") == (0, 5.0)
+    assert ext.close("S1") == (1, 5.0)
+    assert ext.get_features("S1") is None
+    assert list(ext.on_bar(101.0, 100.0)) == ["L1"]
+
+
+def test_invalid_direction():
+    ext = TransitionFeatureExtractor()
+    for bad in ("long", "BUY", None):
+        with pytest.raises(ValueError, match="Unknown direction"):
+            ext.open("T1", bad, 100.0)
+    assert not ext.trades
+
+
+if __name__ == "__main__":
+    test_long_impulse_and_recovery()
+    test_short_recovery_in_progress_and_on_bar()
+    test_invalid_direction()
+    print("✅ transition feature tests passed")
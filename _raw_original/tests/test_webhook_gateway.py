@@ -0,0 +1,258 @@
+"""
+Webhook Gateway 테스트
+=====================
+
+확인 항목:
+1. HTTP 왕복: opa_gate 판정 / 결과 기록 → Layer 2 차단 / 오류 응답
+2. 같은 zone 요청은 도착 순서대로 직렬화, 다른 zone은 대기하지 않음
+3. 동시 webhook burst: 전부 처리, ALLOW만 발송, 발송 실패는 판정과 분리,
+   end-to-end p99 (zone lock 대기 포함) 예산 이내
+4. 게이트 예외 → 500 + 연결 종료, 서버 / zone lock은 계속 정상
+5. idle / 느린 본문 연결 → read_timeout 후 408 + 연결 종료
+6. 실제 opa_gate burst: 판정 == 순차 LiveOPAIntegration, end-to-end p99 예산 이내
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from opa.live_integration import LiveOPAIntegration
+from opa.main_integration import opa_reset_daily
+from opa.webhook_gateway import WebhookGateway, OutboundDispatcher
+
+
+P99_BUDGET_NS = 250_000_000   # burst end-to-end p99 상한 (bucket 상한 기준)
+
+
+class Outbox:
+    """로컬 발송 대상 (Telegram 대역)"""
+
+    def __init__(self, fail_every: int = 0):
+        self.sent = []
+        self.calls = 0
+        self.fail_every = fail_every
+
+    async def send(self, payload):
+        self.calls += 1
+        fail = self.fail_every and self.calls % self.fail_every == 0
+        await asyncio.sleep(0)
+        if fail:
+            raise ConnectionError("telegram down")
+        self.sent.append(payload)
+
+
+async def http(port: int, method: str, path: str, body=None):
+    """로컬 HTTP 클라이언트 → (status, json)"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    if body is None:
+        data = b""
+    elif isinstance(body, bytes):
+        data = body
+    else:
+        data = json.dumps(body).encode("utf-8")
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: local\r\n"
+                 f"Content-Length: {len(data)}\r\n\r\n".encode("latin-1") + data)
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    head, _, payload = raw.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(payload)
+
+
+def webhook(signal: str, theta: int, price: float = 21550.0, state: str = "OVERBOUGHT"):
+    return {"signal_type": signal, "direction": "SHORT", "current_price": price,
+            "theta": theta, "state": state}
+
+
+def test_http_roundtrip():
+    async def scenario():
+        opa_reset_daily()
+        outbox = Outbox()
+        gateway = WebhookGateway(OutboundDispatcher(outbox.send, workers=2))
+        port = await gateway.start()
+
+        assert (await http(port, "POST", "/webhook", webhook("STB숏", 3)))[1]["allowed"]
+        assert not (await http(port, "POST", "/webhook", webhook("SCALP_A", 0)))[1]["allowed"]
+
+        loss = {"direction": "SHORT", "current_price": 21550.0, "is_win": False,
+                "state": "OVERBOUGHT"}
+        for _ in range(2):
+            assert await http(port, "POST", "/result", loss) == (200, {"recorded": True})
+        status, body = await http(port, "POST", "/webhook", webhook("STB숏", 5))
+        assert status == 200 and not body["allowed"] and "Layer 2" in body["reason"]
+
+        assert (await http(port, "POST", "/webhook", b"{not json"))[0] == 400
+        assert (await http(port, "POST", "/webhook", {"direction": "SHORT"}))[0] == 400
+        assert (await http(port, "GET", "/nowhere"))[0] == 404
+
+        status, stats = await http(port, "GET", "/status")
+        assert (status, stats["allowed"], stats["denied"], stats["rejected"]) == (200, 1, 2, 2)
+
+        await gateway.stop()
+        assert [p["theta"] for p in outbox.sent] == [3]
+        opa_reset_daily()
+
+    asyncio.run(scenario())
+
+
+def test_zone_serialization():
+    async def scenario():
+        calls = []
+
+        def gate(signal_type, direction, current_price, theta, state, spread):
+            calls.append((state, signal_type))
+            return True, "OK"
+
+        outbox = Outbox()
+        gateway = WebhookGateway(OutboundDispatcher(outbox.send), gate=gate)
+        await gateway.dispatcher.start()
+
+        busy = webhook("A0", 1, state="SIDEWAYS")
+        async with gateway._zone(gateway.zone_key(busy)):
+            waiting = [asyncio.create_task(gateway.handle_webhook(webhook(f"A{i}", 1, state="SIDEWAYS")))
+                       for i in range(1, 4)]
+            # 다른 zone은 잠긴 zone을 기다리지 않음
+            assert await asyncio.wait_for(gateway.handle_webhook(webhook("B", 1)), 1.0)
+            await asyncio.sleep(0)
+            assert calls == [("OVERBOUGHT", "B")]
+            await asyncio.sleep(0.01)
+
+        await asyncio.gather(*waiting)
+        assert [name for state, name in calls if state == "SIDEWAYS"] == ["A1", "A2", "A3"]
+        stats = gateway.get_stats()
+        assert stats["active_zones"] == 0
+        # 잠긴 zone 대기 시간도 end-to-end 지연에 포함
+        assert stats["lock_wait_ns"]["count"] == stats["latency_ns"]["count"] == 4
+        assert stats["latency_ns"]["p99"] >= stats["lock_wait_ns"]["p99"] >= 10_000_000
+        await gateway.stop()
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_burst():
+    async def scenario():
+        def gate(signal_type, direction, current_price, theta, state, spread):
+            return theta >= 1, f"θ={theta}"
+
+        outbox = Outbox(fail_every=10)
+        gateway = WebhookGateway(OutboundDispatcher(outbox.send, workers=8, maxsize=64), gate=gate)
+        port = await gateway.start()
+
+        payloads = [webhook("STB숏", i % 3, price=21000.0 + 37.0 * (i % 20)) for i in range(300)]
+        results = await asyncio.gather(*(http(port, "POST", "/webhook", p) for p in payloads))
+        await gateway.stop()
+
+        allowed = sum(body["allowed"] for _, body in results)
+        assert allowed == sum(p["theta"] >= 1 for p in payloads)
+
+        stats = gateway.get_stats()
+        latency = stats["latency_ns"]
+        assert latency["count"] == stats["lock_wait_ns"]["count"] == len(payloads)
+        assert latency["p50"] <= latency["p99"] <= P99_BUDGET_NS
+        assert stats["dispatcher"]["sent"] + stats["dispatcher"]["failed"] == allowed
+        assert stats["dispatcher"]["failed"] == allowed // 10
+        assert stats["dispatcher"]["pending"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_gate_error_returns_500():
+    async def scenario():
+        def gate(signal_type, direction, current_price, theta, state, spread):
+            if signal_type == "BOOM":
+                raise RuntimeError("gate failure")
+            return True, "OK"
+
+        outbox = Outbox()
+        gateway = WebhookGateway(OutboundDispatcher(outbox.send), gate=gate)
+        port = await gateway.start()
+
+        # http()는 EOF까지 읽음 → 반환 = 서버가 연결을 닫음
+        assert await http(port, "POST", "/webhook", webhook("BOOM", 1)) == \
+            (500, {"error": "Internal Server Error"})
+        assert (await http(port, "POST", "/webhook", webhook("STB숏", 1)))[1]["allowed"]
+
+        status, stats = await http(port, "GET", "/status")
+        assert (status, stats["errors"], stats["allowed"], stats["active_zones"]) == (200, 1, 1, 0)
+        await gateway.stop()
+
+    asyncio.run(scenario())
+
+
+def test_read_timeout():
+    async def scenario():
+        outbox = Outbox()
+        gateway = WebhookGateway(OutboundDispatcher(outbox.send), read_timeout=0.1)
+        port = await gateway.start()
+
+        async def stalled(data: bytes):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(data)
+            await writer.drain()
+            raw = await asyncio.wait_for(reader.read(), 2.0)    # EOF = 서버가 연결을 닫음
+            writer.close()
+            return raw.split(b"\r\n", 1)[0]
+
+        assert await stalled(b"") == b"HTTP/1.1 408 Request Timeout"
+        assert await stalled(b"POST /webhook HTTP/1.1\r\nHost: local\r\n") == \
+            b"HTTP/1.1 408 Request Timeout"
+        assert await stalled(b"POST /webhook HTTP/1.1\r\nContent-Length: 100\r\n\r\n{") == \
+            b"HTTP/1.1 408 Request Timeout"
+
+        status, stats = await http(port, "GET", "/status")
+        assert (status, stats["timeouts"], stats["allowed"]) == (200, 3, 0)
+        await gateway.stop()
+
+    asyncio.run(scenario())
+
+
+def test_real_gate_burst():
+    names = ["STB숏", "SCALP_A", "숏-정체", "매수스팟"]
+    payloads = [webhook(names[i % 4], i % 3, price=21000.0 + 37.0 * (i % 20),
+                        state=("OVERBOUGHT", "OVERSOLD")[i % 2]) for i in range(300)]
+
+    # 순차 기준: 신호 ID를 요청마다 달리해 중복 호출 차단을 배제
+    reference = LiveOPAIntegration()
+    expected = [
+        reference.check_and_execute(signal_id=f"R{i}", signal_name=p["signal_type"], state=p["state"],
+                                    theta=p["theta"], direction=p["direction"],
+                                    current_price=p["current_price"]).details
+        for i, p in enumerate(payloads)
+    ]
+
+    async def scenario():
+        opa_reset_daily()
+        outbox = Outbox()
+        gateway = WebhookGateway(OutboundDispatcher(outbox.send, workers=8, maxsize=64))
+        port = await gateway.start()
+        results = await asyncio.gather(*(http(port, "POST", "/webhook", p) for p in payloads))
+        await gateway.stop()
+        opa_reset_daily()
+        return gateway.get_stats(), results, outbox
+
+    stats, results, outbox = asyncio.run(scenario())
+
+    # opa_gate는 같은 초에 연속된 같은 신호를 중복 호출로 차단 (DENY 쪽으로만 달라짐)
+    for (status, body), reason in zip(results, expected):
+        assert status == 200
+        assert body["reason"] in (reason, "Duplicate call blocked")
+        assert body["allowed"] == (body["reason"].startswith("Allowed"))
+    allowed = sum(body["allowed"] for _, body in results)
+    assert 0 < allowed and len(outbox.sent) == stats["allowed"] == allowed
+
+    latency = stats["latency_ns"]
+    assert latency["count"] == len(payloads)
+    assert latency["p50"] <= latency["p99"] <= P99_BUDGET_NS
+
+
+if __name__ == "__main__":
+    test_http_roundtrip()
+    test_zone_serialization()
+    test_concurrent_burst()
+    test_gate_error_returns_500()
+    test_read_timeout()
+    test_real_gate_burst()
+    print("✅ webhook gateway tests passed")
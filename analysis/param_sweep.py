@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Energy Engine Parameter Sweep
+- V7EnergyEngine 상수 grid를 프로세스 풀로 병렬 재생
+- 캔들 OHLC + STB 신호는 shared memory 1벌만 생성 (워커는 view만 attach)
+- STB 진입은 파라미터와 무관 → 부모 프로세스에서 한 번만 스캔
+- 결과: grid point별 EV / 승률 / Max DD 표 (list of dict)
+- use_g3: grid 차원 (기본 True = G3 ON, False = make_engine의 CORE baseline)
+  상수 축(LWS_BARS 등)을 함께 주면 상수 축이 우선한다
+
+H0-4 임계 안정성 (EV plateau) 확인용. core 파라미터를 수정하지 않는다.
+"""
+
+import itertools
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, is_dataclass
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.backtest import StreamingBacktest, make_engine
+from core.v7_energy_engine import scan_stb_signals
+
+
+SWEEP_PARAMS = (
+    "MFE_THRESHOLD",
+    "TRAIL_OFFSET",
+    "LWS_BARS",
+    "LWS_MFE_THRESHOLD",
+    "DEFENSE_SL",
+    "DEFAULT_SL",
+)
+
+# 엔진 상수가 아닌 grid 차원 (make_engine 인자)
+SWEEP_FLAGS = ("use_g3",)
+
+# 워커 프로세스 전역 (shared memory view)
+_worker_shm = None
+_worker_arrays = None
+
+
+def build_grid(configs: Sequence = (), **axes: Iterable) -> List[Dict]:
+    """
+    파라미터 grid 생성
+
+    configs: G3DefenseConfig / MFE5HarvestConfig 등 frozen dataclass 또는 dict
+    axes: 파라미터별 값 목록 (예: MFE_THRESHOLD=[5, 6, 7], use_g3=[False, True])
+    → configs × axes 데카르트 곱
+    """
+    bases = [asdict(c) if is_dataclass(c) else dict(c) for c in configs] or [{}]
+    names = list(axes)
+
+    grid = []
+    for base in bases:
+        for values in itertools.product(*(axes[k] for k in names)):
+            point = {**base, **dict(zip(names, values))}
+            unknown = set(point) - set(SWEEP_PARAMS) - set(SWEEP_FLAGS)
+            if unknown:
+                raise ValueError(f"Unknown engine parameters: {sorted(unknown)}")
+            grid.append(point)
+    return grid
+
+
+def candles_to_arrays(candles: List[dict]) -> Dict[str, np.ndarray]:
+    """캔들 dict 리스트 → OHLC 배열"""
+    return {k: np.array([c[k] for c in candles], dtype=np.float64)
+            for k in ("open", "high", "low", "close")}
+
+
+def summarize_pnls(pnls: List[float]) -> Dict:
+    """EV / 승률 / Max DD (청산 순서 누적 PnL 기준)"""
+    if not pnls:
+        return {"trades": 0, "win_rate": 0.0, "ev": 0.0, "total_pnl": 0.0, "max_dd": 0.0}
+
+    p = np.asarray(pnls, dtype=np.float64)
+    equity = np.concatenate(([0.0], np.cumsum(p)))
+    drawdown = np.maximum.accumulate(equity) - equity
+
+    return {
+        "trades": len(p),
+        "win_rate": float(np.mean(p > 0)),
+        "ev": float(np.mean(p)),
+        "total_pnl": float(equity[-1]),
+        "max_dd": float(drawdown.max()),
+    }
+
+
+def run_point(arrays: Dict[str, np.ndarray], signal: np.ndarray, point: Dict) -> Dict:
+    """grid point 1개 재생"""
+    engine = make_engine(use_g3=point.get("use_g3", True))
+    for name, value in point.items():
+        if name not in SWEEP_FLAGS:
+            setattr(engine, name, value)
+
+    backtest = StreamingBacktest({"SWEEP": engine})
+    pnls = backtest.run_arrays(arrays["open"], arrays["high"], arrays["low"],
+                               arrays["close"], signal=signal)["SWEEP"]
+    return {**point, **summarize_pnls(pnls)}
+
+
+def _attach(shm_name: str, n: int):
+    """워커 초기화: shared memory attach (복사 없음)"""
+    global _worker_shm, _worker_arrays
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_arrays = _views(_worker_shm.buf, n)
+
+
+def _views(buf, n: int) -> Dict[str, np.ndarray]:
+    ohlc = np.ndarray((4, n), dtype=np.float64, buffer=buf)
+    signal = np.ndarray(n, dtype=np.int8, buffer=buf, offset=ohlc.nbytes)
+    return {
+        "open": ohlc[0],
+        "high": ohlc[1],
+        "low": ohlc[2],
+        "close": ohlc[3],
+        "signal": signal,
+    }
+
+
+def _run_shared(point: Dict) -> Dict:
+    return run_point(_worker_arrays, _worker_arrays["signal"], point)
+
+
+def run_sweep(open_, high, low, close, grid: List[Dict],
+              max_workers: Optional[int] = None) -> List[Dict]:
+    """
+    병렬 파라미터 sweep
+
+    max_workers=0 → 현재 프로세스에서 순차 실행
+    Returns: grid 순서대로의 결과 행 (파라미터 + trades/win_rate/ev/total_pnl/max_dd)
+    """
+    n = len(close)
+    signal = scan_stb_signals(open_, high, low, close).signal
+
+    if max_workers == 0:
+        arrays = {"open": open_, "high": high, "low": low, "close": close}
+        return [run_point(arrays, signal, point) for point in grid]
+
+    shm = shared_memory.SharedMemory(create=True, size=max(n * 4 * 8 + n, 1))
+    try:
+        views = _views(shm.buf, n)
+        for key, column in (("open", open_), ("high", high), ("low", low), ("close", close)):
+            views[key][:] = column
+        views["signal"][:] = signal
+        del views
+
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_attach,
+                                 initargs=(shm.name, n)) as pool:
+            return list(pool.map(_run_shared, grid))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def print_table(rows: List[Dict]):
+    """결과 표 출력"""
+    params = [k for k in SWEEP_FLAGS + SWEEP_PARAMS if any(k in r for r in rows)]
+    header = params + ["trades", "win_rate", "ev", "max_dd"]
+    print("| " + " | ".join(header) + " |")
+    print("|" + "|".join("---" for _ in header) + "|")
+    for r in rows:
+        cells = [str(r.get(k, "-")) for k in params]
+        cells += [str(r["trades"]), f"{r['win_rate']:.3f}", f"{r['ev']:.2f}", f"{r['max_dd']:.1f}"]
+        print("| " + " | ".join(cells) + " |")
+
+
+if __name__ == "__main__":
+    from _raw_original.archive.legacy_experiments.configs import G3DefenseConfig, MFE5HarvestConfig
+
+    rng = np.random.default_rng(42)
+    close = 21500 + np.cumsum(rng.normal(0, 4, 200_000))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    high = np.maximum(open_, close) + np.abs(rng.normal(0, 2, len(close)))
+    low = np.minimum(open_, close) - np.abs(rng.normal(0, 2, len(close)))
+
+    grid = build_grid(
+        configs=[G3DefenseConfig(), MFE5HarvestConfig()],
+        TRAIL_OFFSET=[1.0, 1.5, 2.0],
+    )
+    print_table(run_sweep(open_, high, low, close, grid))
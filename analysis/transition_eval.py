@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Transition Sensor Batch Evaluation
+- θ=2 센서 (impulse_count > a AND recovery_time < b) 배열 단위 평가
+- threshold 1쌍: precision / recall / F1 + lead time 분포
+- threshold grid 전체: 2D 누적합 1회로 ROC surface 계산 (이벤트 루프 없음)
+
+final_validation.evaluate_sensor / theta2_sensor_discovery와 같은 지표 정의.
+"Lead Time 11.4 bars" 재인증용. core 센서 임계값을 수정하지 않는다.
+"""
+
+import os
+import sys
+from dataclasses import dataclass
+from typing import Dict, Sequence
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.transition_sensor import TRANSITION_THRESHOLDS
+
+
+def _ratio(num, den):
+    num = np.asarray(num, dtype=np.float64)
+    den = np.asarray(den, dtype=np.float64)
+    return np.divide(num, den, out=np.zeros(np.broadcast(num, den).shape), where=den > 0)
+
+
+def _f1(precision, recall):
+    return _ratio(2 * precision * recall, precision + recall)
+
+
+def lead_times(event_time, lockin_time, predicted=None, labels=None) -> np.ndarray:
+    """센서 발동 시점 → θ≥3 도달까지 bar 수 (TP만)"""
+    lead = np.asarray(lockin_time, dtype=np.float64) - np.asarray(event_time, dtype=np.float64)
+    mask = np.isfinite(lead)
+    if predicted is not None:
+        mask &= np.asarray(predicted, dtype=bool)
+    if labels is not None:
+        mask &= np.asarray(labels, dtype=bool)
+    return lead[mask]
+
+
+def summarize_lead_times(lead: np.ndarray) -> Dict:
+    """lead time 분포 요약"""
+    if len(lead) == 0:
+        return {"count": 0, "mean": 0.0, "median": 0.0, "p10": 0.0, "p90": 0.0}
+    p10, median, p90 = np.percentile(lead, [10, 50, 90])
+    return {
+        "count": int(len(lead)),
+        "mean": float(lead.mean()),
+        "median": float(median),
+        "p10": float(p10),
+        "p90": float(p90),
+    }
+
+
+def evaluate_sensor_batch(impulse_count, recovery_time, labels,
+                          event_time=None, lockin_time=None,
+                          impulse_threshold: float = TRANSITION_THRESHOLDS["impulse_count"],
+                          recovery_threshold: float = TRANSITION_THRESHOLDS["recovery_time"]) -> Dict:
+    """
+    threshold 1쌍 평가 (벡터)
+
+    labels: θ≥3 도달 여부 (Y=1)
+    event_time / lockin_time: 센서 발동 bar / θ≥3 도달 bar (미도달은 NaN)
+    """
+    impulse = np.asarray(impulse_count)
+    recovery = np.asarray(recovery_time, dtype=np.float64)
+    actual = np.asarray(labels, dtype=bool)
+    predicted = (impulse > impulse_threshold) & (recovery < recovery_threshold)
+
+    tp = int(np.count_nonzero(predicted & actual))
+    fp = int(np.count_nonzero(predicted & ~actual))
+    fn = int(np.count_nonzero(~predicted & actual))
+    tn = int(len(actual) - tp - fp - fn)
+
+    precision = float(_ratio(tp, tp + fp))
+    recall = float(_ratio(tp, tp + fn))
+
+    result = {
+        "impulse_threshold": impulse_threshold,
+        "recovery_threshold": recovery_threshold,
+        "precision": precision,
+        "recall": recall,
+        "f1": float(_f1(precision, recall)),
+        "tp": tp,
+        "fp": fp,
+        "fn": fn,
+        "tn": tn,
+    }
+    if event_time is not None and lockin_time is not None:
+        result["lead_time"] = summarize_lead_times(
+            lead_times(event_time, lockin_time, predicted, actual))
+    return result
+
+
+@dataclass
+class ROCSurface:
+    """threshold grid 전체 지표 (shape: impulse × recovery)"""
+    impulse_thresholds: np.ndarray
+    recovery_thresholds: np.ndarray
+    tp: np.ndarray
+    fp: np.ndarray
+    fn: np.ndarray
+    tn: np.ndarray
+
+    @property
+    def precision(self) -> np.ndarray:
+        return _ratio(self.tp, self.tp + self.fp)
+
+    @property
+    def recall(self) -> np.ndarray:
+        return _ratio(self.tp, self.tp + self.fn)
+
+    @property
+    def fpr(self) -> np.ndarray:
+        return _ratio(self.fp, self.fp + self.tn)
+
+    @property
+    def f1(self) -> np.ndarray:
+        return _f1(self.precision, self.recall)
+
+    def best(self) -> Dict:
+        """F1 최대 threshold 쌍"""
+        i, j = np.unravel_index(np.argmax(self.f1), self.f1.shape)
+        return {
+            "impulse_threshold": float(self.impulse_thresholds[i]),
+            "recovery_threshold": float(self.recovery_thresholds[j]),
+            "precision": float(self.precision[i, j]),
+            "recall": float(self.recall[i, j]),
+            "f1": float(self.f1[i, j]),
+        }
+
+
+def roc_surface(impulse_count, recovery_time, labels,
+                impulse_thresholds: Sequence[float],
+                recovery_thresholds: Sequence[float]) -> ROCSurface:
+    """
+    threshold grid 전체 confusion 행렬
+
+    이벤트를 (impulse bin, recovery bin) 2D 히스토그램으로 한 번 집계한 뒤
+    impulse 축은 역누적 (impulse > a), recovery 축은 정누적 (recovery < b)
+    """
+    a = np.sort(np.asarray(impulse_thresholds, dtype=np.float64))
+    b = np.sort(np.asarray(recovery_thresholds, dtype=np.float64))
+    impulse = np.asarray(impulse_count, dtype=np.float64)
+    recovery = np.asarray(recovery_time, dtype=np.float64)
+    actual = np.asarray(labels, dtype=bool)
+
+    # impulse > a[i]  ⇔  i < ib,   recovery < b[j]  ⇔  j >= rb
+    ib = np.searchsorted(a, impulse, side="left")
+    rb = np.searchsorted(b, recovery, side="right")
+    shape = (len(a) + 1, len(b) + 1)
+    flat = ib * shape[1] + rb
+
+    def cumulative(mask):
+        hist = np.bincount(flat[mask], minlength=shape[0] * shape[1]).reshape(shape)
+        above = np.cumsum(hist[::-1], axis=0)[::-1][1:]
+        return np.cumsum(above, axis=1)[:, :len(b)]
+
+    tp = cumulative(actual)
+    fp = cumulative(~actual)
+    positives = int(np.count_nonzero(actual))
+    negatives = len(actual) - positives
+
+    return ROCSurface(a, b, tp, fp, positives - tp, negatives - fp)
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(42)
+    n = 1_000_000
+    labels = rng.random(n) < 0.5
+    impulse = np.where(labels, 3 + rng.integers(0, 3, n), 1 + rng.integers(0, 2, n))
+    recovery = np.where(labels, 2.5 + rng.normal(0, 0.5, n), 5.5 + rng.normal(0, 1.0, n))
+    event_time = np.zeros(n)
+    lockin_time = np.where(labels, rng.normal(11.4, 2.0, n), np.nan)
+
+    result = evaluate_sensor_batch(impulse, recovery, labels, event_time, lockin_time)
+    print(f"impulse>2 + recovery<4: P={result['precision']:.3f} R={result['recall']:.3f} "
+          f"F1={result['f1']:.3f} lead={result['lead_time']['mean']:.1f} bars")
+
+    surface = roc_surface(impulse, recovery, labels, [0, 1, 2, 3, 4], np.arange(1.0, 8.0, 0.5))
+    print(f"best: {surface.best()}")
@@ -0,0 +1,135 @@
+"""
+Streaming Backtest
+==================
+
+단일 패스 스트리밍 백테스트
+
+- 캔들 iterator를 한 번만 소비 (history 복사 없음, O(n))
+- STB 검출: StreamingSTBDetector (고정 크기 rolling window)
+- 같은 진입을 여러 엔진 변형(CORE / G3)에 동시에 공급
+
+진입/업데이트 순서는 기존 run_backtest와 동일:
+bar i에서 STB 진입 → 진입 봉 포함 모든 오픈 포지션 업데이트
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .v7_energy_engine import (
+    V7EnergyEngine, StreamingSTBDetector, scan_stb_signals,
+    SIGNAL_LONG, SIGNAL_SHORT,
+)
+
+
+SIGNAL_DIRECTIONS = {
+    SIGNAL_LONG: 'LONG',
+    SIGNAL_SHORT: 'SHORT',
+}
+
+
+def make_engine(use_g3: bool = True) -> V7EnergyEngine:
+    """백테스트용 엔진 (아카이브 없음, G3 OFF = baseline)"""
+    engine = V7EnergyEngine(archive_size=0)
+
+    if not use_g3:
+        engine.LWS_BARS = 9999
+        engine.LWS_MFE_THRESHOLD = float("inf")
+
+    return engine
+
+
+class StreamingBacktest:
+    """
+    스트리밍 백테스트 러너
+
+    engines: {이름: V7EnergyEngine} (기본값: CORE + G3)
+    결과: pnls[이름] = 청산 순서대로의 PnL 리스트
+    """
+
+    def __init__(self, engines: Optional[Dict[str, V7EnergyEngine]] = None):
+        if engines is None:
+            engines = {
+                "CORE": make_engine(use_g3=False),
+                "G3": make_engine(use_g3=True),
+            }
+        self.engines = engines
+        self.detector = StreamingSTBDetector()
+        self.pnls: Dict[str, List[float]] = {name: [] for name in engines}
+        self.bars = 0
+        self.trade_count = 0
+
+    def on_bar(self, open_: float, high: float, low: float, close: float,
+               time: str = None):
+        """캔들 1개 처리"""
+        direction = self.detector.push(open_, high, low, close)
+        self._step(direction, high, low, close, time)
+
+    def _step(self, direction: Optional[str], high: float, low: float,
+              close: float, time: str):
+        if direction:
+            trade_id = f"T{self.trade_count}"
+            self.trade_count += 1
+            for engine in self.engines.values():
+                engine.open_position(
+                    trade_id=trade_id,
+                    direction=direction,
+                    entry_price=close,
+                    entry_time=time,
+                )
+
+        for name, engine in self.engines.items():
+            for trade_id in list(engine.positions):
+                exit_type, pnl = engine.update_position(trade_id, high, low, close)
+                if exit_type:
+                    self.pnls[name].append(pnl)
+
+        self.bars += 1
+
+    def run(self, candles: Iterable[dict]) -> Dict[str, List[float]]:
+        """캔들 dict iterator 소비"""
+        for candle in candles:
+            self.on_bar(candle["open"], candle["high"], candle["low"],
+                        candle["close"], candle.get("time"))
+        return self.pnls
+
+    def run_arrays(self, open_, high, low, close, times=None,
+                   signal=None) -> Dict[str, List[float]]:
+        """
+        OHLC 배열 전체 처리 (STB 검출은 scan_stb_signals로 일괄 계산)
+
+        signal: 미리 계산된 scan_stb_signals(...).signal (재사용 시)
+        새 러너에서만 호출 가능 (이미 처리한 봉이 있으면 RuntimeError).
+        끝나면 마지막 BODY_BARS 봉으로 detector를 채워 이후 on_bar / run이 이어진다.
+        """
+        if self.bars or self.detector.count:
+            raise RuntimeError("run_arrays requires a fresh StreamingBacktest")
+        if signal is None:
+            signal = scan_stb_signals(open_, high, low, close).signal
+        entries = np.flatnonzero(signal)
+        h = np.asarray(high, dtype=np.float64)
+        l = np.asarray(low, dtype=np.float64)
+        c = np.asarray(close, dtype=np.float64)
+
+        # 오픈 포지션이 없는 구간은 다음 진입 봉까지 건너뛴다
+        engines = list(self.engines.values())
+        n = len(c)
+        i = 0
+        while i < n:
+            if not signal[i] and not any(e.positions for e in engines):
+                k = np.searchsorted(entries, i)
+                i = int(entries[k]) if k < len(entries) else n
+                continue
+
+            direction = SIGNAL_DIRECTIONS.get(int(signal[i]))
+            time = times[i] if times is not None else None
+            self._step(direction, float(h[i]), float(l[i]), float(c[i]), time)
+            i += 1
+
+        # detector 상태는 최근 BODY_BARS 봉으로 결정된다
+        o = np.asarray(open_, dtype=np.float64)
+        for j in range(max(n - StreamingSTBDetector.BODY_BARS, 0), n):
+            self.detector.push(float(o[j]), float(h[j]), float(l[j]), float(c[j]))
+
+        self.bars = n
+        return self.pnls
@@ -0,0 +1,204 @@
+"""
+Candle Store
+============
+
+컬럼형 캔들 저장소 (memory-mapped 읽기)
+
+디렉터리 1개 = 종목/타임프레임 1개
+- 컬럼당 고정 dtype 바이너리 파일 1개 (time.bin, open.bin, ...)
+- time: epoch seconds (int64, 오름차순), OHLCV: float64
+- 쓰기: append-only (시간 역행 금지), time.bin을 마지막에 기록
+- 저장 건수 = 컬럼 파일 중 가장 짧은 길이 → 쓰기 도중 중단돼도 컬럼이 어긋나지 않음
+  (다음 append가 초과분을 잘라낸 뒤 이어 씀)
+- 읽기: np.memmap (read-only) → 여러 프로세스가 같은 page cache 공유
+- 구간 조회: time 컬럼 binary search → zero-copy view
+
+STB 스캔 / 백테스트 연결:
+    s = CandleStore(path).range("2025-01-01", "2025-07-01")
+    scan_stb_signals(*s.ohlc)
+    StreamingBacktest().run_arrays(*s.ohlc)
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+CANDLE_COLUMNS = {
+    "time": np.dtype("<i8"),
+    "open": np.dtype("<f8"),
+    "high": np.dtype("<f8"),
+    "low": np.dtype("<f8"),
+    "close": np.dtype("<f8"),
+    "volume": np.dtype("<f8"),
+}
+
+META_FILE = "meta.json"
+
+
+def to_epoch_seconds(values) -> np.ndarray:
+    """datetime64 / ISO 문자열 / 숫자 → epoch seconds (int64)"""
+    arr = np.asarray(values)
+    if arr.dtype.kind == "M":
+        return arr.astype("datetime64[s]").astype(np.int64)
+    if arr.dtype.kind in "iu":
+        return arr.astype(np.int64)
+    if arr.dtype.kind == "f":
+        return np.floor(arr).astype(np.int64)
+    return arr.astype("datetime64[s]").astype(np.int64)
+
+
+def candles_to_columns(candles: List[dict]) -> Dict[str, np.ndarray]:
+    """캔들 dict 리스트 → 컬럼 배열 (volume 없으면 0)"""
+    return {
+        "time": to_epoch_seconds([c["time"] for c in candles]),
+        "open": np.array([c["open"] for c in candles], dtype=np.float64),
+        "high": np.array([c["high"] for c in candles], dtype=np.float64),
+        "low": np.array([c["low"] for c in candles], dtype=np.float64),
+        "close": np.array([c["close"] for c in candles], dtype=np.float64),
+        "volume": np.array([c.get("volume", 0.0) for c in candles], dtype=np.float64),
+    }
+
+
+def write_candles(path: str, time, open_, high, low, close, volume=None,
+                  meta: Optional[dict] = None) -> int:
+    """
+    컬럼 append (디렉터리 없으면 생성)
+
+    Returns: 저장 후 전체 캔들 수
+    """
+    columns = {
+        "time": to_epoch_seconds(time),
+        "open": open_,
+        "high": high,
+        "low": low,
+        "close": close,
+        "volume": np.zeros(len(close)) if volume is None else volume,
+    }
+    columns = {k: np.ascontiguousarray(v, dtype=CANDLE_COLUMNS[k]) for k, v in columns.items()}
+
+    n = len(columns["time"])
+    if any(len(v) != n for v in columns.values()):
+        raise ValueError("All candle columns must have the same length")
+    if n > 1 and np.any(np.diff(columns["time"]) < 0):
+        raise ValueError("Candle times must be non-decreasing")
+
+    os.makedirs(path, exist_ok=True)
+    existing = _column_length(path)
+    if existing and n:
+        times = np.memmap(_column_path(path, "time"), dtype=CANDLE_COLUMNS["time"], mode="r")
+        last = int(times[existing - 1])
+        del times
+        if columns["time"][0] < last:
+            raise ValueError(f"Append out of order: {columns['time'][0]} < stored {last}")
+
+    # 중단된 이전 쓰기의 초과분 제거 → time을 마지막에 기록 (time 길이 = 확정 건수)
+    for name in sorted(columns, key=lambda k: k == "time"):
+        column = _column_path(path, name)
+        committed = existing * CANDLE_COLUMNS[name].itemsize
+        if os.path.exists(column) and os.path.getsize(column) > committed:
+            os.truncate(column, committed)
+        with open(column, "ab") as f:
+            f.write(columns[name].tobytes())
+
+    meta_path = os.path.join(path, META_FILE)
+    stored = {}
+    if os.path.exists(meta_path):
+        with open(meta_path) as f:
+            stored = json.load(f)
+    stored.update(meta or {})
+    stored["columns"] = {k: v.str for k, v in CANDLE_COLUMNS.items()}
+    stored["count"] = existing + n
+    with open(meta_path, "w") as f:
+        json.dump(stored, f, indent=2, ensure_ascii=False)
+
+    return existing + n
+
+
+def _column_path(path: str, name: str) -> str:
+    return os.path.join(path, f"{name}.bin")
+
+
+def _column_length(path: str) -> int:
+    """확정 건수 = 가장 짧은 컬럼 길이 (컬럼 파일이 하나라도 없으면 0)"""
+    lengths = []
+    for name, dtype in CANDLE_COLUMNS.items():
+        column = _column_path(path, name)
+        if not os.path.exists(column):
+            return 0
+        lengths.append(os.path.getsize(column) // dtype.itemsize)
+    return min(lengths)
+
+
+@dataclass
+class CandleSlice:
+    """캔들 구간 (모든 컬럼은 memmap view, 복사 없음)"""
+    time: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    @property
+    def ohlc(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        return self.open, self.high, self.low, self.close
+
+    def to_candles(self) -> List[dict]:
+        """기존 캔들 dict 리스트 형태 (복사 발생)"""
+        times = self.time.astype("datetime64[s]").astype(str).tolist()
+        return [
+            {"time": t, "open": float(o), "high": float(h), "low": float(l),
+             "close": float(c), "volume": float(v)}
+            for t, o, h, l, c, v in zip(times, self.open, self.high, self.low,
+                                        self.close, self.volume)
+        ]
+
+
+class CandleStore:
+    """
+    컬럼형 캔들 저장소 (read-only memmap)
+
+    append 이후 새 데이터를 보려면 refresh() 호출
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.refresh()
+
+    def refresh(self):
+        """컬럼 파일 다시 매핑"""
+        n = _column_length(self.path)
+        self.meta = {}
+        meta_path = os.path.join(self.path, META_FILE)
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                self.meta = json.load(f)
+
+        self.columns: Dict[str, np.ndarray] = {}
+        for name, dtype in CANDLE_COLUMNS.items():
+            if n == 0:
+                self.columns[name] = np.empty(0, dtype=dtype)
+                continue
+            column = np.memmap(_column_path(self.path, name), dtype=dtype, mode="r")
+            self.columns[name] = column[:n]
+
+    def __len__(self) -> int:
+        return len(self.columns["time"])
+
+    def range(self, start=None, end=None) -> CandleSlice:
+        """[start, end) 시간 구간 (binary search, zero-copy)"""
+        time = self.columns["time"]
+        lo = 0 if start is None else int(np.searchsorted(time, to_epoch_seconds(start), side="left"))
+        hi = len(time) if end is None else int(np.searchsorted(time, to_epoch_seconds(end), side="left"))
+        return self.slice(lo, hi)
+
+    def slice(self, lo: int = 0, hi: Optional[int] = None) -> CandleSlice:
+        """인덱스 구간"""
+        return CandleSlice(**{name: column[lo:hi] for name, column in self.columns.items()})
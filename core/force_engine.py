@@ -0,0 +1,247 @@
+"""
+Force Engine
+============
+
+FORCE_ENGINE.md의 봉 단위 force state vector (5채널) 계산
+
+채널 (S = SHORT_BARS, L = LONG_BARS, 모두 현재 봉 포함):
+- persistence:  방향 지속성 = (c[t] - c[t-S]) / Σ|Δc| (최근 S개 Δc), -1 ~ 1
+- interference: 미시 간섭 = 최근 S개 Δc 중 직전 Δc와 부호가 뒤집힌 비율, 0 ~ 1
+- resistance:   저항 흔적 = 최근 S봉 평균 꼬리 비율 (range - |body|) / range, 0 ~ 1
+- release:      단기 방출 강도 = 최근 S봉 평균 range / 최근 L봉 평균 range
+- compression:  장기 압축 맥락 = 최근 L봉 평균 range / L봉 채널 range, 0 ~ 1
+
+값은 연속량 (임계값 없음). 처음 L봉은 NaN.
+
+Kill-switch (붕괴 감지, 발생한 봉에서 즉시 플래그):
+- COLLAPSE_REVERSAL:   persistence 부호 반전
+- COLLAPSE_NOISE:      interference가 NOISE_SURGE 상향 돌파
+- COLLAPSE_RESISTANCE: resistance가 RESISTANCE_SURGE 상향 돌파
+
+두 가지 모드 (결과 동일):
+- ForceEngine: 봉당 O(1) (rolling 합 + RollingChannel), state는 in-place 갱신
+- compute_force: OHLC 배열 일괄 계산
+"""
+
+import math
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .rolling_channel import RollingChannel
+
+
+FORCE_CHANNELS = ("persistence", "interference", "resistance", "release", "compression")
+
+PERSISTENCE, INTERFERENCE, RESISTANCE, RELEASE, COMPRESSION = range(5)
+
+COLLAPSE_REVERSAL = 1 << 0
+COLLAPSE_NOISE = 1 << 1
+COLLAPSE_RESISTANCE = 1 << 2
+
+SHORT_BARS = 10
+LONG_BARS = 50
+NOISE_SURGE = 0.6
+RESISTANCE_SURGE = 0.6
+
+
+def _sign(x: float) -> int:
+    return (x > 0) - (x < 0)
+
+
+def _collapse_flags(prev: np.ndarray, cur: np.ndarray) -> int:
+    flags = 0
+    if prev[PERSISTENCE] * cur[PERSISTENCE] < 0:
+        flags |= COLLAPSE_REVERSAL
+    if prev[INTERFERENCE] < NOISE_SURGE <= cur[INTERFERENCE]:
+        flags |= COLLAPSE_NOISE
+    if prev[RESISTANCE] < RESISTANCE_SURGE <= cur[RESISTANCE]:
+        flags |= COLLAPSE_RESISTANCE
+    return flags
+
+
+class ForceEngine:
+    """
+    Force state 스트리밍 엔진 (봉당 O(1))
+
+    state: 최신 5채널 벡터 (in-place 갱신, 객체 고정)
+    view: state의 읽기 전용 view (OPA 계층 공유, 복사 없음)
+    """
+
+    RESYNC_INTERVAL = 10000   # rolling 합 누적 오차 재동기화 주기
+
+    def __init__(self):
+        self.state = np.full(len(FORCE_CHANNELS), np.nan)
+        self.view = self.state.view()
+        self.view.flags.writeable = False
+        self._prev = np.full(len(FORCE_CHANNELS), np.nan)
+        self.reset()
+
+    def reset(self):
+        """상태 리셋"""
+        self.count = 0
+        self.collapse = 0
+        self.state[:] = np.nan
+        self._prev[:] = np.nan
+
+        self._closes = deque(maxlen=SHORT_BARS + 1)
+        self._abs_diffs = deque()
+        self._flips = deque()
+        self._wicks = deque()
+        self._ranges = deque()
+        self._channel = RollingChannel(LONG_BARS)
+        self._last_sign = 0
+
+        self._abs_diff_sum = 0.0
+        self._flip_count = 0
+        self._wick_sum = 0.0
+        self._short_range_sum = 0.0
+        self._long_range_sum = 0.0
+        self._since_resync = 0
+
+    @property
+    def ready(self) -> bool:
+        return self.count >= LONG_BARS
+
+    def update(self, candle: dict) -> int:
+        """캔들 dict 입력 → 붕괴 플래그"""
+        return self.push(candle['open'], candle['high'], candle['low'], candle['close'])
+
+    def push(self, open_: float, high: float, low: float, close: float) -> int:
+        """OHLC 입력 → 붕괴 플래그 (0 = 붕괴 없음)"""
+        self._append(open_, high, low, close)
+
+        if self.count < LONG_BARS:
+            return 0
+
+        self._prev[:] = self.state
+        state = self.state
+        state[PERSISTENCE] = ((close - self._closes[0]) / self._abs_diff_sum
+                              if self._abs_diff_sum > 0 else 0.0)
+        state[INTERFERENCE] = self._flip_count / SHORT_BARS
+        state[RESISTANCE] = self._wick_sum / SHORT_BARS
+
+        short_mean = self._short_range_sum / SHORT_BARS
+        long_mean = self._long_range_sum / LONG_BARS
+        channel = self._channel.range
+        state[RELEASE] = short_mean / long_mean if long_mean > 0 else 0.0
+        state[COMPRESSION] = long_mean / channel if channel > 0 else 0.0
+
+        self.collapse = _collapse_flags(self._prev, state)
+        return self.collapse
+
+    def _append(self, o: float, h: float, l: float, c: float):
+        self.count += 1
+
+        # Δc: 부호 반전 / 절대값
+        if self._closes:
+            diff = c - self._closes[-1]
+            sign = _sign(diff)
+            flip = 1 if sign and self._last_sign and sign != self._last_sign else 0
+            self._last_sign = sign
+            self._abs_diff_sum += self._roll(self._abs_diffs, abs(diff), SHORT_BARS)
+            self._flip_count += self._roll(self._flips, flip, SHORT_BARS)
+        self._closes.append(c)
+
+        rng = h - l
+        wick = (rng - abs(c - o)) / rng if rng > 0 else 0.0
+        self._wick_sum += self._roll(self._wicks, wick, SHORT_BARS)
+
+        self._ranges.append(rng)
+        self._long_range_sum += rng
+        self._short_range_sum += rng
+        if len(self._ranges) > SHORT_BARS:
+            self._short_range_sum -= self._ranges[-SHORT_BARS - 1]
+        if len(self._ranges) > LONG_BARS:
+            self._long_range_sum -= self._ranges.popleft()
+
+        # L봉 채널
+        self._channel.push(h, l)
+
+        self._since_resync += 1
+        if self._since_resync >= self.RESYNC_INTERVAL:
+            self._resync()
+
+    @staticmethod
+    def _roll(window: deque, value, size: int):
+        """윈도우에 값 추가 → 합계 변화량"""
+        window.append(value)
+        if len(window) > size:
+            return value - window.popleft()
+        return value
+
+    def _resync(self):
+        """누적 부동소수 오차 제거 (윈도우 재계산, 분할상환 O(1))"""
+        ranges = list(self._ranges)
+        self._abs_diff_sum = math.fsum(self._abs_diffs)
+        self._wick_sum = math.fsum(self._wicks)
+        self._short_range_sum = math.fsum(ranges[-SHORT_BARS:])
+        self._long_range_sum = math.fsum(ranges)
+        self._since_resync = 0
+
+
+@dataclass
+class ForceSeries:
+    """배치 결과 (values: n × 5, collapse: 봉별 붕괴 플래그)"""
+    values: np.ndarray
+    collapse: np.ndarray
+
+    def channel(self, name: str) -> np.ndarray:
+        return self.values[:, FORCE_CHANNELS.index(name)]
+
+
+def _rolling_sum(x: np.ndarray, size: int) -> np.ndarray:
+    """끝 인덱스 기준 size개 합 (앞쪽 size-1개는 부분합)"""
+    cs = np.concatenate(([0.0], np.cumsum(x)))
+    out = cs[1:].copy()
+    out[size:] -= cs[1:-size]
+    return out
+
+
+def compute_force(open_, high, low, close) -> ForceSeries:
+    """OHLC 배열 → force state 시계열 (ForceEngine.push 반복과 동일)"""
+    o = np.ascontiguousarray(open_, dtype=np.float64)
+    h = np.ascontiguousarray(high, dtype=np.float64)
+    l = np.ascontiguousarray(low, dtype=np.float64)
+    c = np.ascontiguousarray(close, dtype=np.float64)
+    n = len(c)
+
+    values = np.full((n, len(FORCE_CHANNELS)), np.nan)
+    collapse = np.zeros(n, dtype=np.int8)
+    if n < LONG_BARS:
+        return ForceSeries(values, collapse)
+
+    diff = np.concatenate(([0.0], np.diff(c)))
+    sign = np.sign(diff)
+    flips = np.zeros(n)
+    flips[2:] = (sign[2:] != 0) & (sign[1:-1] != 0) & (sign[2:] != sign[1:-1])
+
+    rng = h - l
+    with np.errstate(divide='ignore', invalid='ignore'):
+        wick = np.where(rng > 0, (rng - np.abs(c - o)) / rng, 0.0)
+
+    t = slice(LONG_BARS - 1, n)
+    abs_sum = _rolling_sum(np.abs(diff), SHORT_BARS)[t]
+    move = c[t] - c[LONG_BARS - 1 - SHORT_BARS:n - SHORT_BARS]
+    short_mean = _rolling_sum(rng, SHORT_BARS)[t] / SHORT_BARS
+    long_mean = _rolling_sum(rng, LONG_BARS)[t] / LONG_BARS
+    channel = (sliding_window_view(h, LONG_BARS).max(axis=1)
+               - sliding_window_view(l, LONG_BARS).min(axis=1))
+
+    v = values[t]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        v[:, PERSISTENCE] = np.where(abs_sum > 0, move / abs_sum, 0.0)
+        v[:, INTERFERENCE] = _rolling_sum(flips, SHORT_BARS)[t] / SHORT_BARS
+        v[:, RESISTANCE] = _rolling_sum(wick, SHORT_BARS)[t] / SHORT_BARS
+        v[:, RELEASE] = np.where(long_mean > 0, short_mean / long_mean, 0.0)
+        v[:, COMPRESSION] = np.where(channel > 0, long_mean / channel, 0.0)
+
+    prev, cur = v[:-1], v[1:]
+    flags = collapse[LONG_BARS:]
+    flags[prev[:, PERSISTENCE] * cur[:, PERSISTENCE] < 0] |= COLLAPSE_REVERSAL
+    flags[(prev[:, INTERFERENCE] < NOISE_SURGE) & (cur[:, INTERFERENCE] >= NOISE_SURGE)] |= COLLAPSE_NOISE
+    flags[(prev[:, RESISTANCE] < RESISTANCE_SURGE) & (cur[:, RESISTANCE] >= RESISTANCE_SURGE)] |= COLLAPSE_RESISTANCE
+
+    return ForceSeries(values, collapse)
@@ -0,0 +1,164 @@
+"""
+Market State Classifier
+=======================
+
+시장 상태 분류 (grammar_demo.classify_market_state와 같은 규칙 / 임계값)
+
+우선순위:
+1. 20봉 채널 range < 30pt → SIDEWAYS
+2. ratio > 1.3 → OVERBOUGHT
+3. ratio < 0.7 → OVERSOLD
+4. 그 외 → TRENDING
+
+ratio = max(close - low, 0.01) / max(high - close, 0.01)
+채널 = 직전 20봉 (현재 봉 제외, STB 진입과 같은 기준)
+→ 처음 20봉은 STATE_UNKNOWN
+
+두 가지 모드 (결과 동일):
+- MarketStateClassifier: 봉당 O(1) (RollingChannel)
+- classify_market_states: OHLC 배열 일괄 분류 + RLE 구간 (state_segments)
+
+상태 이름은 ZoneKey.state 값으로 그대로 사용한다.
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .rolling_channel import RollingChannel
+
+
+# 상태 임계값 (grammar_demo 규칙과 같은 값, test_market_state가 일치 확인)
+CHANNEL_BARS = 20          # 채널 = 직전 20봉
+SIDEWAYS_RANGE = 30.0      # 채널 range가 이보다 작으면 SIDEWAYS
+OVERBOUGHT_RATIO = 1.3
+OVERSOLD_RATIO = 0.7
+
+
+STATE_UNKNOWN = -1
+STATE_SIDEWAYS = 0
+STATE_OVERBOUGHT = 1
+STATE_OVERSOLD = 2
+STATE_TRENDING = 3
+
+MARKET_STATE_NAMES = {
+    STATE_UNKNOWN: "UNKNOWN",
+    STATE_SIDEWAYS: "SIDEWAYS",
+    STATE_OVERBOUGHT: "OVERBOUGHT",
+    STATE_OVERSOLD: "OVERSOLD",
+    STATE_TRENDING: "TRENDING",
+}
+
+
+def classify_market_states(high, low, close,
+                           channel_bars: int = CHANNEL_BARS) -> np.ndarray:
+    """OHLC 배열 → 상태 코드 배열 (int8, bar i의 채널 = bar i-20 ~ i-1)"""
+    h = np.ascontiguousarray(high, dtype=np.float64)
+    l = np.ascontiguousarray(low, dtype=np.float64)
+    c = np.ascontiguousarray(close, dtype=np.float64)
+    n = len(c)
+
+    states = np.full(n, STATE_UNKNOWN, dtype=np.int8)
+    if n <= channel_bars:
+        return states
+
+    ch_range = (sliding_window_view(h[:-1], channel_bars).max(axis=1)
+                - sliding_window_view(l[:-1], channel_bars).min(axis=1))
+    hc = h[channel_bars:]
+    lc = l[channel_bars:]
+    cc = c[channel_bars:]
+    ratio = np.maximum(cc - lc, 0.01) / np.maximum(hc - cc, 0.01)
+
+    states[channel_bars:] = np.select(
+        [ch_range < SIDEWAYS_RANGE, ratio > OVERBOUGHT_RATIO, ratio < OVERSOLD_RATIO],
+        [STATE_SIDEWAYS, STATE_OVERBOUGHT, STATE_OVERSOLD],
+        default=STATE_TRENDING,
+    )
+    return states
+
+
+@dataclass
+class StateSegments:
+    """상태 run-length 구간 (start: 시작 bar, length: bar 수, state: 상태 코드)"""
+    start: np.ndarray
+    length: np.ndarray
+    state: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def names(self) -> List[str]:
+        return [MARKET_STATE_NAMES[int(s)] for s in self.state]
+
+
+def state_segments(states) -> StateSegments:
+    """상태 코드 배열 → RLE 구간"""
+    states = np.asarray(states)
+    if len(states) == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return StateSegments(empty, empty, states[:0])
+
+    start = np.flatnonzero(np.diff(states)) + 1
+    start = np.concatenate(([0], start))
+    length = np.diff(np.concatenate((start, [len(states)])))
+    return StateSegments(start, length, states[start])
+
+
+class MarketStateClassifier:
+    """
+    시장 상태 스트리밍 분류기 (봉당 O(1))
+
+    push(o, h, l, c)는 지금까지 입력된 봉을 채널로 보고 분류한 뒤
+    해당 봉을 채널에 편입한다 (classify_market_states와 동일한 결과).
+    """
+
+    def __init__(self, channel_bars: int = CHANNEL_BARS):
+        self.channel_bars = channel_bars
+        self.reset()
+
+    def reset(self):
+        """상태 리셋"""
+        self.count = 0
+        self.state = STATE_UNKNOWN
+        self.segment_start = 0
+        self._channel = RollingChannel(self.channel_bars)
+
+    @property
+    def state_name(self) -> str:
+        return MARKET_STATE_NAMES[self.state]
+
+    def push(self, open_: float, high: float, low: float, close: float) -> int:
+        """OHLC 입력 → 상태 코드"""
+        state = STATE_UNKNOWN
+        if self.count >= self.channel_bars:
+            state = self._classify(high, low, close)
+
+        if state != self.state:
+            self.state = state
+            self.segment_start = self.count
+
+        self.count += 1
+        self._channel.push(high, low)
+        return state
+
+    def update(self, candle: dict) -> str:
+        """캔들 dict 입력 → 상태 이름"""
+        return MARKET_STATE_NAMES[self.push(candle['open'], candle['high'],
+                                            candle['low'], candle['close'])]
+
+    def _classify(self, h: float, l: float, c: float) -> int:
+        if self._channel.range < SIDEWAYS_RANGE:
+            return STATE_SIDEWAYS
+        ratio = max(c - l, 0.01) / max(h - c, 0.01)
+        if ratio > OVERBOUGHT_RATIO:
+            return STATE_OVERBOUGHT
+        if ratio < OVERSOLD_RATIO:
+            return STATE_OVERSOLD
+        return STATE_TRENDING
+
+    @property
+    def segment_bars(self) -> int:
+        """현재 상태 지속 bar 수"""
+        return self.count - self.segment_start
@@ -0,0 +1,212 @@
+"""
+Position Book
+=============
+
+V7EnergyEngine 포지션 규칙의 struct-of-arrays 버전
+
+포지션 1개 = 배열의 슬롯 1개
+- entry_price, mfe, trailing_stop, sl, bars, direction(±1), state(int)
+- update()는 모든 오픈 포지션을 한 봉에 대해 한 번의 벡터 연산으로 진행
+
+규칙은 V7EnergyEngine.update_position과 동일 (변경 금지):
+- MFE >= 7pt → 트레일링 (TRAIL_WIN)
+- SL Defense (G3): 4봉 내 MFE < 1.5pt → SL -12pt
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .v7_energy_engine import (
+    V7EnergyEngine,
+    STATE_ACTIVE, STATE_TRAILING, STATE_CLOSED, STATE_NAMES,
+    DIRECTION_NAMES, direction_code,
+)
+
+
+class PositionBook:
+    """
+    다중 포지션 배열 커널
+
+    상수는 생성 시 engine에서 읽는다 (인스턴스 override 포함).
+    청산된 포지션의 슬롯은 즉시 재사용된다.
+    """
+
+    def __init__(self, engine: Optional[V7EnergyEngine] = None, capacity: int = 256):
+        capacity = max(1, capacity)
+        params = engine if engine is not None else V7EnergyEngine
+        self.mfe_threshold = params.MFE_THRESHOLD
+        self.trail_offset = params.TRAIL_OFFSET
+        self.default_sl = params.DEFAULT_SL
+        self.lws_bars = params.LWS_BARS
+        self.lws_mfe_threshold = params.LWS_MFE_THRESHOLD
+        self.defense_sl = params.DEFENSE_SL
+
+        self.entry_price = np.zeros(capacity)
+        self.mfe = np.zeros(capacity)
+        self.current_pnl = np.zeros(capacity)
+        self.trailing_stop = np.full(capacity, np.nan)
+        self.sl = np.zeros(capacity)
+        self.bars = np.zeros(capacity, dtype=np.int32)
+        self.direction = np.zeros(capacity, dtype=np.int8)
+        self.state = np.full(capacity, STATE_CLOSED, dtype=np.int8)
+        self.seq = np.zeros(capacity, dtype=np.int64)
+
+        self.trade_ids: List[Optional[str]] = [None] * capacity
+        self.entry_times: List[Optional[str]] = [None] * capacity
+        self.slots: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._size = 0
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    @property
+    def capacity(self) -> int:
+        return len(self.entry_price)
+
+    def _grow(self):
+        new_cap = max(1, self.capacity * 2)
+        for name in ("entry_price", "mfe", "current_pnl", "trailing_stop",
+                     "sl", "bars", "direction", "state", "seq"):
+            old = getattr(self, name)
+            fill = np.nan if name == "trailing_stop" else (STATE_CLOSED if name == "state" else 0)
+            new = np.full(new_cap, fill, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+        extra = new_cap - len(self.trade_ids)
+        self.trade_ids.extend([None] * extra)
+        self.entry_times.extend([None] * extra)
+
+    def open_position(self, trade_id: str, direction: str,
+                      entry_price: float, entry_time: Optional[str] = None) -> int:
+        """새 포지션 오픈 → 슬롯 번호 (이미 열린 trade_id / 잘못된 방향은 ValueError)"""
+        if trade_id in self.slots:
+            raise ValueError(f"Position already open: {trade_id}")
+        code = direction_code(direction)
+
+        if self._free:
+            slot = self._free.pop()
+        else:
+            if self._size == self.capacity:
+                self._grow()
+            slot = self._size
+            self._size += 1
+
+        self.entry_price[slot] = entry_price
+        self.mfe[slot] = 0.0
+        self.current_pnl[slot] = 0.0
+        self.trailing_stop[slot] = np.nan
+        self.sl[slot] = self.default_sl
+        self.bars[slot] = 0
+        self.direction[slot] = code
+        self.state[slot] = STATE_ACTIVE
+        self.seq[slot] = self._next_seq
+        self._next_seq += 1
+
+        self.trade_ids[slot] = trade_id
+        self.entry_times[slot] = entry_time
+        self.slots[trade_id] = slot
+        return slot
+
+    def update(self, high: float, low: float,
+               close: float) -> List[Tuple[str, str, float]]:
+        """
+        모든 오픈 포지션을 캔들 1개로 업데이트
+
+        Returns:
+            [(trade_id, exit_type, exit_pnl), ...] 이번 봉에 청산된 포지션 (오픈 순서)
+        """
+        idx = np.flatnonzero(self.state[:self._size] != STATE_CLOSED)
+        if len(idx) == 0:
+            return []
+
+        entry = self.entry_price[idx]
+        is_long = self.direction[idx] > 0
+        mfe = self.mfe[idx]
+        bars = self.bars[idx] + 1
+
+        # SL Defense (G3): Loss Warning State 체크 (이번 봉 반영 전 MFE 기준)
+        lws = (bars >= self.lws_bars) & (mfe < self.lws_mfe_threshold)
+        sl = np.where(lws, self.defense_sl, self.sl[idx])
+
+        mfe = np.maximum(mfe, np.where(is_long, high - entry, entry - low))
+        pnl = np.where(is_long, close - entry, entry - close)
+
+        state = self.state[idx]
+        locked = mfe - self.trail_offset
+        target = np.where(is_long, entry + locked, entry - locked)
+
+        activate = (mfe >= self.mfe_threshold) & (state == STATE_ACTIVE)
+        state = np.where(activate, STATE_TRAILING, state).astype(np.int8)
+        trailing = state == STATE_TRAILING
+
+        ts = np.where(activate, target, self.trailing_stop[idx])
+        ts = np.where(trailing,
+                      np.where(is_long, np.maximum(ts, target), np.minimum(ts, target)),
+                      ts)
+
+        trail_hit = trailing & np.where(is_long, low <= ts, high >= ts)
+        sl_hit = ~trail_hit & np.where(is_long, low <= entry - sl, high >= entry + sl)
+        closed = trail_hit | sl_hit
+        state[closed] = STATE_CLOSED
+
+        self.mfe[idx] = mfe
+        self.current_pnl[idx] = pnl
+        self.bars[idx] = bars
+        self.sl[idx] = sl
+        self.trailing_stop[idx] = ts
+        self.state[idx] = state
+
+        if not closed.any():
+            return []
+
+        exit_pnl = np.where(
+            trail_hit,
+            np.maximum(np.where(is_long, ts - entry, entry - ts), 1),
+            -sl,
+        )
+
+        exits = []
+        for k in np.flatnonzero(closed)[np.argsort(self.seq[idx[closed]], kind="stable")]:
+            slot = int(idx[k])
+            exit_type = "TRAIL_WIN" if trail_hit[k] else "LOSS"
+            exits.append((self.trade_ids[slot], exit_type, float(exit_pnl[k])))
+            self._release(slot)
+
+        return exits
+
+    def _release(self, slot: int):
+        del self.slots[self.trade_ids[slot]]
+        self.trade_ids[slot] = None
+        self.entry_times[slot] = None
+        self._free.append(slot)
+
+    def get_position_status(self, trade_id: str) -> Optional[dict]:
+        """포지션 상태 조회 (V7EnergyEngine과 동일한 dict 형태)"""
+        slot = self.slots.get(trade_id)
+        if slot is None:
+            return None
+
+        ts = self.trailing_stop[slot]
+        return {
+            'direction': DIRECTION_NAMES[int(self.direction[slot])],
+            'entry_price': float(self.entry_price[slot]),
+            'mfe': float(self.mfe[slot]),
+            'current_pnl': float(self.current_pnl[slot]),
+            'state': STATE_NAMES[int(self.state[slot])],
+            'trailing_stop': None if np.isnan(ts) else float(ts),
+            'trailing_active': bool(self.state[slot] == STATE_TRAILING),
+        }
+
+    def close_position(self, trade_id: str) -> Optional[float]:
+        """포지션 수동 청산"""
+        slot = self.slots.get(trade_id)
+        if slot is None:
+            return None
+
+        pnl = float(self.current_pnl[slot])
+        self.state[slot] = STATE_CLOSED
+        self._release(slot)
+        return pnl
@@ -0,0 +1,63 @@
+"""
+Rolling Channel
+===============
+
+직전 N봉 채널 고가/저가 (monotonic deque, push 분할상환 O(1))
+
+StreamingSTBDetector (20봉) / MarketStateClassifier (20봉) /
+ForceEngine (50봉)의 공용 채널. 배치 경로의 sliding_window_view max/min과 같은 값.
+"""
+
+from collections import deque
+
+
+class RollingChannel:
+    """
+    최근 bars개 고가 최댓값 / 저가 최솟값
+
+    high / low / range는 push된 봉이 1개 이상일 때만 유효
+    """
+
+    __slots__ = ("bars", "count", "_highs", "_lows")
+
+    def __init__(self, bars: int):
+        if bars < 1:
+            raise ValueError("Channel bars must be >= 1")
+        self.bars = bars
+        self.reset()
+
+    def reset(self):
+        """상태 리셋"""
+        self.count = 0
+        self._highs = deque()   # (idx, high) 단조 감소
+        self._lows = deque()    # (idx, low) 단조 증가
+
+    def push(self, high: float, low: float):
+        """봉 1개 편입 (bars 이전 봉은 채널에서 제외)"""
+        idx = self.count
+        self.count += 1
+
+        highs, lows = self._highs, self._lows
+        while highs and highs[-1][1] <= high:
+            highs.pop()
+        highs.append((idx, high))
+        if highs[0][0] <= idx - self.bars:
+            highs.popleft()
+
+        while lows and lows[-1][1] >= low:
+            lows.pop()
+        lows.append((idx, low))
+        if lows[0][0] <= idx - self.bars:
+            lows.popleft()
+
+    @property
+    def high(self) -> float:
+        return self._highs[0][1]
+
+    @property
+    def low(self) -> float:
+        return self._lows[0][1]
+
+    @property
+    def range(self) -> float:
+        return self._highs[0][1] - self._lows[0][1]
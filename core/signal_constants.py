@@ -0,0 +1,48 @@
+"""
+Signal Constants
+================
+
+STB 신호 표 / 방향 코드 (단일 출처, import 없음)
+
+core.stb_sensor / core.v7_energy_engine / opa.signal_registry가 모두 여기서 읽는다.
+opa는 core 중 이 모듈만 import한다 (numpy / 엔진 로드 없음).
+"""
+
+from typing import Optional
+
+
+# 방향 코드 (배치 스캔 / 배열 기반 경로 / 신호 registry 공용)
+SIGNAL_NONE = 0
+SIGNAL_LONG = 1
+SIGNAL_SHORT = -1
+
+DIRECTION_CODES = {
+    'LONG': SIGNAL_LONG,
+    'SHORT': SIGNAL_SHORT,
+}
+
+STB_SIGNALS = {
+    "STB숏": {"direction": "SHORT", "tier": 1},
+    "STB롱": {"direction": "LONG", "tier": 1},
+    "SCALP_A": {"direction": "BOTH", "tier": 2},
+    "HUNT_1": {"direction": "BOTH", "tier": 2},
+}
+
+
+def stb_signal_direction(signal_name: str) -> Optional[str]:
+    """
+    STB 신호 방향 (STB_SIGNALS에 없으면 None)
+
+    BOTH는 이름(숏/SHORT, 롱/LONG)으로 결정, 결정 불가면 BOTH 그대로
+    """
+    config = STB_SIGNALS.get(signal_name)
+    if config is None:
+        return None
+
+    direction = config.get("direction", "BOTH")
+    if direction == "BOTH":
+        if "숏" in signal_name or "SHORT" in signal_name.upper():
+            direction = "SHORT"
+        elif "롱" in signal_name or "LONG" in signal_name.upper():
+            direction = "LONG"
+    return direction
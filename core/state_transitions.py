@@ -0,0 +1,247 @@
+"""
+State Transitions
+=================
+
+시장 상태 전이 행렬 누적기 (market_state 라벨 스트림 입력)
+
+누적 항목:
+- counts[a, b]: 상태 a → b 전이 횟수 (연속 bar 쌍, 자기 전이 포함)
+- dwell[s, k]: 상태 s가 k bar 지속된 완료 구간 수 (k >= max_dwell은 마지막 칸)
+- 정상분포: 행 정규화 전이 행렬의 stationary distribution
+
+규칙:
+- STATE_UNKNOWN(음수) / 범위 밖 코드 → 체인 끊김 (현재 구간 종료)
+- 마지막 구간은 열린 상태로 유지, 다음 상태가 오거나 flush() 시 dwell에 반영
+- merge(): 샤드별 부분 누적기 합산 (샤드 경계에서 각자 flush() 후 병합)
+
+WindowedTransitionAccumulator: bucket(기본 1일) ring → 최근 N bucket 구간 합계
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from .market_state import MARKET_STATE_NAMES, state_segments
+
+
+N_STATES = 4
+MAX_DWELL = 256
+
+
+class TransitionAccumulator:
+    """상태 전이 / 지속 시간 누적기"""
+
+    def __init__(self, n_states: int = N_STATES, max_dwell: int = MAX_DWELL):
+        self.n_states = n_states
+        self.max_dwell = max_dwell
+        self.counts = np.zeros((n_states, n_states), dtype=np.int64)
+        self.dwell = np.zeros((n_states, max_dwell + 1), dtype=np.int64)
+        self.prev = -1
+        self.run = 0
+
+    def update(self, state: int):
+        """상태 코드 1개 반영"""
+        if not 0 <= state < self.n_states:
+            self.flush()
+            return
+
+        prev = self.prev
+        if prev >= 0:
+            self._add_transition(prev, state)
+            if state != prev:
+                self._add_dwell(prev, self.run)
+                self.run = 0
+        self.prev = state
+        self.run += 1
+
+    def update_many(self, states):
+        """상태 코드 배열 일괄 반영 (update 반복과 동일)"""
+        s = np.asarray(states, dtype=np.int64)
+        if len(s) == 0:
+            return
+
+        valid = (s >= 0) & (s < self.n_states)
+        s = np.where(valid, s, -1)
+
+        # 전이: 직전 상태(열린 구간 포함) → 현재
+        seq = np.concatenate(([self.prev], s))
+        a, b = seq[:-1], seq[1:]
+        pair = (a >= 0) & (b >= 0)
+
+        # 완료 구간: RLE에서 마지막 구간 제외, 첫 구간은 열린 run 이어붙임
+        segments = state_segments(seq)
+        lengths = segments.length.copy()
+        lengths[0] += self.run - 1 if self.prev >= 0 else 0
+        done = segments.state[:-1] >= 0
+
+        self._add_many(a[pair], b[pair],
+                       segments.state[:-1][done], lengths[:-1][done])
+
+        last = int(segments.state[-1])
+        self.prev = last
+        self.run = int(lengths[-1]) if last >= 0 else 0
+
+    def flush(self):
+        """열린 구간 종료 (체인 끊김)"""
+        if self.prev >= 0:
+            self._add_dwell(self.prev, self.run)
+        self.prev = -1
+        self.run = 0
+
+    def _add_transition(self, a: int, b: int):
+        self.counts[a, b] += 1
+
+    def _add_dwell(self, state: int, run: int):
+        self.dwell[state, min(run, self.max_dwell)] += 1
+
+    def _add_many(self, a, b, dwell_states, dwell_lengths):
+        np.add.at(self.counts, (a, b), 1)
+        np.add.at(self.dwell, (dwell_states, np.minimum(dwell_lengths, self.max_dwell)), 1)
+
+    def merge(self, other: "TransitionAccumulator") -> "TransitionAccumulator":
+        """다른 누적기의 완료 집계 합산 (열린 구간은 합산하지 않음)"""
+        if other.counts.shape != self.counts.shape or other.dwell.shape != self.dwell.shape:
+            raise ValueError("Cannot merge accumulators with different shapes")
+        self.counts += other.counts
+        self.dwell += other.dwell
+        return self
+
+    def transition_matrix(self) -> np.ndarray:
+        """행 정규화 전이 확률 (관측 없는 행은 자기 전이 1)"""
+        return _normalize(self.counts)
+
+    def stationary_distribution(self) -> np.ndarray:
+        """정상분포 π (π P = π, Σπ = 1)"""
+        return _stationary(self.transition_matrix())
+
+    def mean_dwell(self) -> np.ndarray:
+        """상태별 평균 지속 bar 수 (max_dwell 칸은 max_dwell로 계산)"""
+        k = np.arange(self.max_dwell + 1)
+        total = self.dwell.sum(axis=1)
+        return np.divide(self.dwell @ k, total, out=np.zeros(self.n_states), where=total > 0)
+
+    def summary(self) -> dict:
+        """상태 이름 기준 요약"""
+        pi = self.stationary_distribution()
+        dwell = self.mean_dwell()
+        return {
+            MARKET_STATE_NAMES[s]: {
+                "transitions": int(self.counts[s].sum()),
+                "stationary": float(pi[s]),
+                "mean_dwell": float(dwell[s]),
+            }
+            for s in range(self.n_states)
+        }
+
+
+class WindowedTransitionAccumulator(TransitionAccumulator):
+    """
+    최근 N bucket 전이 누적기 (rolling N days)
+
+    counts / dwell = 윈도우 합계. bucket이 만료되면 ring 슬롯을 빼고 비운다.
+    전이는 뒤쪽 bar의 bucket, dwell은 구간이 끝난 bucket에 기록된다.
+    """
+
+    def __init__(self, window: int, bucket_seconds: float = 86400.0,
+                 n_states: int = N_STATES, max_dwell: int = MAX_DWELL):
+        super().__init__(n_states, max_dwell)
+        self.window = window
+        self.bucket_seconds = bucket_seconds
+        self._ring_counts = np.zeros((window, n_states, n_states), dtype=np.int64)
+        self._ring_dwell = np.zeros((window, n_states, max_dwell + 1), dtype=np.int64)
+        self.bucket: Optional[int] = None
+
+    def _advance(self, time: float):
+        bucket = int(time // self.bucket_seconds)
+        if self.bucket is None:
+            self.bucket = bucket
+            return
+        if bucket < self.bucket:
+            raise ValueError(f"Time went backwards: bucket {bucket} < {self.bucket}")
+
+        for expired in range(self.bucket + 1, min(bucket, self.bucket + self.window) + 1):
+            slot = expired % self.window
+            self.counts -= self._ring_counts[slot]
+            self.dwell -= self._ring_dwell[slot]
+            self._ring_counts[slot] = 0
+            self._ring_dwell[slot] = 0
+        self.bucket = bucket
+
+    @property
+    def _slot(self) -> int:
+        return self.bucket % self.window
+
+    def update(self, state: int, time: float = None):
+        if time is not None:
+            self._advance(time)
+        elif self.bucket is None:
+            self.bucket = 0
+        super().update(state)
+
+    def update_many(self, states, times=None):
+        """times 배열이 있으면 bucket 단위로 나누어 반영"""
+        if times is None:
+            if self.bucket is None:
+                self.bucket = 0
+            super().update_many(states)
+            return
+
+        states = np.asarray(states)
+        buckets = (np.asarray(times, dtype=np.float64) // self.bucket_seconds).astype(np.int64)
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(buckets)) + 1, [len(states)]))
+        for lo, hi in zip(starts[:-1], starts[1:]):
+            if lo == hi:
+                continue
+            self._advance(buckets[lo] * self.bucket_seconds)
+            super().update_many(states[lo:hi])
+
+    def _add_transition(self, a: int, b: int):
+        super()._add_transition(a, b)
+        self._ring_counts[self._slot, a, b] += 1
+
+    def _add_dwell(self, state: int, run: int):
+        super()._add_dwell(state, run)
+        self._ring_dwell[self._slot, state, min(run, self.max_dwell)] += 1
+
+    def _add_many(self, a, b, dwell_states, dwell_lengths):
+        super()._add_many(a, b, dwell_states, dwell_lengths)
+        np.add.at(self._ring_counts[self._slot], (a, b), 1)
+        np.add.at(self._ring_dwell[self._slot],
+                  (dwell_states, np.minimum(dwell_lengths, self.max_dwell)), 1)
+
+    def merge(self, other: "WindowedTransitionAccumulator") -> "WindowedTransitionAccumulator":
+        """같은 window / bucket 설정의 샤드 합산 (bucket 정렬, 윈도우 밖 bucket은 버림)"""
+        if (not isinstance(other, WindowedTransitionAccumulator)
+                or other.window != self.window or other.bucket_seconds != self.bucket_seconds):
+            raise ValueError("Cannot merge windowed accumulators with different windows")
+        if other.bucket is None:
+            return self
+        if self.bucket is None or other.bucket > self.bucket:
+            self._advance(other.bucket * self.bucket_seconds)
+
+        for bucket in range(self.bucket - self.window + 1, other.bucket + 1):
+            slot = bucket % self.window
+            self._ring_counts[slot] += other._ring_counts[slot]
+            self._ring_dwell[slot] += other._ring_dwell[slot]
+            self.counts += other._ring_counts[slot]
+            self.dwell += other._ring_dwell[slot]
+        return self
+
+
+def _normalize(counts: np.ndarray) -> np.ndarray:
+    counts = counts.astype(np.float64)
+    rows = counts.sum(axis=1)
+    empty = rows == 0
+    counts[empty, np.flatnonzero(empty)] = 1.0
+    rows[empty] = 1.0
+    return counts / rows[:, None]
+
+
+def _stationary(matrix: np.ndarray) -> np.ndarray:
+    n = len(matrix)
+    system = np.vstack((matrix.T - np.eye(n), np.ones(n)))
+    target = np.zeros(n + 1)
+    target[-1] = 1.0
+    pi = np.linalg.lstsq(system, target, rcond=None)[0]
+    pi = np.clip(pi, 0.0, None)
+    return pi / pi.sum()
@@ -12,12 +12,14 @@ STB는 "상태 탐색 시작"을 알리는 센서일 뿐이다.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional
 
+from .signal_constants import STB_SIGNALS, stb_signal_direction
 
-@dataclass
+
+@dataclass(frozen=True)
 class STBSignal:
-    """STB 신호"""
+    """STB 신호 (불변, 신호 이름별 공유 인스턴스)"""
     name: str
     direction: str  # "LONG" or "SHORT"
     strength: float = 1.0
@@ -31,32 +33,25 @@ class STBSignal:
         return self.direction == "SHORT"
 
 
-STB_SIGNALS = {
-    "STB숏": {"direction": "SHORT", "tier": 1},
-    "STB롱": {"direction": "LONG", "tier": 1},
-    "SCALP_A": {"direction": "BOTH", "tier": 2},
-    "HUNT_1": {"direction": "BOTH", "tier": 2},
+def _parse_stb_signal(signal_name: str) -> STBSignal:
+    return STBSignal(
+        name=signal_name,
+        direction=stb_signal_direction(signal_name),
+    )
+
+
+# 파싱 결과 캐시 (STB_SIGNALS 이름별 1회)
+_PARSED_SIGNALS: Dict[str, STBSignal] = {
+    name: _parse_stb_signal(name) for name in STB_SIGNALS
 }
 
 
 def parse_stb_signal(signal_name: str) -> Optional[STBSignal]:
-    """신호 이름을 STBSignal로 파싱"""
-    if signal_name not in STB_SIGNALS:
-        return None
-    
-    config = STB_SIGNALS[signal_name]
-    
-    direction = config.get("direction", "BOTH")
-    if direction == "BOTH":
-        if "숏" in signal_name or "SHORT" in signal_name.upper():
-            direction = "SHORT"
-        elif "롱" in signal_name or "LONG" in signal_name.upper():
-            direction = "LONG"
-    
-    return STBSignal(
-        name=signal_name,
-        direction=direction,
-    )
+    """신호 이름을 STBSignal로 파싱 (캐시된 공유 인스턴스 반환)"""
+    parsed = _PARSED_SIGNALS.get(signal_name)
+    if parsed is None and signal_name in STB_SIGNALS:
+        parsed = _PARSED_SIGNALS[signal_name] = _parse_stb_signal(signal_name)
+    return parsed
 
 
 def is_stb_signal(signal_name: str) -> bool:
@@ -0,0 +1,152 @@
+"""
+Theta Book
+==========
+
+다중 trade θ 추적기 (ThetaEngine 규칙의 struct-of-arrays 버전)
+
+trade 1개 = 배열의 슬롯 1개
+- theta(int8), bars, mfe, theta_since (현재 θ가 시작된 bars)
+- open/close: O(1) (free list로 슬롯 재사용)
+- update(): 모든 live trade의 θ를 한 번의 벡터 연산으로 갱신
+
+θ 분기는 ThetaEngine.compute와 동일 (theta_codes 공유)
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .theta_state import ThetaState, THETA_NAMES, theta_codes
+
+
+class ThetaBook:
+    """
+    다중 trade θ 커널
+
+    update()의 입력 배열은 슬롯 인덱스 기준 (길이 >= capacity 권장,
+    닫힌 슬롯 값은 무시). slot_of(trade_id)로 슬롯을 찾는다.
+    """
+
+    def __init__(self, capacity: int = 256):
+        capacity = max(1, capacity)
+        self.theta = np.zeros(capacity, dtype=np.int8)
+        self.bars = np.zeros(capacity, dtype=np.int32)
+        self.mfe = np.zeros(capacity)
+        self.theta_since = np.zeros(capacity, dtype=np.int32)
+        self.live = np.zeros(capacity, dtype=bool)
+        self.seq = np.zeros(capacity, dtype=np.int64)
+
+        self.trade_ids: List[Optional[str]] = [None] * capacity
+        self.slots: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._size = 0
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    @property
+    def capacity(self) -> int:
+        return len(self.theta)
+
+    def _grow(self):
+        new_cap = self.capacity * 2
+        for name in ("theta", "bars", "mfe", "theta_since", "live", "seq"):
+            old = getattr(self, name)
+            new = np.zeros(new_cap, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+        self.trade_ids.extend([None] * (new_cap - len(self.trade_ids)))
+
+    def slot_of(self, trade_id: str) -> Optional[int]:
+        return self.slots.get(trade_id)
+
+    def open(self, trade_id: str) -> int:
+        """trade 등록 (θ=0) → 슬롯 번호"""
+        if trade_id in self.slots:
+            raise ValueError(f"Trade already open: {trade_id}")
+
+        if self._free:
+            slot = self._free.pop()
+        else:
+            if self._size == self.capacity:
+                self._grow()
+            slot = self._size
+            self._size += 1
+
+        self.theta[slot] = 0
+        self.bars[slot] = 0
+        self.mfe[slot] = 0.0
+        self.theta_since[slot] = 0
+        self.live[slot] = True
+        self.seq[slot] = self._next_seq
+        self._next_seq += 1
+
+        self.trade_ids[slot] = trade_id
+        self.slots[trade_id] = slot
+        return slot
+
+    def close(self, trade_id: str) -> Optional[ThetaState]:
+        """trade 해제 → 마지막 θ 상태"""
+        slot = self.slots.pop(trade_id, None)
+        if slot is None:
+            return None
+
+        state = self._state(slot)
+        self.live[slot] = False
+        self.trade_ids[slot] = None
+        self._free.append(slot)
+        return state
+
+    def update(self, mfe, bars=None, impulse_count=None,
+               recovery_time=None) -> List[Tuple[str, int, int]]:
+        """
+        모든 live trade의 θ 갱신 (봉 1개)
+
+        bars=None → 슬롯별 내부 봉 카운터 +1
+        Returns:
+            [(trade_id, 이전 θ, 새 θ), ...] θ가 바뀐 trade (open 순서)
+        """
+        idx = np.flatnonzero(self.live[:self._size])
+        if len(idx) == 0:
+            return []
+
+        mfe = np.asarray(mfe, dtype=np.float64)[idx]
+        if bars is None:
+            bars = self.bars[idx] + 1
+        else:
+            bars = np.asarray(bars)[idx]
+        impulse = None if impulse_count is None else np.asarray(impulse_count)[idx]
+        recovery = None if recovery_time is None else np.asarray(recovery_time)[idx]
+
+        new_theta = theta_codes(mfe, bars, impulse, recovery)
+        old_theta = self.theta[idx]
+        changed = new_theta != old_theta
+
+        self.theta[idx] = new_theta
+        self.bars[idx] = bars
+        self.mfe[idx] = mfe
+        self.theta_since[idx] = np.where(changed, bars, self.theta_since[idx])
+
+        if not changed.any():
+            return []
+
+        k = np.flatnonzero(changed)
+        k = k[np.argsort(self.seq[idx[k]], kind="stable")]
+        return [(self.trade_ids[idx[j]], int(old_theta[j]), int(new_theta[j])) for j in k]
+
+    def _state(self, slot: int) -> ThetaState:
+        value = int(self.theta[slot])
+        return ThetaState(
+            value=value,
+            name=THETA_NAMES.get(value, "LOCK_IN"),
+            bars_in_state=int(self.bars[slot]),
+            mfe=float(self.mfe[slot]),
+        )
+
+    def get_state(self, trade_id: str) -> Optional[ThetaState]:
+        """trade θ 상태 조회 (ThetaEngine.current_state와 같은 형태)"""
+        slot = self.slots.get(trade_id)
+        if slot is None:
+            return None
+        return self._state(slot)
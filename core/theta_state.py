@@ -11,7 +11,9 @@
 """
 
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Iterator, List, Optional, Tuple, Union
+
+import numpy as np
 
 
 @dataclass
@@ -35,12 +37,117 @@ THETA_NAMES = {
 }
 
 
+def theta_codes(mfe, bars, impulse_count=None, recovery_time=None) -> np.ndarray:
+    """θ 벡터 계산 (ThetaEngine.compute와 동일한 분기 순서) → int8 배열"""
+    mfe = np.asarray(mfe, dtype=np.float64)
+    bars = np.asarray(bars)
+    impulse = 0 if impulse_count is None else np.asarray(impulse_count)
+    recovery = 0 if recovery_time is None else np.asarray(recovery_time)
+    
+    no_state = (mfe <= 0) & (bars < 3)
+    birth = (mfe > 0) & (mfe < 10)
+    band = (mfe >= 10) & (mfe < 15)
+    transition = band & (impulse > 2) & (recovery < 4)
+    
+    return np.select(
+        [no_state, birth, transition, band],
+        [0, 1, 2, 1],
+        default=3,
+    ).astype(np.int8)
+
+
+class ThetaHistory:
+    """
+    θ 전이 로그 (run-length encoding, 고정 크기 ring)
+    
+    run 1개 = θ가 유지된 구간 1개
+    - theta: θ 값 (int8)
+    - entry_bar: run 시작 시점의 bars
+    - duration: run 마지막 bars - entry_bar
+    - mfe: run 마지막 MFE
+    
+    cap 초과 시 가장 오래된 run부터 버린다 (dropped 카운트).
+    읽기 전용 live view: 복사 없이 엔진의 현재 상태를 그대로 보여준다.
+    - 정수 index → ThetaState, slice → List[ThetaState] (list와 같은 의미)
+    - 항목 대입 / 삭제 메서드 없음, 기록은 ThetaEngine만 (_start_run / _extend_run)
+    - 시점 고정 사본이 필요하면 list(history)
+    """
+    
+    def __init__(self, cap: int = 4096):
+        if cap < 1:
+            raise ValueError("History cap must be >= 1")
+        self.cap = cap
+        self._theta = np.zeros(cap, dtype=np.int8)
+        self._entry_bar = np.zeros(cap, dtype=np.int64)
+        self._duration = np.zeros(cap, dtype=np.int64)
+        self._mfe = np.zeros(cap)
+        self._head = 0
+        self._len = 0
+        self.dropped = 0
+    
+    def __len__(self) -> int:
+        return self._len
+    
+    def _slot(self, i: int) -> int:
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("theta history index out of range")
+        return (self._head + i) % self.cap
+    
+    def __getitem__(self, i: Union[int, slice]) -> Union[ThetaState, List[ThetaState]]:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._len))]
+        k = self._slot(i)
+        value = int(self._theta[k])
+        return ThetaState(
+            value=value,
+            name=THETA_NAMES.get(value, "LOCK_IN"),
+            bars_in_state=int(self._entry_bar[k] + self._duration[k]),
+            mfe=float(self._mfe[k]),
+        )
+    
+    def __iter__(self) -> Iterator[ThetaState]:
+        for i in range(self._len):
+            yield self[i]
+    
+    def _start_run(self, theta: int, bar: int, mfe: float):
+        if self._len == self.cap:
+            self._head = (self._head + 1) % self.cap
+            self._len -= 1
+            self.dropped += 1
+        k = (self._head + self._len) % self.cap
+        self._theta[k] = theta
+        self._entry_bar[k] = bar
+        self._duration[k] = 0
+        self._mfe[k] = mfe
+        self._len += 1
+    
+    def _extend_run(self, bar: int, mfe: float):
+        k = (self._head + self._len - 1) % self.cap
+        self._duration[k] = bar - self._entry_bar[k]
+        self._mfe[k] = mfe
+    
+    def _clear(self):
+        self._head = 0
+        self._len = 0
+        self.dropped = 0
+    
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(theta, entry_bar, duration) 시간순 배열 (복사)"""
+        order = (self._head + np.arange(self._len)) % self.cap
+        return self._theta[order], self._entry_bar[order], self._duration[order]
+
+
 class ThetaEngine:
     """θ 상태 계산 엔진"""
     
-    def __init__(self):
+    HISTORY_CAP = 4096
+    
+    def __init__(self, history_cap: Optional[int] = None):
         self.current_state = ThetaState(value=0, name="NO_STATE")
-        self.history: List[ThetaState] = []
+        self.history = ThetaHistory(self.HISTORY_CAP if history_cap is None else history_cap)
+        self.history._start_run(0, 0, 0.0)
     
     def compute(self, mfe: float, bars: int, impulse_count: int = 0, 
                 recovery_time: float = 0) -> ThetaState:
@@ -68,16 +175,40 @@ class ThetaEngine:
         )
         
         if new_state.value != self.current_state.value:
-            self.history.append(self.current_state)
+            self.history._start_run(theta, bars, mfe)
+        else:
+            self.history._extend_run(bars, mfe)
         
         self.current_state = new_state
         return new_state
     
+    @staticmethod
+    def compute_batch(mfe, bars, impulse_count=None, recovery_time=None,
+                      groups=None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        θ 배치 계산 (compute와 동일한 분기, 벡터 마스크)
+        
+        엔진 상태(current_state / history)는 변경하지 않는다.
+        groups: lifecycle(trade) ID 배열 → 그룹 경계는 전이로 세지 않음
+        
+        Returns:
+            (theta int8 배열, θ가 직전 bar와 달라진 인덱스)
+        """
+        theta = theta_codes(mfe, bars, impulse_count, recovery_time)
+        
+        changed = theta[1:] != theta[:-1]
+        if groups is not None:
+            groups = np.asarray(groups)
+            changed &= groups[1:] == groups[:-1]
+        
+        return theta, np.flatnonzero(changed) + 1
+    
     def reset(self):
         """상태 리셋"""
         self.current_state = ThetaState(value=0, name="NO_STATE")
-        self.history = []
+        self.history._clear()
+        self.history._start_run(0, 0, 0.0)
     
-    def get_history(self) -> List[ThetaState]:
-        """상태 히스토리 반환"""
-        return self.history + [self.current_state]
+    def get_history(self) -> ThetaHistory:
+        """상태 히스토리 반환 (run별 마지막 상태, 현재 run 포함, 읽기 전용 view)"""
+        return self.history
@@ -0,0 +1,114 @@
+"""
+Transition Features
+===================
+
+θ=2 전이 센서 입력 (impulse_count, recovery_time) 실시간 추출
+
+trade별 O(1) 상태로 봉 1개씩 증분 계산 (lookback 재계산 없음)
+
+정의 (진입 방향 기준, MFE 경로):
+- impulse: 한 봉에 MFE를 IMPULSE_POINTS 이상 갱신한 봉
+  → impulse_count = 진입 이후 impulse 봉 수
+- pullback: 봉 저점(LONG) / 고점(SHORT)이 MFE 고점에서 PULLBACK_POINTS 이상 되돌림
+- recovery: pullback 이후 MFE 고점을 다시 갱신하기까지 걸린 봉 수
+  → recovery_time = 마지막 회복 봉 수
+     (회복 중이면 현재 고점 이후 경과 봉 수와 비교해 큰 값)
+
+출력은 check_transition()으로 그대로 전달된다.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from .transition_sensor import TransitionSensorResult, check_transition
+from .v7_energy_engine import direction_code
+
+
+class TransitionFeatureState:
+    """trade 1개의 센서 상태"""
+
+    __slots__ = ("direction", "entry_price", "mfe", "bars", "peak_bar",
+                 "impulse_count", "last_recovery", "pulled_back")
+
+    def __init__(self, direction: str, entry_price: float):
+        self.direction = direction_code(direction)
+        self.entry_price = entry_price
+        self.mfe = 0.0
+        self.bars = 0
+        self.peak_bar = 0
+        self.impulse_count = 0
+        self.last_recovery = 0
+        self.pulled_back = False
+
+    @property
+    def recovery_time(self) -> float:
+        if self.pulled_back:
+            return float(max(self.last_recovery, self.bars - self.peak_bar))
+        return float(self.last_recovery)
+
+
+class TransitionFeatureExtractor:
+    """
+    trade별 impulse_count / recovery_time 증분 추출기
+
+    종목 1개 기준: on_bar()는 모든 오픈 trade에 같은 봉을 적용한다.
+    """
+
+    IMPULSE_POINTS = 2.0
+    PULLBACK_POINTS = 1.5
+
+    def __init__(self, impulse_points: Optional[float] = None,
+                 pullback_points: Optional[float] = None):
+        if impulse_points is not None:
+            self.IMPULSE_POINTS = impulse_points
+        if pullback_points is not None:
+            self.PULLBACK_POINTS = pullback_points
+        self.trades: Dict[str, TransitionFeatureState] = {}
+
+    def open(self, trade_id: str, direction: str, entry_price: float):
+        """trade 등록 (잘못된 방향은 ValueError)"""
+        self.trades[trade_id] = TransitionFeatureState(direction, entry_price)
+
+    def close(self, trade_id: str) -> Optional[Tuple[int, float]]:
+        """trade 해제 → 마지막 (impulse_count, recovery_time)"""
+        state = self.trades.pop(trade_id, None)
+        if state is None:
+            return None
+        return state.impulse_count, state.recovery_time
+
+    def update(self, trade_id: str, high: float, low: float) -> Optional[TransitionSensorResult]:
+        """trade 1개에 봉 1개 반영 → 전이 센서 결과"""
+        state = self.trades.get(trade_id)
+        if state is None:
+            return None
+
+        state.bars += 1
+        if state.direction > 0:
+            favorable = high - state.entry_price
+            worst = low - state.entry_price
+        else:
+            favorable = state.entry_price - low
+            worst = state.entry_price - high
+
+        if favorable > state.mfe:
+            if favorable - state.mfe >= self.IMPULSE_POINTS:
+                state.impulse_count += 1
+            if state.pulled_back:
+                state.last_recovery = state.bars - state.peak_bar
+                state.pulled_back = False
+            state.mfe = favorable
+            state.peak_bar = state.bars
+        elif state.mfe - worst >= self.PULLBACK_POINTS:
+            state.pulled_back = True
+
+        return check_transition(state.impulse_count, state.recovery_time)
+
+    def on_bar(self, high: float, low: float) -> Dict[str, TransitionSensorResult]:
+        """모든 오픈 trade에 봉 1개 반영"""
+        return {trade_id: self.update(trade_id, high, low) for trade_id in self.trades}
+
+    def get_features(self, trade_id: str) -> Optional[Tuple[int, float]]:
+        """(impulse_count, recovery_time) 조회 → ThetaEngine.compute 입력"""
+        state = self.trades.get(trade_id)
+        if state is None:
+            return None
+        return state.impulse_count, state.recovery_time
@@ -30,9 +30,17 @@ MFE 5pt is a probabilistic optimization option that increases harvest rate
 at the cost of physical guarantees."
 """
 
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from enum import Enum
+import math
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .rolling_channel import RollingChannel
+from .signal_constants import SIGNAL_NONE, SIGNAL_LONG, SIGNAL_SHORT, DIRECTION_CODES
 
 
 class TradeState(Enum):
@@ -41,26 +49,65 @@ class TradeState(Enum):
     CLOSED = "closed"
 
 
-@dataclass
+# 상태 코드 (포지션 레코드 / 배열 경로 공용)
+STATE_ACTIVE = 0
+STATE_TRAILING = 1
+STATE_CLOSED = 2
+
+STATE_NAMES = {
+    STATE_ACTIVE: TradeState.ACTIVE.value,
+    STATE_TRAILING: TradeState.TRAILING.value,
+    STATE_CLOSED: TradeState.CLOSED.value,
+}
+
+DIRECTION_NAMES = {v: k for k, v in DIRECTION_CODES.items()}
+
+
+def direction_code(direction: str) -> int:
+    """'LONG' / 'SHORT' → ±1 (그 외 값은 ValueError, SHORT로 취급하지 않음)"""
+    code = DIRECTION_CODES.get(direction)
+    if code is None:
+        raise ValueError(f"Unknown direction: {direction!r} (expected 'LONG' or 'SHORT')")
+    return code
+
+
 class V7Position:
-    direction: str  # 'LONG' or 'SHORT'
-    entry_price: float
-    entry_time: str
-    sl: float = 30.0
+    """
+    포지션 레코드 (__slots__)
     
-    mfe: float = 0.0
-    current_pnl: float = 0.0
-    trailing_stop: Optional[float] = None
-    state: TradeState = TradeState.ACTIVE
-    bars: int = 0  # 경과 캔들 수 (SL Defense용)
+    상수(MFE_THRESHOLD, LWS_BARS, DEFENSE_SL …)는 V7EnergyEngine에만 둔다.
+    direction: +1 (LONG) / -1 (SHORT), state: STATE_* 코드
+    """
     
-    MFE_THRESHOLD: float = 7.0
-    TRAIL_OFFSET: float = 1.5
+    __slots__ = ('direction', 'entry_price', 'entry_time', 'sl', 'mfe',
+                 'current_pnl', 'trailing_stop', 'state', 'bars')
     
-    # SL Defense (G3)
-    LWS_BARS: int = 4          # Loss Warning State 발동 캔들 수
-    LWS_MFE_THRESHOLD: float = 1.5  # LWS MFE 임계점
-    DEFENSE_SL: float = 12.0   # 축소된 SL
+    def __init__(self, direction: int, entry_price: float, entry_time: str,
+                 sl: float = 30.0):
+        self.direction = direction
+        self.entry_price = entry_price
+        self.entry_time = entry_time
+        self.sl = sl
+        self.mfe = 0.0
+        self.current_pnl = 0.0
+        self.trailing_stop: Optional[float] = None
+        self.state = STATE_ACTIVE
+        self.bars = 0  # 경과 캔들 수 (SL Defense용)
+
+
+@dataclass(frozen=True)
+class ClosedPosition:
+    """청산 포지션 아카이브 레코드"""
+    trade_id: str
+    direction: str
+    entry_price: float
+    entry_time: str
+    exit_type: str  # 'TRAIL_WIN', 'LOSS' or 'MANUAL'
+    exit_pnl: float
+    mfe: float
+    current_pnl: float
+    trailing_stop: Optional[float]
+    bars: int
 
 
 class V7EnergyEngine:
@@ -72,6 +119,9 @@ class V7EnergyEngine:
     - trailing_stop = entry_price + (MFE - 1.5pt)
     - 에너지 78% 보존
     - SL Defense: 4봉 내 MFE < 1.5pt → SL -12pt
+    
+    청산된 포지션은 positions에서 제거되어 closed_positions
+    (최근 archive_size건 보관, 0이면 보관 안 함)로 이동한다.
     """
     
     MFE_THRESHOLD = 7.0
@@ -83,14 +133,18 @@ class V7EnergyEngine:
     LWS_MFE_THRESHOLD = 1.5   # LWS MFE 임계점
     DEFENSE_SL = 12.0         # 축소된 SL
     
-    def __init__(self):
+    ARCHIVE_SIZE = 10000      # 청산 포지션 보관 건수
+    
+    def __init__(self, archive_size: Optional[int] = None):
         self.positions = {}
+        self.archive_size = self.ARCHIVE_SIZE if archive_size is None else archive_size
+        self.closed_positions: OrderedDict = OrderedDict()
     
     def open_position(self, trade_id: str, direction: str, 
                       entry_price: float, entry_time: str) -> V7Position:
-        """새 포지션 오픈"""
+        """새 포지션 오픈 (direction: 'LONG' or 'SHORT', 그 외는 ValueError)"""
         position = V7Position(
-            direction=direction,
+            direction=direction_code(direction),
             entry_price=entry_price,
             entry_time=entry_time,
             sl=self.DEFAULT_SL
@@ -106,12 +160,8 @@ class V7EnergyEngine:
         Returns:
             (exit_type, exit_pnl) or (None, 0) if still open
         """
-        if trade_id not in self.positions:
-            return None, 0
-        
-        pos = self.positions[trade_id]
-        
-        if pos.state == TradeState.CLOSED:
+        pos = self.positions.get(trade_id)
+        if pos is None:
             return None, 0
         
         # 캔들 카운트 증가
@@ -121,78 +171,187 @@ class V7EnergyEngine:
         if pos.bars >= self.LWS_BARS and pos.mfe < self.LWS_MFE_THRESHOLD:
             pos.sl = self.DEFENSE_SL  # SL 축소
         
-        if pos.direction == 'LONG':
-            bar_mfe = high - pos.entry_price
-            pos.mfe = max(pos.mfe, bar_mfe)
-            pos.current_pnl = close - pos.entry_price
+        entry = pos.entry_price
+        
+        if pos.direction > 0:
+            bar_mfe = high - entry
+            if bar_mfe > pos.mfe:
+                pos.mfe = bar_mfe
+            pos.current_pnl = close - entry
             
-            if pos.mfe >= self.MFE_THRESHOLD and pos.state == TradeState.ACTIVE:
-                pos.state = TradeState.TRAILING
-                pos.trailing_stop = pos.entry_price + (pos.mfe - self.TRAIL_OFFSET)
+            if pos.state == STATE_ACTIVE and pos.mfe >= self.MFE_THRESHOLD:
+                pos.state = STATE_TRAILING
+                pos.trailing_stop = entry + (pos.mfe - self.TRAIL_OFFSET)
             
-            if pos.state == TradeState.TRAILING:
+            if pos.state == STATE_TRAILING:
                 pos.trailing_stop = max(
                     pos.trailing_stop,
-                    pos.entry_price + (pos.mfe - self.TRAIL_OFFSET)
+                    entry + (pos.mfe - self.TRAIL_OFFSET)
                 )
                 if low <= pos.trailing_stop:
-                    exit_pnl = max(pos.trailing_stop - pos.entry_price, 1)
-                    pos.state = TradeState.CLOSED
-                    return 'TRAIL_WIN', exit_pnl
+                    exit_pnl = max(pos.trailing_stop - entry, 1)
+                    return self._archive(trade_id, 'TRAIL_WIN', exit_pnl)
             
-            if low <= pos.entry_price - pos.sl:
-                pos.state = TradeState.CLOSED
-                return 'LOSS', -pos.sl
+            if low <= entry - pos.sl:
+                return self._archive(trade_id, 'LOSS', -pos.sl)
         
         else:
-            bar_mfe = pos.entry_price - low
-            pos.mfe = max(pos.mfe, bar_mfe)
-            pos.current_pnl = pos.entry_price - close
+            bar_mfe = entry - low
+            if bar_mfe > pos.mfe:
+                pos.mfe = bar_mfe
+            pos.current_pnl = entry - close
             
-            if pos.mfe >= self.MFE_THRESHOLD and pos.state == TradeState.ACTIVE:
-                pos.state = TradeState.TRAILING
-                pos.trailing_stop = pos.entry_price - (pos.mfe - self.TRAIL_OFFSET)
+            if pos.state == STATE_ACTIVE and pos.mfe >= self.MFE_THRESHOLD:
+                pos.state = STATE_TRAILING
+                pos.trailing_stop = entry - (pos.mfe - self.TRAIL_OFFSET)
             
-            if pos.state == TradeState.TRAILING:
+            if pos.state == STATE_TRAILING:
                 pos.trailing_stop = min(
                     pos.trailing_stop,
-                    pos.entry_price - (pos.mfe - self.TRAIL_OFFSET)
+                    entry - (pos.mfe - self.TRAIL_OFFSET)
                 )
                 if high >= pos.trailing_stop:
-                    exit_pnl = max(pos.entry_price - pos.trailing_stop, 1)
-                    pos.state = TradeState.CLOSED
-                    return 'TRAIL_WIN', exit_pnl
+                    exit_pnl = max(entry - pos.trailing_stop, 1)
+                    return self._archive(trade_id, 'TRAIL_WIN', exit_pnl)
             
-            if high >= pos.entry_price + pos.sl:
-                pos.state = TradeState.CLOSED
-                return 'LOSS', -pos.sl
+            if high >= entry + pos.sl:
+                return self._archive(trade_id, 'LOSS', -pos.sl)
         
         return None, 0
     
+    def start_bar(self, trade_id: str):
+        """
+        틱 모드: 새 봉 시작
+        
+        경과 봉 수 증가 + SL Defense (G3) 체크 (update_position과 같은 시점)
+        """
+        pos = self.positions.get(trade_id)
+        if pos is None:
+            return
+        
+        pos.bars += 1
+        if pos.bars >= self.LWS_BARS and pos.mfe < self.LWS_MFE_THRESHOLD:
+            pos.sl = self.DEFENSE_SL
+    
+    def update_tick(self, trade_id: str, price: float) -> Tuple[Optional[str], float]:
+        """
+        틱 모드: 체결가 1개로 포지션 업데이트
+        
+        트레일링 / SL을 봉 마감을 기다리지 않고 즉시 판정한다.
+        
+        Returns:
+            (exit_type, exit_pnl) or (None, 0) if still open
+        """
+        pos = self.positions.get(trade_id)
+        if pos is None:
+            return None, 0
+        
+        entry = pos.entry_price
+        move = price - entry if pos.direction > 0 else entry - price
+        if move > pos.mfe:
+            pos.mfe = move
+        pos.current_pnl = move
+        
+        if pos.state == STATE_ACTIVE and pos.mfe >= self.MFE_THRESHOLD:
+            pos.state = STATE_TRAILING
+            pos.trailing_stop = entry + pos.direction * (pos.mfe - self.TRAIL_OFFSET)
+        
+        if pos.state == STATE_TRAILING:
+            if pos.direction > 0:
+                pos.trailing_stop = max(pos.trailing_stop, entry + (pos.mfe - self.TRAIL_OFFSET))
+                if price <= pos.trailing_stop:
+                    return self._archive(trade_id, 'TRAIL_WIN', max(pos.trailing_stop - entry, 1))
+            else:
+                pos.trailing_stop = min(pos.trailing_stop, entry - (pos.mfe - self.TRAIL_OFFSET))
+                if price >= pos.trailing_stop:
+                    return self._archive(trade_id, 'TRAIL_WIN', max(entry - pos.trailing_stop, 1))
+        
+        if move <= -pos.sl:
+            return self._archive(trade_id, 'LOSS', -pos.sl)
+        
+        return None, 0
+    
+    def _archive(self, trade_id: str, exit_type: str,
+                 exit_pnl: float) -> Tuple[str, float]:
+        """포지션 청산 → live map에서 제거 후 아카이브"""
+        pos = self.positions.pop(trade_id)
+        pos.state = STATE_CLOSED
+        
+        if self.archive_size > 0:
+            self.closed_positions[trade_id] = ClosedPosition(
+                trade_id=trade_id,
+                direction=DIRECTION_NAMES[pos.direction],
+                entry_price=pos.entry_price,
+                entry_time=pos.entry_time,
+                exit_type=exit_type,
+                exit_pnl=exit_pnl,
+                mfe=pos.mfe,
+                current_pnl=pos.current_pnl,
+                trailing_stop=pos.trailing_stop,
+                bars=pos.bars,
+            )
+            # 재사용된 trade_id → 가장 최근 청산으로 이동
+            self.closed_positions.move_to_end(trade_id)
+            while len(self.closed_positions) > self.archive_size:
+                self.closed_positions.popitem(last=False)
+        
+        return exit_type, exit_pnl
+    
     def get_position_status(self, trade_id: str) -> Optional[dict]:
-        """포지션 상태 조회"""
-        if trade_id not in self.positions:
+        """포지션 상태 조회 (live 우선, 없으면 아카이브)"""
+        pos = self.positions.get(trade_id)
+        if pos is not None:
+            return {
+                'direction': DIRECTION_NAMES[pos.direction],
+                'entry_price': pos.entry_price,
+                'mfe': pos.mfe,
+                'current_pnl': pos.current_pnl,
+                'state': STATE_NAMES[pos.state],
+                'trailing_stop': pos.trailing_stop,
+                'trailing_active': pos.state == STATE_TRAILING
+            }
+        
+        closed = self.closed_positions.get(trade_id)
+        if closed is None:
             return None
         
-        pos = self.positions[trade_id]
         return {
-            'direction': pos.direction,
-            'entry_price': pos.entry_price,
-            'mfe': pos.mfe,
-            'current_pnl': pos.current_pnl,
-            'state': pos.state.value,
-            'trailing_stop': pos.trailing_stop,
-            'trailing_active': pos.state == TradeState.TRAILING
+            'direction': closed.direction,
+            'entry_price': closed.entry_price,
+            'mfe': closed.mfe,
+            'current_pnl': closed.current_pnl,
+            'state': TradeState.CLOSED.value,
+            'trailing_stop': closed.trailing_stop,
+            'trailing_active': False
         }
     
+    def get_recent_closes(self, n: Optional[int] = None) -> List[ClosedPosition]:
+        """최근 청산 n건 (오래된 순)"""
+        if n is None:
+            return list(self.closed_positions.values())
+        
+        recent = []
+        for trade_id in reversed(self.closed_positions):
+            if len(recent) >= n:
+                break
+            recent.append(self.closed_positions[trade_id])
+        recent.reverse()
+        return recent
+    
     def close_position(self, trade_id: str) -> Optional[float]:
-        """포지션 수동 청산"""
+        """
+        포지션 수동 청산
+        
+        이미 청산된 포지션이면 아카이브의 current_pnl을 그대로 반환한다
+        (아카이브에서 밀려났거나 archive_size=0이면 None).
+        """
         if trade_id not in self.positions:
-            return None
+            closed = self.closed_positions.get(trade_id)
+            return None if closed is None else closed.current_pnl
         
-        pos = self.positions[trade_id]
-        pos.state = TradeState.CLOSED
-        return pos.current_pnl
+        pnl = self.positions[trade_id].current_pnl
+        self._archive(trade_id, 'MANUAL', pnl)
+        return pnl
 
 
 def check_stb_entry(candle: dict, history: list) -> Optional[str]:
@@ -220,10 +379,10 @@ def check_stb_entry(candle: dict, history: list) -> Optional[str]:
     
     channel_pct = ((c - min(lows)) / ch_range) * 100
     
-    import numpy as np
     bodies = [abs(x['close'] - x['open']) for x in history[-50:]]
     body = abs(candle['close'] - candle['open'])
-    body_z = (body - np.mean(bodies)) / np.std(bodies) if np.std(bodies) > 0 else 0
+    body_std = np.std(bodies)
+    body_z = (body - np.mean(bodies)) / body_std if body_std > 0 else 0
     
     if abs(body_z) < 1.0:
         return None
@@ -234,3 +393,183 @@ def check_stb_entry(candle: dict, history: list) -> Optional[str]:
         return 'LONG'
     
     return None
+
+
+@dataclass
+class STBScanResult:
+    """scan_stb_signals 결과 (모든 컬럼은 입력과 같은 길이)"""
+    signal: np.ndarray       # int8: SIGNAL_LONG / SIGNAL_SHORT / SIGNAL_NONE
+    ratio: np.ndarray        # float64
+    channel_pct: np.ndarray  # float64, history 50봉 미만 구간은 NaN
+    body_z: np.ndarray       # float64, history 50봉 미만 구간은 NaN
+
+
+def scan_stb_signals(open_, high, low, close,
+                     chunk_size: int = 65536) -> STBScanResult:
+    """
+    STB 진입 조건 배치 스캔 (check_stb_entry의 전체 시계열 버전)
+    
+    bar i의 판정은 check_stb_entry(candle[i], candles[:i])와 동일하다.
+    채널/바디 통계는 sliding window로 계산하며, 50봉 바디 윈도우는
+    메모리 상한을 위해 chunk_size 행 단위로 나누어 처리한다.
+    """
+    o = np.ascontiguousarray(open_, dtype=np.float64)
+    h = np.ascontiguousarray(high, dtype=np.float64)
+    l = np.ascontiguousarray(low, dtype=np.float64)
+    c = np.ascontiguousarray(close, dtype=np.float64)
+    n = len(c)
+    
+    signal = np.zeros(n, dtype=np.int8)
+    ratio = np.maximum(c - l, 0.01) / np.maximum(h - c, 0.01)
+    channel_pct = np.full(n, np.nan)
+    body_z = np.full(n, np.nan)
+    
+    warmup = StreamingSTBDetector.BODY_BARS
+    ch_bars = StreamingSTBDetector.CHANNEL_BARS
+    if n <= warmup:
+        return STBScanResult(signal, ratio, channel_pct, body_z)
+    
+    # bar i의 채널 = bar i-20 ~ i-1
+    skip = warmup - ch_bars
+    ch_high = sliding_window_view(h[:-1], ch_bars).max(axis=1)[skip:]
+    ch_low = sliding_window_view(l[:-1], ch_bars).min(axis=1)[skip:]
+    ch_range = ch_high - ch_low
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        channel_pct[warmup:] = ((c[warmup:] - ch_low) / ch_range) * 100
+    
+    # bar i의 바디 통계 = bar i-50 ~ i-1
+    bodies = np.abs(c - o)
+    windows = sliding_window_view(bodies[:-1], warmup)
+    z = body_z[warmup:]
+    for start in range(0, len(windows), chunk_size):
+        w = windows[start:start + chunk_size]
+        mean = w.mean(axis=1)
+        std = w.std(axis=1)
+        body = bodies[warmup + start:warmup + start + len(w)]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z[start:start + len(w)] = np.where(std > 0, (body - mean) / std, 0.0)
+    
+    r = ratio[warmup:]
+    pct = channel_pct[warmup:]
+    valid = (ch_range >= 30) & (np.abs(z) >= 1.0)
+    is_short = valid & (r > 1.5) & (pct > 80)
+    is_long = valid & ~is_short & (r < 0.7) & (pct < 20)
+    
+    out = signal[warmup:]
+    out[is_short] = SIGNAL_SHORT
+    out[is_long] = SIGNAL_LONG
+    
+    return STBScanResult(signal, ratio, channel_pct, body_z)
+
+
+class StreamingSTBDetector:
+    """
+    STB 진입 조건 스트리밍 검출기 (봉당 O(1))
+    
+    check_stb_entry(candle, history)와 동일한 LONG/SHORT/None을 반환하되,
+    history 슬라이싱 대신 상태를 유지한다:
+    - 20봉 채널 고가/저가: RollingChannel (monotonic deque)
+    - 50봉 body 평균/분산: rolling Welford (분산 ≈ 0이면 윈도우에서 재계산)
+    
+    update(candle)은 지금까지 입력된 캔들을 history로 보고 판정한 뒤
+    해당 캔들을 history에 편입한다.
+    """
+    
+    CHANNEL_BARS = 20
+    BODY_BARS = 50
+    RESYNC_INTERVAL = 10000   # rolling 분산 누적 오차 재동기화 주기
+    M2_EPSILON = 1e-9         # m2 < ε·n·(mean²+1) → 윈도우에서 정확히 재계산
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """상태 리셋"""
+        self.count = 0
+        self._channel = RollingChannel(self.CHANNEL_BARS)
+        self._bodies = deque()
+        self._body_mean = 0.0
+        self._body_m2 = 0.0
+        self._since_resync = 0
+    
+    @property
+    def ready(self) -> bool:
+        return self.count >= self.BODY_BARS
+    
+    def update(self, candle: dict) -> Optional[str]:
+        """캔들 dict 입력 → 'LONG', 'SHORT' or None"""
+        return self.push(candle['open'], candle['high'],
+                         candle['low'], candle['close'])
+    
+    def push(self, open_: float, high: float, low: float,
+             close: float) -> Optional[str]:
+        """OHLC 입력 → 'LONG', 'SHORT' or None"""
+        signal = None
+        if self.count >= self.BODY_BARS:
+            signal = self._evaluate(open_, high, low, close)
+        self._append(open_, high, low, close)
+        return signal
+    
+    def _evaluate(self, o: float, h: float, l: float, c: float) -> Optional[str]:
+        ratio = max(c - l, 0.01) / max(h - c, 0.01)
+        
+        ch_low = self._channel.low
+        ch_range = self._channel.range
+        
+        if ch_range < 30:
+            return None
+        
+        channel_pct = ((c - ch_low) / ch_range) * 100
+        
+        n = len(self._bodies)
+        body_mean = self._body_mean
+        if self._body_m2 > self.M2_EPSILON * n * (body_mean * body_mean + 1):
+            body_std = math.sqrt(self._body_m2 / n)
+        else:
+            # (거의) 일정한 윈도우: rolling 잔차(~1e-12) 대신 np.std와 같은 값으로 재계산
+            bodies = list(self._bodies)
+            body_mean = np.mean(bodies)
+            body_std = np.std(bodies)
+        body_z = (abs(c - o) - body_mean) / body_std if body_std > 0 else 0
+        
+        if abs(body_z) < 1.0:
+            return None
+        
+        if ratio > 1.5 and channel_pct > 80:
+            return 'SHORT'
+        elif ratio < 0.7 and channel_pct < 20:
+            return 'LONG'
+        
+        return None
+    
+    def _append(self, o: float, h: float, l: float, c: float):
+        self.count += 1
+        self._channel.push(h, l)
+        
+        # 50봉 body (rolling Welford)
+        body = abs(c - o)
+        bodies = self._bodies
+        if len(bodies) < self.BODY_BARS:
+            bodies.append(body)
+            delta = body - self._body_mean
+            self._body_mean += delta / len(bodies)
+            self._body_m2 += delta * (body - self._body_mean)
+            return
+        
+        old = bodies.popleft()
+        bodies.append(body)
+        old_mean = self._body_mean
+        self._body_mean += (body - old) / self.BODY_BARS
+        self._body_m2 += (body - old) * (body - self._body_mean + old - old_mean)
+        
+        self._since_resync += 1
+        if self._since_resync >= self.RESYNC_INTERVAL:
+            self._resync()
+    
+    def _resync(self):
+        """누적 부동소수 오차 제거 (윈도우 재계산, 분할상환 O(1))"""
+        n = len(self._bodies)
+        self._body_mean = sum(self._bodies) / n
+        self._body_m2 = sum((b - self._body_mean) ** 2 for b in self._bodies)
+        self._since_resync = 0
@@ -17,6 +17,7 @@ import sys
 sys.path.insert(0, '/home/runner/workspace/v7-grammar-system')
 
 from opa.authority_engine import AuthorityEngine, AuthorityRequest, Authority
+from opa.policy_snapshot import PolicySnapshot, policy_snapshot
 from opa.size_manager import get_position_size, AccountConfig
 from opa.state_logger import StateLogger
 
@@ -30,6 +31,7 @@ class EntryOrder:
     theta: int
     tp: float
     sl: float
+    policy: Optional[PolicySnapshot] = None
 
 
 class EntryGate:
@@ -59,18 +61,18 @@ class EntryGate:
         if response.authority == Authority.DENY:
             return None
         
-        size = get_position_size(theta, self.account)
-        
-        from opa.policy_v74 import get_policy
-        policy = get_policy(theta)
+        # θ 정책은 요청당 1회 조회 (size / TP / SL / 청산 규칙 공유)
+        policy = policy_snapshot(theta)
+        size = get_position_size(theta, self.account, policy)
         
         return EntryOrder(
             signal=signal,
             direction=direction,
             size=size,
             theta=theta,
-            tp=policy.get("tp", 20),
-            sl=policy.get("sl", 12),
+            tp=policy.tp,
+            sl=policy.sl,
+            policy=policy,
         )
     
     def execute(self, order: EntryOrder):
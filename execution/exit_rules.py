@@ -15,7 +15,7 @@ from typing import Optional
 import sys
 sys.path.insert(0, '/home/runner/workspace/v7-grammar-system')
 
-from opa.policy_v74 import get_policy, can_trail
+from opa.policy_snapshot import PolicySnapshot, policy_snapshot
 
 
 @dataclass
@@ -35,8 +35,13 @@ class ExitRules:
         self.timeout = timeout
     
     def evaluate(self, theta: int, current_pnl: float, bars: int,
-                 trailing_enabled: bool = False, peak_pnl: float = 0) -> ExitDecision:
-        """청산 결정"""
+                 trailing_enabled: bool = False, peak_pnl: float = 0,
+                 policy: Optional[PolicySnapshot] = None) -> ExitDecision:
+        """
+        청산 결정
+        
+        policy: 진입 시 조회한 snapshot (EntryOrder.policy, 없으면 θ로 조회)
+        """
         
         if current_pnl <= -self.sl:
             return ExitDecision(
@@ -59,7 +64,10 @@ class ExitRules:
                 pnl=current_pnl,
             )
         
-        if theta >= 3 and trailing_enabled and can_trail(theta):
+        if policy is None:
+            policy = policy_snapshot(theta)
+        
+        if theta >= 3 and trailing_enabled and policy.trail:
             trailing_sl = peak_pnl * 0.5
             if current_pnl < trailing_sl and peak_pnl > 10:
                 return ExitDecision(
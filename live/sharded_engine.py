@@ -0,0 +1,241 @@
+"""
+Sharded Energy Engine
+=====================
+
+다중 종목 실시간 엔진 (종목 → 워커 프로세스 샤딩)
+
+구조:
+- 종목마다 StreamingSTBDetector + PositionBook 1세트
+- 종목은 워커 프로세스에 고정 배정 (등록 순서 round-robin)
+- 봉 마감 1회 = step 1개 (basket 전체 {symbol: OHLC})
+- 청산 이벤트는 (step, 종목 등록 순서, 진입 순서)로 병합된
+  단일 순서 스트림으로 반환 → 로깅 / OPA 결과 기록
+
+판정 규칙은 core/와 동일 (변경 없음):
+bar에서 STB 진입 → 진입 봉 포함 모든 오픈 포지션 업데이트
+"""
+
+import multiprocessing as mp
+import queue
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from core.v7_energy_engine import V7EnergyEngine, StreamingSTBDetector, DIRECTION_CODES
+from core.position_book import PositionBook
+
+
+@dataclass
+class TradeEvent:
+    """청산 이벤트"""
+    step: int
+    time: Optional[str]
+    symbol: str
+    trade_id: str
+    direction: str
+    entry_price: float
+    exit_type: str
+    pnl: float
+    exit_price: float   # 실제 청산가 (TRAIL_WIN = trailing stop, 최소 1pt 보정 전)
+
+    @property
+    def is_win(self) -> bool:
+        return self.pnl > 0
+
+
+class _Shard:
+    """워커 1개가 담당하는 종목 묶음"""
+
+    def __init__(self, symbols: Sequence[str], engine_params: Optional[Dict] = None):
+        engine = V7EnergyEngine(archive_size=0)
+        for name, value in (engine_params or {}).items():
+            setattr(engine, name, value)
+
+        self.detectors = {s: StreamingSTBDetector() for s in symbols}
+        self.books = {s: PositionBook(engine, capacity=16) for s in symbols}
+        self.entries: Dict[str, Tuple[str, float, int]] = {}   # trade_id → (방향, 진입가, 슬롯)
+        self.trade_count = 0
+
+    def process(self, step: int, time: Optional[str],
+                bars: Dict[str, Tuple[float, float, float, float]]) -> List[TradeEvent]:
+        events = []
+        for symbol, (o, h, l, c) in bars.items():
+            book = self.books[symbol]
+
+            direction = self.detectors[symbol].push(o, h, l, c)
+            if direction:
+                trade_id = f"{symbol}-T{self.trade_count}"
+                self.trade_count += 1
+                slot = book.open_position(trade_id, direction, c, time)
+                self.entries[trade_id] = (direction, c, slot)
+
+            # 청산 슬롯은 다음 open_position 전까지 재사용되지 않음 → stop 값 그대로
+            for trade_id, exit_type, pnl in book.update(h, l, c):
+                direction, entry_price, slot = self.entries.pop(trade_id)
+                if exit_type == 'TRAIL_WIN':
+                    exit_price = float(book.trailing_stop[slot])
+                else:
+                    exit_price = entry_price + DIRECTION_CODES[direction] * pnl
+                events.append(TradeEvent(step, time, symbol, trade_id, direction,
+                                         entry_price, exit_type, pnl, exit_price))
+        return events
+
+
+def _worker_main(worker_id: int, symbols: Sequence[str], engine_params: Optional[Dict],
+                 in_queue, out_queue):
+    shard = _Shard(symbols, engine_params)
+    while True:
+        message = in_queue.get()
+        if message is None:
+            break
+        step, time, bars = message
+        out_queue.put((worker_id, step, shard.process(step, time, bars)))
+
+
+class ShardedEngineRuntime:
+    """
+    다중 종목 샤딩 런타임
+
+    n_workers=0 → 현재 프로세스에서 동기 실행 (디버그/테스트용)
+    on_close: 순서 병합된 청산 이벤트마다 호출 (예: OPA 결과 기록)
+    with 문으로 쓰면 종료 시 close() 호출
+    """
+
+    LIVENESS_INTERVAL = 0.5   # poll(block=True) 대기 중 워커 생존 확인 주기 (초)
+
+    def __init__(self, symbols: Sequence[str], n_workers: Optional[int] = None,
+                 engine_params: Optional[Dict] = None,
+                 on_close: Optional[Callable[[TradeEvent], None]] = None):
+        if n_workers is None:
+            n_workers = min(len(symbols), mp.cpu_count())
+
+        self.symbols = list(symbols)
+        self.symbol_order = {s: i for i, s in enumerate(self.symbols)}
+        self.on_close = on_close
+        self.n_workers = n_workers
+
+        shards = max(n_workers, 1)
+        self.worker_of = {s: i % shards for i, s in enumerate(self.symbols)}
+
+        self._next_step = 0
+        self._release_step = 0
+        self._pending: Dict[int, List] = {}   # step → [남은 응답 수, 이벤트]
+
+        self._local = None
+        self._workers = []
+        self._in_queues = []
+
+        if n_workers == 0:
+            self._local = _Shard(self.symbols, engine_params)
+            return
+
+        self._out_queue = mp.Queue()
+        for worker_id in range(shards):
+            worker_symbols = [s for s in self.symbols if self.worker_of[s] == worker_id]
+            in_queue = mp.Queue()
+            process = mp.Process(
+                target=_worker_main,
+                args=(worker_id, worker_symbols, engine_params, in_queue, self._out_queue),
+                daemon=True,
+            )
+            process.start()
+            self._in_queues.append(in_queue)
+            self._workers.append(process)
+
+    def submit(self, bars: Dict[str, Tuple[float, float, float, float]],
+               time: Optional[str] = None) -> int:
+        """봉 마감 1회 제출 (비동기) → step 번호 (미등록 종목은 ValueError, step 미할당)"""
+        unknown = [s for s in bars if s not in self.symbol_order]
+        if unknown:
+            raise ValueError(f"Unregistered symbols: {unknown}")
+
+        step = self._next_step
+        self._next_step += 1
+
+        if self._local is not None:
+            self._pending[step] = [0, self._local.process(step, time, bars)]
+            return step
+
+        per_worker: Dict[int, Dict] = {}
+        for symbol, bar in bars.items():
+            per_worker.setdefault(self.worker_of[symbol], {})[symbol] = bar
+
+        self._pending[step] = [len(per_worker), []]
+        for worker_id, worker_bars in per_worker.items():
+            self._in_queues[worker_id].put((step, time, worker_bars))
+        return step
+
+    def poll(self, block: bool = False) -> List[TradeEvent]:
+        """
+        완료된 step의 청산 이벤트를 순서대로 반환
+
+        block=True → 다음 순번 step이 완료될 때까지 대기
+        (대기 중 워커가 종료되면 RuntimeError)
+        """
+        if self._local is None:
+            while self._waiting():
+                try:
+                    _, step, events = self._out_queue.get(
+                        block=block, timeout=self.LIVENESS_INTERVAL if block else None)
+                except queue.Empty:
+                    if not block:
+                        break
+                    self._check_workers()
+                    continue
+                entry = self._pending[step]
+                entry[0] -= 1
+                entry[1].extend(events)
+                if self._ready(self._release_step):
+                    block = False
+
+        released = []
+        while self._ready(self._release_step):
+            events = self._pending.pop(self._release_step)[1]
+            events.sort(key=lambda e: self.symbol_order[e.symbol])
+            released.extend(events)
+            self._release_step += 1
+
+        if self.on_close is not None:
+            for event in released:
+                self.on_close(event)
+        return released
+
+    def _ready(self, step: int) -> bool:
+        entry = self._pending.get(step)
+        return entry is not None and entry[0] == 0
+
+    def _waiting(self) -> bool:
+        return any(entry[0] > 0 for entry in self._pending.values())
+
+    def _check_workers(self):
+        for worker_id, process in enumerate(self._workers):
+            if not process.is_alive():
+                raise RuntimeError(
+                    f"Shard worker {worker_id} exited (exitcode={process.exitcode})")
+
+    def step(self, bars: Dict[str, Tuple[float, float, float, float]],
+             time: Optional[str] = None) -> List[TradeEvent]:
+        """봉 마감 1회 제출 후 완료 대기"""
+        self.submit(bars, time)
+        return self.flush()
+
+    def flush(self) -> List[TradeEvent]:
+        """제출된 모든 step 완료 대기"""
+        released = []
+        while self._release_step < self._next_step:
+            released.extend(self.poll(block=True))
+        return released
+
+    def close(self):
+        """워커 종료"""
+        for in_queue in self._in_queues:
+            in_queue.put(None)
+        for process in self._workers:
+            process.join()
+        self._workers = []
+        self._in_queues = []
+
+    def __enter__(self) -> "ShardedEngineRuntime":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,150 @@
+"""
+Tick Bar Aggregator
+===================
+
+틱 → 봉 스트리밍 집계 + 틱 단위 손절/트레일링 판정
+
+별도 bar builder 프로세스 없이 틱 iterator를 직접 엔진에 공급한다.
+
+- 봉 집계: timeframe(초) 버킷, 현재 봉 1개만 유지 (메모리 고정)
+- STB 진입: 봉 마감 시 StreamingSTBDetector → 마감가 진입
+- 봉 시작: engine.start_bar() (경과 봉 수 + SL Defense)
+- 틱: engine.update_tick() (트레일링 / SL 즉시 판정)
+- 빈 버킷: 직전 종가 flat 봉으로 채움 (on_bar / STB / 경과 봉 수 모두 반영,
+  직전 종가로 틱 판정 1회) → 시간 기준 봉 수가 줄지 않음
+- 틱 시각은 non-decreasing (이전 틱보다 이르면 ValueError)
+  세션 경계는 flush()로 끊는다 (flush 후 첫 틱은 빈 버킷을 채우지 않음)
+
+진입 봉은 경과 봉 1로 계산한다 (update_position 백테스트와 같은 LWS 시점).
+봉 안에서 유리한 극값 → 불리한 극값 순서로 틱이 오면
+update_position(high, low, close)과 같은 청산 유형 / PnL.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from core.v7_energy_engine import V7EnergyEngine, StreamingSTBDetector
+
+
+@dataclass
+class Bar:
+    """집계 봉"""
+    start: float      # 버킷 시작 (epoch seconds)
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float = 0.0
+    ticks: int = 0
+
+
+class TickBarAggregator:
+    """
+    틱 → 봉 집계기
+
+    on_tick(ts, price, size) → 이번 틱에 청산된 포지션
+    [(trade_id, exit_type, exit_pnl), ...]
+    """
+
+    def __init__(self, engine: Optional[V7EnergyEngine] = None, timeframe: float = 60.0,
+                 auto_entry: bool = True,
+                 on_bar: Optional[Callable[[Bar], None]] = None,
+                 on_entry: Optional[Callable[[str, str, float], None]] = None):
+        self.engine = engine if engine is not None else V7EnergyEngine()
+        self.timeframe = timeframe
+        self.detector = StreamingSTBDetector() if auto_entry else None
+        self.on_bar = on_bar
+        self.on_entry = on_entry
+
+        self.bar: Optional[Bar] = None
+        self.last_bar: Optional[Bar] = None
+        self.last_ts: Optional[float] = None
+        self.trade_count = 0
+
+    def on_tick(self, ts, price: float,
+                size: float = 0.0) -> List[Tuple[str, str, float]]:
+        """틱 1개 처리 (ts: epoch seconds 또는 datetime)"""
+        if hasattr(ts, "timestamp"):
+            ts = ts.timestamp()
+        if self.last_ts is not None and ts < self.last_ts:
+            raise ValueError(f"Tick out of order: {ts} < previous {self.last_ts}")
+        self.last_ts = ts
+        start = math.floor(ts / self.timeframe) * self.timeframe
+
+        exits = []
+        bar = self.bar
+        if bar is None or start != bar.start:
+            if bar is not None:
+                self._close_bar(bar)
+                exits = self._fill_gap(bar, start)
+            bar = self.bar = Bar(start, price, price, price, price)
+            self._start_bar()
+        else:
+            if price > bar.high:
+                bar.high = price
+            if price < bar.low:
+                bar.low = price
+            bar.close = price
+        bar.volume += size
+        bar.ticks += 1
+
+        exits.extend(self._update(price))
+        return exits
+
+    def _start_bar(self):
+        for trade_id in self.engine.positions:
+            self.engine.start_bar(trade_id)
+
+    def _update(self, price: float) -> List[Tuple[str, str, float]]:
+        exits = []
+        for trade_id in list(self.engine.positions):
+            exit_type, pnl = self.engine.update_tick(trade_id, price)
+            if exit_type:
+                exits.append((trade_id, exit_type, pnl))
+        return exits
+
+    def _fill_gap(self, prev: Bar, start: float) -> List[Tuple[str, str, float]]:
+        """prev 다음 ~ start 이전 빈 버킷 → 직전 종가 flat 봉"""
+        exits = []
+        n_empty = round((start - prev.start) / self.timeframe) - 1
+        close = prev.close
+        for k in range(1, n_empty + 1):
+            empty = Bar(prev.start + k * self.timeframe, close, close, close, close)
+            self._start_bar()
+            exits.extend(self._update(close))
+            self._close_bar(empty)
+        return exits
+
+    def _close_bar(self, bar: Bar):
+        self.last_bar = bar
+        if self.on_bar is not None:
+            self.on_bar(bar)
+
+        if self.detector is None:
+            return
+
+        direction = self.detector.push(bar.open, bar.high, bar.low, bar.close)
+        if direction:
+            trade_id = f"T{self.trade_count}"
+            self.trade_count += 1
+            self.engine.open_position(trade_id, direction, bar.close, str(bar.start))
+            self.engine.start_bar(trade_id)
+            if self.on_entry is not None:
+                self.on_entry(trade_id, direction, bar.close)
+
+    def flush(self) -> Optional[Bar]:
+        """현재 봉 강제 마감 (세션 종료 등)"""
+        bar = self.bar
+        if bar is not None:
+            self._close_bar(bar)
+            self.bar = None
+        return bar
+
+    def run(self, ticks: Iterable[Tuple]) -> List[Tuple[str, str, float]]:
+        """(ts, price[, size]) iterator 소비 → 전체 청산 목록"""
+        exits = []
+        for tick in ticks:
+            exits.extend(self.on_tick(*tick))
+        self.flush()
+        return exits
@@ -9,16 +9,31 @@ OPA 권한 판정 엔진
 - Layer 1: State Authority (θ 검증) ← 핵심
 - Layer 2: Temporal Authority (시간 권한)
 - Layer 3: Execution Authority (실행 환경)
+
+결정 키 (signal 블랙리스트 여부, θ, 연속손실 ≥ 2, retry 요청, retry 조건)는
+이산값이므로 시작 시 θ별 PolicySnapshot에서 결정 테이블을 컴파일하고, 응답은 공유 불변 객체를 반환한다.
+- 테이블 θ 범위 = snapshot 키 (0 ~ θ 최상위 키)
+- 범위 밖 θ는 최상위(음수는 0) 키 정책으로 호출마다 판정 (캐시 없음 → 메모리 고정)
+- 블랙리스트 응답: compile 시 블랙리스트 신호 코드 × θ 키만큼 미리 생성
+evaluate_many는 같은 테이블을 배열로 조회한다 (리플레이 / what-if 분석용).
+
+규칙 범위: policy_v74 θ 헌법 (Layer 0 = 블랙리스트, Layer 1 = θ 정책 allow,
+Layer 3 = retry 조건)은 authority_rules 4계층 (정의 신호 / 상태 인증 / 실행 환경)과
+다른 규칙이므로 OPAEngine으로 합치지 않는다.
+Layer 2 (연속손실)는 authority_rules.check_layer2_temporal_authority로 판정한다.
 """
 
 from dataclasses import dataclass
 from typing import Optional
 from enum import Enum
 
-from .policy_v74 import (
-    is_allowed, get_size, can_retry, can_trail,
-    BLACKLIST_SIGNALS, TIER1_SIGNALS
+import numpy as np
+
+from .policy_snapshot import POLICY_SNAPSHOTS, PolicySnapshot, policy_snapshot, verify_policy
+from .authority_rules import (
+    AuthorityBatch, batch_result, check_layer2_temporal_authority, CONSECUTIVE_LOSS_LIMIT,
 )
+from .signal_registry import SIGNAL_REGISTRY, FLAG_BLACKLIST, UNKNOWN_CODE
 
 
 class Authority(Enum):
@@ -35,11 +50,12 @@ class AuthorityRequest:
     impulse_count: int = 0
     recovery_time: float = 0
     consecutive_loss: int = 0
+    signal_code: Optional[int] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class AuthorityResponse:
-    """권한 응답"""
+    """권한 응답 (불변, 결정 테이블에서 공유)"""
     authority: Authority
     theta: int
     size: str
@@ -52,48 +68,82 @@ class AuthorityResponse:
 class AuthorityEngine:
     """OPA 권한 엔진"""
     
+    THETA_TABLE_SIZE = len(POLICY_SNAPSHOTS)    # θ 정책 키 수 (θ 0..최상위 키)
+    
     def __init__(self):
         self.stats = {
             "allow": 0,
             "deny": 0,
             "deny_by_layer": {0: 0, 1: 0, 2: 0, 3: 0},
         }
+        self.compile()
     
-    def evaluate(self, request: AuthorityRequest) -> AuthorityResponse:
-        """권한 평가"""
+    def compile(self):
+        """결정 테이블 컴파일 (snapshot이 헌법과 다르면 RuntimeError)"""
+        if not verify_policy():
+            raise RuntimeError("Policy snapshot does not match THETA_POLICY")
         
-        if request.signal_name in BLACKLIST_SIGNALS:
-            self.stats["deny"] += 1
-            self.stats["deny_by_layer"][0] += 1
+        self._policies = [policy_snapshot(t) for t in range(self.THETA_TABLE_SIZE)]
+        self.policy_hash = self._policies[0].policy_hash
+        self._table = [
+            self._decide("", theta, self._policies[theta], loss, is_retry, retry_ok)
+            for theta in range(self.THETA_TABLE_SIZE)
+            for loss in (0, CONSECUTIVE_LOSS_LIMIT)
+            for is_retry in (False, True)
+            for retry_ok in (False, True)
+        ]
+        # 블랙리스트 코드 → θ 키별 응답 (등록된 블랙리스트 신호 수로 고정)
+        flags = SIGNAL_REGISTRY.flag_table()
+        self._blacklisted = {
+            int(code): tuple(
+                self._decide(SIGNAL_REGISTRY.name_of(int(code)), theta, None, 0, False, False,
+                             blacklisted=True)
+                for theta in range(self.THETA_TABLE_SIZE)
+            )
+            for code in np.flatnonzero(flags & FLAG_BLACKLIST)
+        }
+        
+        # evaluate_many용 배열 (θ별 retry 규칙, 테이블 칸별 차단 계층)
+        policies = self._policies
+        self._retry_always = np.array([p.retry_always for p in policies])
+        self._retry_enabled = np.array([p.retry_always or p.retry_enabled for p in policies])
+        self._retry_impulse = np.array(
+            [-np.inf if p.retry_impulse_min is None else p.retry_impulse_min for p in policies])
+        self._retry_recovery = np.array(
+            [np.inf if p.retry_recovery_max is None else p.retry_recovery_max for p in policies])
+        self._table_layer = np.array([r.layer_failed for r in self._table], dtype=np.int8)
+    
+    @staticmethod
+    def _decide(signal_name: str, theta: int, policy: PolicySnapshot,
+                consecutive_loss: int, is_retry: bool, retry_ok: bool,
+                blacklisted: bool = False) -> AuthorityResponse:
+        """단일 판정 (테이블 컴파일 / 범위 밖 θ)"""
+        if blacklisted:
             return AuthorityResponse(
                 authority=Authority.DENY,
-                theta=request.theta,
+                theta=theta,
                 size="NONE",
                 can_retry=False,
                 can_trail=False,
-                reason=f"Blacklisted signal: {request.signal_name}",
+                reason=f"Blacklisted signal: {signal_name}",
                 layer_failed=0,
             )
         
-        if not is_allowed(request.theta):
-            self.stats["deny"] += 1
-            self.stats["deny_by_layer"][1] += 1
+        if not policy.allow:
             return AuthorityResponse(
                 authority=Authority.DENY,
-                theta=request.theta,
+                theta=theta,
                 size="NONE",
                 can_retry=False,
                 can_trail=False,
-                reason=f"θ={request.theta}: State not certified",
+                reason=f"θ={theta}: State not certified",
                 layer_failed=1,
             )
         
-        if request.consecutive_loss >= 2:
-            self.stats["deny"] += 1
-            self.stats["deny_by_layer"][2] += 1
+        if check_layer2_temporal_authority(consecutive_loss).layer_failed >= 0:
             return AuthorityResponse(
                 authority=Authority.DENY,
-                theta=request.theta,
+                theta=theta,
                 size="NONE",
                 can_retry=False,
                 can_trail=False,
@@ -101,30 +151,118 @@ class AuthorityEngine:
                 layer_failed=2,
             )
         
-        if request.is_retry:
-            if not can_retry(request.theta, request.impulse_count, request.recovery_time):
-                self.stats["deny"] += 1
-                self.stats["deny_by_layer"][3] += 1
-                return AuthorityResponse(
-                    authority=Authority.DENY,
-                    theta=request.theta,
-                    size="NONE",
-                    can_retry=False,
-                    can_trail=False,
-                    reason=f"Retry conditions not met at θ={request.theta}",
-                    layer_failed=3,
-                )
-        
-        self.stats["allow"] += 1
+        if is_retry and not retry_ok:
+            return AuthorityResponse(
+                authority=Authority.DENY,
+                theta=theta,
+                size="NONE",
+                can_retry=False,
+                can_trail=False,
+                reason=f"Retry conditions not met at θ={theta}",
+                layer_failed=3,
+            )
         
         return AuthorityResponse(
             authority=Authority.ALLOW,
-            theta=request.theta,
-            size=get_size(request.theta),
-            can_retry=can_retry(request.theta, request.impulse_count, request.recovery_time),
-            can_trail=can_trail(request.theta),
+            theta=theta,
+            size=policy.size,
+            can_retry=retry_ok,
+            can_trail=policy.trail,
         )
     
+    def _lookup(self, signal_name: str, code: int, theta: int,
+                consecutive_loss: int, is_retry: bool,
+                impulse_count: int, recovery_time: float) -> AuthorityResponse:
+        """결정 키 → 응답 (θ 키 범위 안은 공유 객체, 통계 없음)"""
+        in_table = 0 <= theta < self.THETA_TABLE_SIZE
+        
+        if SIGNAL_REGISTRY.flags[code] & FLAG_BLACKLIST:
+            responses = self._blacklisted.get(code)
+            if in_table and responses is not None:
+                return responses[theta]
+            return self._decide(signal_name, theta, None, 0, False, False, blacklisted=True)
+        
+        if in_table:
+            retry_ok = self._policies[theta].can_retry(impulse_count, recovery_time)
+            return self._table[
+                theta * 8
+                + (4 if consecutive_loss >= CONSECUTIVE_LOSS_LIMIT else 0)
+                + (2 if is_retry else 0)
+                + retry_ok
+            ]
+        
+        policy = policy_snapshot(theta)
+        retry_ok = policy.can_retry(impulse_count, recovery_time)
+        return self._decide("", theta, policy, consecutive_loss, is_retry, retry_ok)
+    
+    def evaluate(self, request: AuthorityRequest) -> AuthorityResponse:
+        """권한 평가 (테이블 조회 1회)"""
+        
+        code = request.signal_code
+        if code is None:
+            code = SIGNAL_REGISTRY.lookup(request.signal_name)
+        
+        response = self._lookup(
+            request.signal_name,
+            code,
+            request.theta,
+            request.consecutive_loss,
+            request.is_retry,
+            request.impulse_count,
+            request.recovery_time,
+        )
+        
+        layer = response.layer_failed
+        if layer < 0:
+            self.stats["allow"] += 1
+        else:
+            self.stats["deny"] += 1
+            self.stats["deny_by_layer"][layer] += 1
+        
+        return response
+    
+    def evaluate_many(self, signal_codes, theta, consecutive_loss,
+                      is_retry=None, impulse_count=None, recovery_time=None) -> AuthorityBatch:
+        """
+        컬럼 일괄 평가 (evaluate 반복과 동일한 판정 / 통계)
+        
+        signal_codes: SIGNAL_REGISTRY.lookup_many 결과 (리플레이 이름은 등록하지 않음)
+        is_retry / impulse_count / recovery_time: 없으면 AuthorityRequest 기본값
+        """
+        codes = np.asarray(signal_codes, dtype=np.intp)
+        theta = np.asarray(theta, dtype=np.int64)
+        loss = np.asarray(consecutive_loss)
+        n = len(theta)
+        retry = np.zeros(n, dtype=bool) if is_retry is None else np.asarray(is_retry, dtype=bool)
+        impulse = np.zeros(n) if impulse_count is None else np.asarray(impulse_count)
+        recovery = np.zeros(n) if recovery_time is None else np.asarray(recovery_time)
+        
+        blacklisted = (SIGNAL_REGISTRY.flag_table()[codes] & FLAG_BLACKLIST) != 0
+        in_table = (theta >= 0) & (theta < self.THETA_TABLE_SIZE)
+        
+        t = np.where(in_table, theta, 0)
+        retry_ok = self._retry_enabled[t] & (
+            self._retry_always[t]
+            | ((impulse > self._retry_impulse[t]) & (recovery < self._retry_recovery[t]))
+        )
+        index = t * 8 + (loss >= CONSECUTIVE_LOSS_LIMIT) * 4 + retry * 2 + retry_ok
+        layer_failed = self._table_layer[index]
+        layer_failed[blacklisted] = 0
+        
+        # 범위 밖 θ (드묾): 스칼라 판정
+        for i in np.flatnonzero(~in_table & ~blacklisted):
+            layer_failed[i] = self._lookup("", UNKNOWN_CODE, int(theta[i]), int(loss[i]),
+                                           bool(retry[i]), impulse[i], recovery[i]).layer_failed
+        
+        batch = batch_result(layer_failed, theta)
+        denied = sum(batch.deny_by_layer.values())
+        self.stats["allow"] += n - denied
+        self.stats["deny"] += denied
+        for layer, count in batch.deny_by_layer.items():
+            self.stats["deny_by_layer"][layer] += count
+        
+        return batch
+    
     def get_stats(self) -> dict:
         """통계 반환"""
         total = self.stats["allow"] + self.stats["deny"]
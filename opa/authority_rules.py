@@ -6,12 +6,30 @@ OPA Authority Rules - V7 Constitution Implementation
 - Layer 1: State Authority (상태 인증) ← 90% 차단
 - Layer 2: Temporal Authority (시간 권한)
 - Layer 3: Execution Authority (실행 환경)
+
+evaluate_many: 컬럼(NumPy 배열) 단위 일괄 검사 (리플레이 / what-if 분석용)
+
+이 4계층 규칙의 실행 경로는 check_layer0~3 (OPAEngine) / evaluate_many 두 개뿐이다.
+AuthorityEngine은 policy_v74 θ 헌법 엔진 (블랙리스트 / θ 정책 / 연속손실 / retry)으로
+Layer 2만 이 파일의 check_layer2_temporal_authority를 공유한다.
 """
 
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional, Dict
 
+import numpy as np
+
+from .policy_v74 import get_size, get_size_multiplier
+from .signal_registry import (
+    SIGNAL_REGISTRY, FLAG_DEFINED,
+    DEFINED_SIGNALS, TIER1_SIGNALS,
+)
+
+
+# Layer 2: 같은 존 연속 손실 한도 (이 횟수부터 권한 박탈)
+CONSECUTIVE_LOSS_LIMIT = 2
+
 
 class Authority(Enum):
     ALLOW = "ALLOW"
@@ -34,29 +52,16 @@ class AuthorityResult:
     details: Optional[str] = None
 
 
-# 정의된 신호 목록 (Layer 0에서 사용)
-DEFINED_SIGNALS = {
-    "숏-정체",
-    "숏 교집합 스팟",
-    "STB숏",
-    "STB롱", 
-    "SCALP_A",
-    "HUNT_1",
-    "RESIST_zscore",
-    "POC_LONG",
-}
-
-TIER1_SIGNALS = {
-    "숏-정체",
-    "숏 교집합 스팟",
-}
-
-
-def check_layer0_identity(signal_name: str) -> AuthorityResult:
+def check_layer0_identity(signal_name: str, signal_code: Optional[int] = None) -> AuthorityResult:
     """
     Layer 0: Identity - 신호가 정의되어 있는가?
+    
+    signal_code: webhook 경계에서 intern된 코드 (없으면 등록 없이 조회)
     """
-    if signal_name not in DEFINED_SIGNALS:
+    if signal_code is None:
+        signal_code = SIGNAL_REGISTRY.lookup(signal_name)
+    
+    if not SIGNAL_REGISTRY.flags[signal_code] & FLAG_DEFINED:
         return AuthorityResult(
             authority=Authority.DENY,
             reason=DenyReason.UNDEFINED_SIGNAL,
@@ -106,7 +111,7 @@ def check_layer2_temporal_authority(consecutive_loss_same_zone: int) -> Authorit
     
     loss_key = (state, direction, zone_id)
     """
-    if consecutive_loss_same_zone >= 2:
+    if consecutive_loss_same_zone >= CONSECUTIVE_LOSS_LIMIT:
         return AuthorityResult(
             authority=Authority.DENY,
             reason=DenyReason.CONSECUTIVE_LOSS_ZONE,
@@ -151,3 +156,76 @@ def check_layer3_execution(slippage: float = 0.0, spread: float = 0.0) -> Author
 def estimate_slippage(spread: float, min_slippage: float = 0.5) -> float:
     """보수적 슬리피지 추정"""
     return max(spread * 0.5, min_slippage)
+
+
+@dataclass
+class AuthorityBatch:
+    """
+    일괄 판정 결과 (행 = 요청)
+
+    decision: True = ALLOW
+    layer_failed: 최초 차단 계층 (-1 = 통과, int8)
+    size_multiplier: ALLOW 행은 θ 정책 배율, DENY 행은 0
+    deny_by_layer: 계층별 차단 수
+    """
+    decision: np.ndarray
+    layer_failed: np.ndarray
+    size_multiplier: np.ndarray
+    deny_by_layer: Dict[int, int]
+
+    def __len__(self) -> int:
+        return len(self.decision)
+
+    @property
+    def allow_rate(self) -> float:
+        return float(self.decision.mean()) if len(self) else 0.0
+
+    def block_rate(self, layer: int) -> float:
+        """계층별 차단 비율 (전체 요청 대비)"""
+        return self.deny_by_layer[layer] / len(self) if len(self) else 0.0
+
+
+def theta_size_multipliers(theta: np.ndarray) -> np.ndarray:
+    """θ 배열 → 정책 size 배율 (고유 θ마다 1회 조회)"""
+    values, inverse = np.unique(theta, return_inverse=True)
+    table = np.array([get_size_multiplier(get_size(int(t))) for t in values])
+    return table[inverse.reshape(-1)]
+
+
+def batch_result(layer_failed: np.ndarray, theta: np.ndarray) -> AuthorityBatch:
+    """layer_failed 배열 → AuthorityBatch (계층 수 4 고정)"""
+    decision = layer_failed < 0
+    counts = np.bincount(layer_failed[~decision], minlength=4)
+    size = np.where(decision, theta_size_multipliers(theta), 0.0)
+    return AuthorityBatch(
+        decision=decision,
+        layer_failed=layer_failed,
+        size_multiplier=size,
+        deny_by_layer={layer: int(counts[layer]) for layer in range(4)},
+    )
+
+
+def evaluate_many(signal_codes, theta, consecutive_loss, slippage, spread,
+                  state_certified=None, theta_threshold: int = 1) -> AuthorityBatch:
+    """
+    4계층 일괄 검사 (check_layer0~3 순서대로 적용한 것과 동일)
+
+    signal_codes: SIGNAL_REGISTRY.lookup_many 결과 (리플레이 이름은 등록하지 않음)
+    state_certified: 없으면 전부 인증된 것으로 보고 θ만 검사
+    """
+    codes = np.asarray(signal_codes, dtype=np.intp)
+    theta = np.asarray(theta, dtype=np.int64)
+    loss = np.asarray(consecutive_loss)
+    slippage = np.asarray(slippage, dtype=np.float64)
+    spread = np.asarray(spread, dtype=np.float64)
+
+    layer0 = (SIGNAL_REGISTRY.flag_table()[codes] & FLAG_DEFINED) == 0
+    layer1 = theta < theta_threshold
+    if state_certified is not None:
+        layer1 |= ~np.asarray(state_certified, dtype=bool)
+    layer2 = loss >= CONSECUTIVE_LOSS_LIMIT
+    layer3 = (slippage > 3.0) | (spread > 2.0)
+
+    layer_failed = np.select([layer0, layer1, layer2, layer3], [0, 1, 2, 3],
+                             default=-1).astype(np.int8)
+    return batch_result(layer_failed, theta)
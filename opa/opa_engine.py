@@ -0,0 +1,253 @@
+"""
+OPA Engine - Operational Policy Architecture
+
+V7 헌법을 실행체로 변환한 권한 통제 계층
+
+OPA는 판단하지 않는다.
+OPA는 허가/거부만 한다.
+
+계층 검사는 authority_rules.check_layer0~3 (단일 구현)을 그대로 호출한다.
+같은 규칙의 일괄 경로는 authority_rules.evaluate_many.
+AuthorityEngine (policy_v74 θ 헌법: size / retry / trail 응답, entry_gate용)은
+별도 규칙 집합이며 이 엔진의 범위 밖이다 (Layer 2 검사만 공유).
+- layer_order: short-circuit 순서 (기본 0 → 1 → 2 → 3, 판정 결과는 순서와 무관,
+  layer_failed / deny_by_layer는 먼저 실패한 계층 기준)
+- 계층별 평가 지연 시간: 고정 bucket 히스토그램 (사전 할당, 호출당 카운터 증가만)
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import Dict, Optional, List, Sequence
+from datetime import datetime
+
+from .authority_rules import (
+    Authority, DenyReason, AuthorityResult,
+    check_layer0_identity,
+    check_layer1_state_authority,
+    check_layer2_temporal_authority,
+    check_layer3_execution,
+)
+from .mode_switch import ModeController, OperationMode, ModeState
+from .signal_registry import SIGNAL_REGISTRY, FLAG_TIER1
+
+
+LAYERS = (0, 1, 2, 3)
+DEFAULT_LAYER_ORDER = LAYERS
+
+# 지연 시간 bucket 상한 (ns): 250ns ~ 1.024ms, 마지막 칸 = 초과
+LATENCY_BUCKETS_NS = tuple(250 * 2 ** i for i in range(13))
+
+_TIER1_ONLY_DENY = AuthorityResult(
+    authority=Authority.DENY,
+    reason=DenyReason.UNDEFINED_SIGNAL,
+    layer_failed=0,
+    details="Conservative mode: Tier1 only"
+)
+
+
+@dataclass
+class OPARequest:
+    """OPA 권한 요청"""
+    signal_name: str
+    state_certified: bool
+    theta: int
+    consecutive_loss_same_zone: int = 0
+    slippage: float = 0.0
+    spread: float = 0.0
+    timestamp: Optional[datetime] = None
+    signal_code: Optional[int] = None
+
+
+@dataclass
+class OPAResponse:
+    """OPA 권한 응답"""
+    authority: Authority
+    mode: OperationMode
+    reason: DenyReason
+    layer_failed: int
+    theta_threshold_used: int
+    is_tier1: bool
+    details: Optional[str] = None
+
+
+class OPAEngine:
+    """
+    OPA 엔진 - 4계층 권한 검사 실행
+
+    Layer 0: Identity (누가 제안했는가)
+    Layer 1: State Authority (상태가 인증됐는가) ← 핵심
+    Layer 2: Temporal Authority (시간 권한)
+    Layer 3: Execution Authority (실행 환경)
+    """
+
+    def __init__(self, mode: OperationMode = OperationMode.NORMAL,
+                 layer_order: Sequence[int] = DEFAULT_LAYER_ORDER,
+                 record_latency: bool = True):
+        self.mode_controller = ModeController()
+        if mode == OperationMode.CONSERVATIVE:
+            self.mode_controller.force_conservative()
+
+        self.record_latency = record_latency
+        self._latency: Dict[int, List[int]] = {
+            layer: [0] * (len(LATENCY_BUCKETS_NS) + 1) for layer in LAYERS
+        }
+        self._latency_total: Dict[int, int] = {layer: 0 for layer in LAYERS}
+
+        self.allow_count = 0
+        self.deny_count = 0
+        self.deny_by_layer: Dict[int, int] = {0: 0, 1: 0, 2: 0, 3: 0}
+        self.set_layer_order(layer_order)
+
+    def set_layer_order(self, layer_order: Sequence[int]):
+        """short-circuit 순서 설정 (0~3 순열)"""
+        order = tuple(layer_order)
+        if sorted(order) != list(LAYERS):
+            raise ValueError(f"layer_order must be a permutation of {LAYERS}: {order}")
+
+        checks = {
+            0: self._check_identity,
+            1: self._check_state,
+            2: self._check_temporal,
+            3: self._check_execution,
+        }
+        self.layer_order = order
+        self._pipeline = tuple((layer, checks[layer], self._latency[layer]) for layer in order)
+
+    @staticmethod
+    def _check_identity(request: OPARequest, mode_state: ModeState, is_tier1: bool,
+                        code: int) -> AuthorityResult:
+        # CONSERVATIVE 모드에서 Tier1만 허용
+        if mode_state.tier1_only and not is_tier1:
+            return _TIER1_ONLY_DENY
+        return check_layer0_identity(request.signal_name, code)
+
+    @staticmethod
+    def _check_state(request: OPARequest, mode_state: ModeState, is_tier1: bool,
+                     code: int) -> AuthorityResult:
+        return check_layer1_state_authority(
+            request.state_certified,
+            request.theta,
+            mode_state.theta_threshold
+        )
+
+    @staticmethod
+    def _check_temporal(request: OPARequest, mode_state: ModeState, is_tier1: bool,
+                        code: int) -> AuthorityResult:
+        return check_layer2_temporal_authority(request.consecutive_loss_same_zone)
+
+    @staticmethod
+    def _check_execution(request: OPARequest, mode_state: ModeState, is_tier1: bool,
+                         code: int) -> AuthorityResult:
+        return check_layer3_execution(request.slippage, request.spread)
+
+    def check_authority(self, request: OPARequest) -> OPAResponse:
+        """
+        4계층 권한 검사 실행
+
+        순서: layer_order (기본 Layer 0 → 1 → 2 → 3)
+        어느 계층에서든 DENY면 즉시 반환
+        signal_code 없으면 등록 없이 조회 (미등록 이름 = UNKNOWN_CODE → Layer 0 DENY)
+        """
+        mode_state = self.mode_controller.get_mode_state()
+        code = request.signal_code
+        if code is None:
+            code = SIGNAL_REGISTRY.lookup(request.signal_name)
+        is_tier1 = bool(SIGNAL_REGISTRY.flags[code] & FLAG_TIER1)
+        timed = self.record_latency
+
+        for layer, check, histogram in self._pipeline:
+            if timed:
+                start = perf_counter_ns()
+                result = check(request, mode_state, is_tier1, code)
+                elapsed = perf_counter_ns() - start
+                histogram[bisect_left(LATENCY_BUCKETS_NS, elapsed)] += 1
+                self._latency_total[layer] += elapsed
+            else:
+                result = check(request, mode_state, is_tier1, code)
+
+            if result.authority == Authority.DENY:
+                self.deny_count += 1
+                self.deny_by_layer[layer] += 1
+                return OPAResponse(
+                    authority=Authority.DENY,
+                    mode=mode_state.mode,
+                    reason=result.reason,
+                    layer_failed=layer,
+                    theta_threshold_used=mode_state.theta_threshold,
+                    is_tier1=is_tier1,
+                    details=result.details
+                )
+
+        # 모든 계층 통과 → ALLOW
+        self.allow_count += 1
+        return OPAResponse(
+            authority=Authority.ALLOW,
+            mode=mode_state.mode,
+            reason=DenyReason.NONE,
+            layer_failed=-1,
+            theta_threshold_used=mode_state.theta_threshold,
+            is_tier1=is_tier1
+        )
+
+    def get_latency_stats(self) -> Dict[int, Dict]:
+        """
+        계층별 지연 시간 요약 (ns)
+
+        p50 / p99: 해당 분위가 속한 bucket 상한 (초과 칸은 inf)
+        """
+        labels = [f"<={bound}" for bound in LATENCY_BUCKETS_NS] + [f">{LATENCY_BUCKETS_NS[-1]}"]
+        stats = {}
+        for layer in LAYERS:
+            counts = self._latency[layer]
+            n = sum(counts)
+            stats[layer] = {
+                "count": n,
+                "mean": self._latency_total[layer] / n if n > 0 else 0,
+                "p50": bucket_quantile(counts, n, 0.50),
+                "p99": bucket_quantile(counts, n, 0.99),
+                "buckets": dict(zip(labels, counts)),
+            }
+        return stats
+
+    def get_stats(self) -> Dict:
+        """통계 반환"""
+        total = self.allow_count + self.deny_count
+        return {
+            "total_requests": total,
+            "allowed": self.allow_count,
+            "denied": self.deny_count,
+            "allow_rate": self.allow_count / total if total > 0 else 0,
+            "deny_by_layer": dict(self.deny_by_layer),
+            "mode": self.mode_controller.current_mode.value,
+            "layer_order": list(self.layer_order),
+            "latency_ns": self.get_latency_stats(),
+        }
+
+    def reset_stats(self):
+        """통계 리셋 (히스토그램은 제자리에서 비움)"""
+        self.allow_count = 0
+        self.deny_count = 0
+        self.deny_by_layer = {0: 0, 1: 0, 2: 0, 3: 0}
+        for layer in LAYERS:
+            counts = self._latency[layer]
+            counts[:] = [0] * len(counts)
+            self._latency_total[layer] = 0
+
+
+def bucket_quantile(counts: List[int], n: int, q: float,
+                    bounds: Sequence[int] = LATENCY_BUCKETS_NS) -> float:
+    """
+    고정 bucket 히스토그램 분위수 (해당 분위가 속한 bucket 상한)
+
+    counts: len(bounds) + 1칸 (마지막 칸 = 초과 → inf), n: 전체 건수
+    """
+    if n == 0:
+        return 0
+    rank = q * n
+    seen = 0
+    for i, count in enumerate(counts):
+        seen += count
+        if seen >= rank:
+            return bounds[i] if i < len(bounds) else float("inf")
+    return float("inf")
@@ -0,0 +1,120 @@
+"""
+Policy Snapshot
+===============
+
+policy_v74.THETA_POLICY (헌법) → θ별 불변 snapshot
+
+import 시 1회 컴파일:
+- allow / size / size 배율 / trailing / exit / TP / SL 해석 완료
+- retry 조건 튜플 ("<", 4) 파싱 완료 → can_retry는 비교 2회
+- policy_hash: THETA_POLICY + SIZE_MULTIPLIER의 정규화 JSON sha256
+
+헌법 파일은 읽기만 한다. verify_policy()는 현재 헌법 dict를 다시 해시해서
+snapshot이 헌법과 일치하는지 확인한다 (불일치 = 헌법이 런타임에 변경됨).
+
+의미는 policy_v74의 get_policy / is_allowed / get_size / can_retry / can_trail과 동일.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from .policy_v74 import THETA_POLICY, SIZE_MULTIPLIER
+
+
+def policy_hash(theta_policy: dict = None, size_multiplier: dict = None) -> str:
+    """헌법 dict → sha256 (키 정렬 JSON, 튜플은 리스트로 직렬화)"""
+    payload = {
+        "theta_policy": THETA_POLICY if theta_policy is None else theta_policy,
+        "size_multiplier": SIZE_MULTIPLIER if size_multiplier is None else size_multiplier,
+    }
+    text = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class PolicySnapshot:
+    """θ 정책 1개 (해석 완료, 불변)"""
+    theta: int                              # 정책 키 (θ ≥ 3 → 3)
+    allow: bool
+    size: str
+    size_multiplier: float
+    retry_always: bool
+    retry_enabled: bool
+    retry_impulse_min: Optional[float]      # impulse_count > 값
+    retry_recovery_max: Optional[float]     # recovery_time < 값
+    trail: bool
+    exit: Optional[str]
+    tp: float
+    sl: float
+    policy_hash: str
+
+    def can_retry(self, impulse_count: int = 0, recovery_time: float = 0) -> bool:
+        """Retry 허용 여부 (policy_v74.can_retry와 동일)"""
+        if self.retry_always:
+            return True
+        if not self.retry_enabled:
+            return False
+        return ((self.retry_impulse_min is None or impulse_count > self.retry_impulse_min)
+                and (self.retry_recovery_max is None or recovery_time < self.retry_recovery_max))
+
+
+def _condition(conditions: dict, name: str, op: str):
+    """조건 튜플 파싱 (다른 연산자 / 조건 없음 → None = 통과)"""
+    if name not in conditions:
+        return None
+    cond_op, value = conditions[name]
+    return value if cond_op == op else None
+
+
+def _compile(theta: int, policy: dict, digest: str) -> PolicySnapshot:
+    size = policy.get("size", "SMALL")
+    if isinstance(size, list):
+        size = size[0]
+
+    retry = policy.get("retry", False)
+    enabled = isinstance(retry, dict) and bool(retry.get("enabled"))
+    conditions = retry.get("conditions", {}) if enabled else {}
+
+    return PolicySnapshot(
+        theta=theta,
+        allow=policy.get("allow", False),
+        size=size,
+        size_multiplier=SIZE_MULTIPLIER.get(size, 1.0),
+        retry_always=retry is True,
+        retry_enabled=enabled,
+        retry_impulse_min=_condition(conditions, "impulse_count", ">"),
+        retry_recovery_max=_condition(conditions, "recovery_time", "<"),
+        trail=policy.get("trailing", False) != False,
+        exit=policy.get("exit"),
+        tp=policy.get("tp", 20),
+        sl=policy.get("sl", 12),
+        policy_hash=digest,
+    )
+
+
+def compile_snapshots() -> Tuple[PolicySnapshot, ...]:
+    """THETA_POLICY → θ 키 순서 snapshot 튜플 (index = 정책 키)"""
+    digest = policy_hash()
+    return tuple(_compile(theta, THETA_POLICY.get(theta, THETA_POLICY[0]), digest)
+                 for theta in range(max(THETA_POLICY) + 1))
+
+
+POLICY_SNAPSHOTS = compile_snapshots()
+POLICY_HASH = POLICY_SNAPSHOTS[0].policy_hash
+_TOP = len(POLICY_SNAPSHOTS) - 1
+
+
+def policy_snapshot(theta: int) -> PolicySnapshot:
+    """θ → snapshot (get_policy와 같은 키 해석: θ ≥ 3 → 3, 음수 → 0)"""
+    if theta >= _TOP:
+        return POLICY_SNAPSHOTS[_TOP]
+    if theta < 0:
+        return POLICY_SNAPSHOTS[0]
+    return POLICY_SNAPSHOTS[theta]
+
+
+def verify_policy() -> bool:
+    """snapshot이 현재 헌법 dict와 일치하는가"""
+    return policy_hash() == POLICY_HASH
@@ -0,0 +1,176 @@
+"""
+Signal Registry
+===============
+
+신호 이름 → 정수 코드 intern + 코드별 속성 bitmask
+
+webhook 경계에서 이름을 한 번만 코드로 바꾸고,
+이후 모든 계층은 문자열 비교 대신 bit test를 사용한다.
+
+속성 출처 (단일 출처):
+- FLAG_DEFINED / FLAG_TIER1: Layer 0 정의 신호 (이 파일)
+- FLAG_POLICY_TIER1 / FLAG_BLACKLIST: policy_v74 (헌법, 읽기만)
+- FLAG_STB / FLAG_LONG / FLAG_SHORT: core.signal_constants (STB 신호 표 / 방향 코드)
+
+core 중 import하는 것은 의존성 없는 core.signal_constants뿐이다
+(core.stb_sensor / core.v7_energy_engine도 같은 모듈에서 읽는다).
+
+등록 규칙: intern / encode만 새 이름을 등록한다 (정의 신호 목록 등 신뢰된 이름용).
+webhook / 리플레이처럼 외부에서 온 이름은 lookup / lookup_many / signal_code
+(등록 없음, 미등록 이름 = UNKNOWN_CODE)로 바꾼다.
+
+코드 0 = 빈 이름 / 미등록 이름 조회 / 등록 한도 초과 (속성 없음)
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from core.signal_constants import (
+    STB_SIGNALS, SIGNAL_LONG, SIGNAL_SHORT, stb_signal_direction as stb_direction,
+)
+from .policy_v74 import TIER1_SIGNALS as POLICY_TIER1_SIGNALS, BLACKLIST_SIGNALS
+
+
+# 정의된 신호 목록 (Layer 0에서 사용)
+DEFINED_SIGNALS = {
+    "숏-정체",
+    "숏 교집합 스팟",
+    "STB숏",
+    "STB롱",
+    "SCALP_A",
+    "HUNT_1",
+    "RESIST_zscore",
+    "POC_LONG",
+}
+
+TIER1_SIGNALS = {
+    "숏-정체",
+    "숏 교집합 스팟",
+}
+
+# STB 신호 방향 / 방향 코드 (core.signal_constants에서 파생)
+STB_SIGNAL_DIRECTIONS = {name: config["direction"] for name, config in STB_SIGNALS.items()}
+
+DIRECTION_LONG = SIGNAL_LONG
+DIRECTION_SHORT = SIGNAL_SHORT
+
+
+FLAG_DEFINED = 1 << 0
+FLAG_TIER1 = 1 << 1
+FLAG_POLICY_TIER1 = 1 << 2
+FLAG_BLACKLIST = 1 << 3
+FLAG_STB = 1 << 4
+FLAG_LONG = 1 << 5
+FLAG_SHORT = 1 << 6
+
+UNKNOWN_CODE = 0
+
+
+def signal_flags(name: str) -> int:
+    """신호 이름 → 속성 bitmask (intern 시 1회 계산)"""
+    flags = 0
+    if name in DEFINED_SIGNALS:
+        flags |= FLAG_DEFINED
+    if name in TIER1_SIGNALS:
+        flags |= FLAG_TIER1
+    if name in POLICY_TIER1_SIGNALS:
+        flags |= FLAG_POLICY_TIER1
+    if name in BLACKLIST_SIGNALS:
+        flags |= FLAG_BLACKLIST
+    if name in STB_SIGNAL_DIRECTIONS or name.startswith("STB"):
+        flags |= FLAG_STB
+
+    direction = stb_direction(name)
+    if direction == "LONG":
+        flags |= FLAG_LONG
+    elif direction == "SHORT":
+        flags |= FLAG_SHORT
+    return flags
+
+
+class SignalRegistry:
+    """
+    신호 intern 테이블
+
+    코드는 등록 순서대로 증가하며 프로세스 내에서 고정된다.
+    intern: 처음 보는 이름도 등록 (MAX_SIGNALS 이후는 UNKNOWN_CODE)
+    lookup: 등록하지 않는 조회 (게이트 경로용, 미등록 이름 = UNKNOWN_CODE)
+    """
+
+    MAX_SIGNALS = 4096
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.codes: Dict[str, int] = {"": UNKNOWN_CODE}
+        self.names: List[str] = [""]
+        self.flags: List[int] = [0]
+        self._table: Optional[np.ndarray] = None
+        self._directions: Optional[np.ndarray] = None
+        for name in names:
+            self.intern(name)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def intern(self, name: str) -> int:
+        """이름 → 코드 (없으면 등록)"""
+        code = self.codes.get(name)
+        if code is not None:
+            return code
+        if len(self.names) >= self.MAX_SIGNALS:
+            return UNKNOWN_CODE
+
+        code = len(self.names)
+        self.codes[name] = code
+        self.names.append(name)
+        self.flags.append(signal_flags(name))
+        self._table = None
+        self._directions = None
+        return code
+
+    def lookup(self, name: str) -> int:
+        """이름 → 코드 (없으면 UNKNOWN_CODE, 테이블 변경 없음)"""
+        return self.codes.get(name, UNKNOWN_CODE)
+
+    def encode(self, names: Iterable[str]) -> np.ndarray:
+        """이름 목록 → 코드 배열 (int32, 새 이름 등록)"""
+        return np.fromiter((self.intern(n) for n in names), dtype=np.int32)
+
+    def lookup_many(self, names: Iterable[str]) -> np.ndarray:
+        """이름 목록 → 코드 배열 (int32, 등록 없음 → 리플레이 / 외부 입력용)"""
+        codes = self.codes
+        return np.fromiter((codes.get(n, UNKNOWN_CODE) for n in names), dtype=np.int32)
+
+    def has(self, code: int, flag: int) -> bool:
+        return bool(self.flags[code] & flag)
+
+    def name_of(self, code: int) -> str:
+        return self.names[code]
+
+    def flag_table(self) -> np.ndarray:
+        """코드 → bitmask 배열 (bulk 조회용, intern 시 무효화)"""
+        if self._table is None:
+            self._table = np.asarray(self.flags, dtype=np.int32)
+        return self._table
+
+    def direction_codes(self, codes) -> np.ndarray:
+        """코드 배열 → 방향 코드 배열 (LONG=1, SHORT=-1, 없음=0, int8)"""
+        if self._directions is None:
+            table = self.flag_table()
+            self._directions = np.select(
+                [(table & FLAG_LONG) != 0, (table & FLAG_SHORT) != 0],
+                [DIRECTION_LONG, DIRECTION_SHORT],
+                default=0,
+            ).astype(np.int8)
+        return self._directions[np.asarray(codes, dtype=np.intp)]
+
+
+SIGNAL_REGISTRY = SignalRegistry(sorted(
+    DEFINED_SIGNALS | TIER1_SIGNALS | set(POLICY_TIER1_SIGNALS)
+    | set(BLACKLIST_SIGNALS) | set(STB_SIGNAL_DIRECTIONS)
+))
+
+
+def signal_code(name: str) -> int:
+    """webhook 경계: 신호 이름 → 코드 (등록 없음, 미등록 이름 = UNKNOWN_CODE)"""
+    return SIGNAL_REGISTRY.lookup(name)
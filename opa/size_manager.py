@@ -11,7 +11,10 @@ Size 정의:
 """
 
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .policy_snapshot import PolicySnapshot
 
 
 SIZE_MULTIPLIER = {
@@ -33,16 +36,23 @@ class AccountConfig:
             self.theta_size_override = {}
 
 
-def get_position_size(theta: int, account: AccountConfig = None) -> float:
-    """θ에 따른 포지션 크기 반환"""
-    from .policy_v74 import get_size, get_size_multiplier
+def get_position_size(theta: int, account: AccountConfig = None,
+                      policy: "PolicySnapshot" = None) -> float:
+    """
+    θ에 따른 포지션 크기 반환
     
-    size_name = get_size(theta)
+    policy: 요청에서 이미 조회한 snapshot (없으면 θ로 조회)
+    """
+    from .policy_snapshot import policy_snapshot
+    from .policy_v74 import get_size_multiplier
     
-    if account and theta in account.theta_size_override:
-        size_name = account.theta_size_override[theta]
+    if policy is None:
+        policy = policy_snapshot(theta)
     
-    multiplier = get_size_multiplier(size_name)
+    if account and theta in account.theta_size_override:
+        multiplier = get_size_multiplier(account.theta_size_override[theta])
+    else:
+        multiplier = policy.size_multiplier
     
     base = account.base_size if account else 1.0
     max_size = account.max_size if account else 4.0
@@ -0,0 +1,330 @@
+"""
+OPA Webhook Gateway - asyncio HTTP 게이트웨이
+
+파이프라인:
+Webhook (HTTP POST)
+ → 🛡️ opa_gate()                 # main_integration (기존 판정 그대로)
+ → ALLOW → OutboundDispatcher     # 비동기 발송 (Telegram 등)
+ → DENY  → 완전 침묵
+
+동시성 규칙:
+- 같은 zone (state, direction, zone_id) 요청은 zone lock으로 직렬화
+  → 판정 / 발송 대기열 투입 / 결과 기록 순서 보존
+- 다른 zone은 서로 기다리지 않음
+- 발송은 worker가 처리 → 게이트 지연에 외부 I/O가 섞이지 않음
+- 발송 실패 ≠ OPA 실패 (live_integration과 동일, 실패는 통계에만 기록)
+
+HTTP (표준 라이브러리 asyncio, 요청당 연결 1개):
+- POST /webhook  {"signal_type", "direction", "current_price", "theta"?, "state"?, "spread"?}
+- POST /result   {"direction", "current_price", "is_win", "state"?}
+- GET  /status
+- 잘못된 요청 → 400, 게이트 / 기록 함수 예외 → 500 (어느 쪽이든 연결 종료)
+- 헤더 / 본문 읽기는 각각 read_timeout 안에 끝나야 함 → 초과 시 408 후 연결 종료
+  (idle / slow-loris 연결이 task를 붙잡지 않음)
+
+지연 시간 (고정 bucket 히스토그램, get_stats):
+- latency_ns: webhook 1건 end-to-end (zone lock 대기 + opa_gate + 발송 대기열 투입)
+- lock_wait_ns: 그중 zone lock 대기
+- zone 계산은 opa_gate (live_integration)와 같은 calculate_zone_id 기본 zone 크기
+"""
+
+import asyncio
+import json
+from bisect import bisect_left
+from contextlib import asynccontextmanager
+from time import perf_counter_ns
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .main_integration import opa_gate, opa_record_result
+from .opa_engine import bucket_quantile
+from .zone_loss_counter import calculate_zone_id
+
+
+MAX_BODY_BYTES = 64 * 1024
+
+# 게이트웨이 지연 bucket 상한 (ns): 1µs ~ 1.05s, 마지막 칸 = 초과 (lock 대기 / backpressure 포함)
+GATEWAY_BUCKETS_NS = tuple(1000 * 2 ** i for i in range(21))
+
+_STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 408: "Request Timeout",
+                413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class OutboundDispatcher:
+    """
+    ALLOW 신호 비동기 발송기
+
+    send: async 함수 (payload dict → None), 예외는 실패로 집계
+    대기열이 가득 차면 submit이 대기한다 (backpressure, 유실 없음)
+    """
+
+    def __init__(self, send: Callable[[Dict[str, Any]], Awaitable[None]],
+                 workers: int = 4, maxsize: int = 1024):
+        self.send = send
+        self.workers = workers
+        self.queue: Optional[asyncio.Queue] = None
+        self.maxsize = maxsize
+        self._tasks: List[asyncio.Task] = []
+        self.sent = 0
+        self.failed = 0
+
+    async def start(self):
+        self.queue = asyncio.Queue(maxsize=self.maxsize)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def submit(self, payload: Dict[str, Any]):
+        await self.queue.put(payload)
+
+    async def _worker(self):
+        while True:
+            payload = await self.queue.get()
+            try:
+                await self.send(payload)
+                self.sent += 1
+            except Exception:
+                self.failed += 1
+            finally:
+                self.queue.task_done()
+
+    async def stop(self):
+        """대기열 소진 후 worker 종료"""
+        if self.queue is not None:
+            await self.queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "sent": self.sent,
+            "failed": self.failed,
+            "pending": self.queue.qsize() if self.queue is not None else 0,
+        }
+
+
+class WebhookGateway:
+    """
+    asyncio webhook 게이트웨이
+
+    gate / record_result: main_integration 함수 (기본값), 같은 시그니처면 교체 가능
+    - 이벤트 루프에서 zone lock을 잡은 채 동기 호출된다 → non-blocking이어야 한다
+      (블로킹 I/O 금지, opa_gate는 메모리 내 판정만 수행)
+    read_timeout: 헤더 / 본문 읽기 제한 시간 (초)
+    """
+
+    READ_TIMEOUT = 10.0
+
+    def __init__(self, dispatcher: OutboundDispatcher,
+                 gate: Callable[..., Tuple[bool, str]] = opa_gate,
+                 record_result: Callable[..., None] = opa_record_result,
+                 read_timeout: float = READ_TIMEOUT):
+        self.dispatcher = dispatcher
+        self.gate = gate
+        self.record_result = record_result
+        self.read_timeout = read_timeout
+        self._zones: Dict[Tuple[str, str, str], list] = {}   # zone → [Lock, 사용 중 수]
+        self._server: Optional[asyncio.AbstractServer] = None
+
+        self._latency = [0] * (len(GATEWAY_BUCKETS_NS) + 1)
+        self._latency_total = 0
+        self._lock_wait = [0] * (len(GATEWAY_BUCKETS_NS) + 1)
+        self._lock_wait_total = 0
+        self.allowed = 0
+        self.denied = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.errors = 0
+
+    # ------------------------------------------
+    # 판정 (HTTP 없이도 호출 가능)
+    # ------------------------------------------
+
+    def zone_key(self, payload: Dict[str, Any]) -> Tuple[str, str, str]:
+        """payload → (state, direction, zone_id) (live_integration과 같은 zone 계산)"""
+        return (
+            payload.get("state", "UNKNOWN"),
+            payload["direction"],
+            calculate_zone_id(float(payload["current_price"])),
+        )
+
+    @asynccontextmanager
+    async def _zone(self, key: Tuple[str, str, str]):
+        """zone lock (대기자가 없으면 제거 → zone 수만큼 lock이 쌓이지 않음)"""
+        entry = self._zones.get(key)
+        if entry is None:
+            entry = self._zones[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._zones[key]
+
+    async def handle_webhook(self, payload: Dict[str, Any]) -> Tuple[bool, str]:
+        """webhook 1건: zone 직렬화 → opa_gate → ALLOW면 발송 대기열"""
+        key = self.zone_key(payload)
+        start = perf_counter_ns()
+        async with self._zone(key):
+            waited = perf_counter_ns() - start
+            self._lock_wait[bisect_left(GATEWAY_BUCKETS_NS, waited)] += 1
+            self._lock_wait_total += waited
+
+            allowed, reason = self.gate(
+                signal_type=payload["signal_type"],
+                direction=payload["direction"],
+                current_price=float(payload["current_price"]),
+                theta=int(payload.get("theta", 1)),
+                state=payload.get("state", "UNKNOWN"),
+                spread=float(payload.get("spread", 1.0)),
+            )
+            if allowed:
+                self.allowed += 1
+                await self.dispatcher.submit(payload)
+            else:
+                self.denied += 1
+
+        elapsed = perf_counter_ns() - start
+        self._latency[bisect_left(GATEWAY_BUCKETS_NS, elapsed)] += 1
+        self._latency_total += elapsed
+        return allowed, reason
+
+    async def handle_result(self, payload: Dict[str, Any]):
+        """거래 결과 1건 (같은 zone 판정과 직렬화)"""
+        async with self._zone(self.zone_key(payload)):
+            self.record_result(
+                direction=payload["direction"],
+                current_price=float(payload["current_price"]),
+                is_win=bool(payload["is_win"]),
+                state=payload.get("state", "UNKNOWN"),
+            )
+
+    # ------------------------------------------
+    # HTTP
+    # ------------------------------------------
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """서버 시작 → 실제 포트 (port=0이면 임의 포트)"""
+        await self.dispatcher.start()
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        """새 연결 중지 → 발송 대기열 소진"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.dispatcher.stop()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter):
+        try:
+            status, body = await self._route(reader)
+        except (ValueError, KeyError, TypeError) as e:
+            self.rejected += 1
+            status, body = 400, {"error": str(e)}
+        except asyncio.IncompleteReadError:
+            writer.close()
+            return
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            status, body = 408, {"error": "Request Timeout"}
+        except Exception:
+            # 게이트 / 기록 함수 오류: 500 응답 후 연결 종료 (서버는 계속 동작)
+            self.errors += 1
+            status, body = 500, {"error": "Internal Server Error"}
+
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {_STATUS_TEXT.get(status, '')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: close\r\n\r\n".encode("latin-1") + data
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _read_head(self, reader: asyncio.StreamReader) -> Tuple[str, str, int]:
+        """요청 줄 + 헤더 → (method, path, Content-Length)"""
+        request_line = (await reader.readline()).decode("latin-1").split()
+        if len(request_line) < 2:
+            raise ValueError("Malformed request line")
+
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value.strip())
+        return request_line[0], request_line[1], length
+
+    async def _route(self, reader: asyncio.StreamReader) -> Tuple[int, Dict[str, Any]]:
+        method, path, length = await asyncio.wait_for(self._read_head(reader), self.read_timeout)
+
+        if length > MAX_BODY_BYTES:
+            self.rejected += 1
+            return 413, {"error": "Payload too large"}
+
+        if method == "GET" and path == "/status":
+            return 200, self.get_stats()
+
+        if method != "POST" or path not in ("/webhook", "/result"):
+            return 404, {"error": f"No route: {method} {path}"}
+
+        raw = await asyncio.wait_for(reader.readexactly(length), self.read_timeout) if length else b""
+        payload = json.loads(raw) if raw else {}
+        if not isinstance(payload, dict):
+            raise ValueError("Payload must be a JSON object")
+
+        if path == "/webhook":
+            allowed, reason = await self.handle_webhook(payload)
+            return 200, {"allowed": allowed, "reason": reason}
+
+        await self.handle_result(payload)
+        return 200, {"recorded": True}
+
+    # ------------------------------------------
+    # 통계
+    # ------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """게이트웨이 통계 (지연 ns: p50 / p99는 bucket 상한)"""
+        return {
+            "allowed": self.allowed,
+            "denied": self.denied,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "active_zones": len(self._zones),
+            "latency_ns": _latency_summary(self._latency, self._latency_total),
+            "lock_wait_ns": _latency_summary(self._lock_wait, self._lock_wait_total),
+            "dispatcher": self.dispatcher.get_stats(),
+        }
+
+
+def _latency_summary(counts: List[int], total: int) -> Dict[str, float]:
+    n = sum(counts)
+    return {
+        "count": n,
+        "mean": total / n if n > 0 else 0,
+        "p50": bucket_quantile(counts, n, 0.50, GATEWAY_BUCKETS_NS),
+        "p99": bucket_quantile(counts, n, 0.99, GATEWAY_BUCKETS_NS),
+    }
+
+
+async def serve(send: Callable[[Dict[str, Any]], Awaitable[None]],
+                host: str = "0.0.0.0", port: int = 8080, workers: int = 4):
+    """게이트웨이 실행 (종료될 때까지 대기)"""
+    gateway = WebhookGateway(OutboundDispatcher(send, workers=workers))
+    port = await gateway.start(host, port)
+    print(f"🛡️ OPA webhook gateway: {host}:{port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await gateway.stop()